@@ -0,0 +1,196 @@
+import argparse
+import glob
+import gzip
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+from review_data import write_json_atomic
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Size report for everything the data pipeline writes. Each artifact is
+# measured raw, gzipped and brotli-compressed (when the brotli module is
+# installed), compared with the previous run and checked against the byte
+# budgets in artifact_budgets.json, so payload regressions fail here instead
+# of showing up later in the bundle.
+#
+#   python artifact_sizes.py                  # report, fail on budget overrun, else save
+#   python artifact_sizes.py --no-save        # report without moving the baseline
+#
+# A run over budget never becomes the baseline, so the growth keeps showing
+# in the comparison until it is fixed.
+#
+# Budgets look like {"<artifact>": {"raw": 750000, "gzip": 120000, "brotli": 90000}};
+# any of the three limits can be left out.
+
+BUDGETS_PATH = 'artifact_budgets.json'
+REPORT_PATH = 'artifact_sizes.json'
+SIZES = ['raw', 'gzip', 'brotli']
+
+# name -> glob, relative to the repo root. Directories of per-slug files are
+# reported as one artifact with their summed size.
+ARTIFACTS = {
+    'products_extracted': 'products_extracted.json',
+    'product_reviews_ts': 'user-panel/src/utils/product_reviews.ts',
+    'product_reviews_json': 'product_reviews.json',
+    'product_reviews_js': 'product_reviews.js',
+    'review_stats_snapshot': 'user-panel/public/data/review-stats.json',
+    'search_index': 'user-panel/public/data/search-index.json',
+    'related_products': 'user-panel/public/data/related-products.json',
+    'combo_graph': 'user-panel/public/data/combo-graph.json',
+    'facet_index': 'user-panel/public/data/facet-index.json',
+    'product_feeds': 'user-panel/public/feeds/*.gz',
+    'review_locale_shards': 'user-panel/public/data/reviews/*.json',
+    'catalog_locale_shards': 'user-panel/public/data/catalog-reviews/*.json',
+    'review_jsonld': 'user-panel/public/seo/reviews/*',
+    'review_fragments': 'user-panel/public/prerender/reviews/*.html',
+    'review_highlights': 'user-panel/public/data/review-highlights.json',
+    'review_rollups': 'admin-panel/public/data/review-rollups/*.json',
+    'review_insights': 'admin-panel/public/data/review-insights.json',
+    'catalog_delta': 'catalog_delta.json',
+}
+
+# Source trees whose bundles pick up anything imported from src/
+BUNDLE_SOURCES = ['user-panel/src', 'admin-panel/src']
+
+
+def compressed_sizes(data):
+    sizes = {"raw": len(data), "gzip": len(gzip.compress(data, compresslevel=9, mtime=0))}
+    sizes["brotli"] = len(brotli.compress(data, quality=11)) if brotli else None
+    return sizes
+
+
+def measure(pattern):
+    """Summed sizes over every file matching `pattern`, or None when nothing matches"""
+    paths = sorted(p for p in glob.glob(pattern) if os.path.isfile(p))
+    if not paths:
+        return None
+    total = {"files": len(paths), "raw": 0, "gzip": 0, "brotli": 0 if brotli else None}
+    for path in paths:
+        with open(path, 'rb') as f:
+            sizes = compressed_sizes(f.read())
+        for key in SIZES:
+            if total[key] is not None:
+                total[key] += sizes[key]
+    return total
+
+
+def find_importers(pattern):
+    """Modules in the app bundles that import a src/ artifact"""
+    if '*' in pattern or '/src/' not in pattern:
+        return []
+    module = os.path.splitext(os.path.basename(pattern))[0]
+    import_re = re.compile(r"""from\s+['"][^'"]*/%s(\.[jt]sx?)?['"]""" % re.escape(module))
+    importers = []
+    for root in BUNDLE_SOURCES:
+        for path in glob.glob(os.path.join(root, '**', '*.[jt]s*'), recursive=True):
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                if import_re.search(f.read()):
+                    importers.append(path)
+    return sorted(importers)
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_budgets(report, budgets):
+    """Human-readable messages for every exceeded budget"""
+    failures = []
+    for name, limits in budgets.items():
+        entry = report.get(name)
+        if entry is None:
+            continue
+        for key, limit in limits.items():
+            size = entry.get(key)
+            if size is None:
+                print(f"⚠️  {name}: no {key} size measured (is the brotli module installed?), budget not checked")
+            elif size > limit:
+                failures.append(
+                    f"{name} ({ARTIFACTS[name]}) is {format_bytes(size)} {key}, "
+                    f"over its budget of {format_bytes(limit)} by {format_bytes(size - limit)}"
+                )
+    return failures
+
+
+def format_bytes(size):
+    if size is None:
+        return '-'
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f} MB"
+    if size >= 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+def format_change(size, previous):
+    if size is None or previous is None:
+        return ''
+    change = size - previous
+    if change == 0:
+        return ' (=)'
+    percent = f", {change / previous:+.1%}" if previous else ''
+    return f" ({'+' if change > 0 else '-'}{format_bytes(abs(change))}{percent})"
+
+
+def print_report(report, previous):
+    for name, entry in report.items():
+        old = (previous or {}).get(name) or {}
+        files = f" ({entry['files']} files)" if entry['files'] > 1 else ''
+        print(f"📦 {name}{files}: {ARTIFACTS[name]}")
+        print('   ' + '  '.join(
+            f"{key} {format_bytes(entry[key])}{format_change(entry[key], old.get(key))}" for key in SIZES
+        ))
+        if entry['importers']:
+            print(f"   imported by {len(entry['importers'])} modules: "
+                  f"{', '.join(os.path.splitext(os.path.basename(p))[0] for p in entry['importers'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report sizes of generated artifacts and enforce byte budgets')
+    parser.add_argument('--budgets', default=BUDGETS_PATH)
+    parser.add_argument('--report', default=REPORT_PATH, help='previous run to compare with; updated when all budgets pass')
+    parser.add_argument('--no-save', action='store_true', help="don't replace the previous run's report")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("ℹ️  brotli module not installed (pip install brotli); reporting raw and gzip only")
+
+    previous = (load_json(args.report) or {}).get('artifacts')
+    report = {}
+    for name, pattern in ARTIFACTS.items():
+        sizes = measure(pattern)
+        if sizes is not None:
+            sizes['importers'] = find_importers(pattern)
+            report[name] = sizes
+
+    print_report(report, previous)
+
+    failures = check_budgets(report, load_json(args.budgets) or {})
+    if failures:
+        print(f"\n❌ {len(failures)} artifact budget(s) exceeded:")
+        for failure in failures:
+            print(f"   {failure}")
+        print(f"   Shrink the artifact or raise its budget in {args.budgets} deliberately.")
+        print(f"   {args.report} keeps the previous run as the baseline.")
+        sys.exit(1)
+
+    if not args.no_save:
+        write_json_atomic(args.report, {
+            "generated_at": datetime.now().astimezone().isoformat(timespec='seconds'),
+            "artifacts": report
+        }, indent=2)
+    print(f"\n✅ All {len(report)} artifacts within budget")
+
+
+if __name__ == '__main__':
+    main()
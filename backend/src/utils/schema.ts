@@ -1384,6 +1384,7 @@ export async function ensureSchema(pool: Pool) {
     create index if not exists idx_payment_transactions_order on payment_transactions(order_id);
     create index if not exists idx_order_delivery_status_order on order_delivery_status(order_id);
     create index if not exists idx_product_reviews_product on product_reviews(product_id);
+    create index if not exists idx_product_reviews_order on product_reviews(order_id);
     create index if not exists idx_product_reviews_approved on product_reviews(is_approved) where is_approved = true;
     create index if not exists idx_product_questions_product on product_questions(product_id);
     create index if not exists idx_product_questions_status on product_questions(status);
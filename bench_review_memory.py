@@ -0,0 +1,61 @@
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+
+# Peak-RSS comparison of the review generator holding the corpus as plain dicts
+# (the old representation) vs. slotted Review records with interned strings.
+# Each mode runs in its own subprocess so the peaks don't contaminate each other.
+#
+#   python bench_review_memory.py --reviews 1000000
+
+
+def plain_dict_review(name, rating, date, comment):
+    return {"name": name, "rating": rating, "date": date, "comment": comment}
+
+
+def run_child(mode, total_reviews):
+    import generate_all_40_product_reviews as gen
+    from review_records import Review
+
+    random.seed(gen.SEED)
+    products = gen.load_products()
+    per_product = max(1, total_reviews // len(products))
+    make_review = Review if mode == 'records' else plain_dict_review
+    corpus = gen.generate_all_reviews(products, per_product, per_product, make_review, verbose=False)
+
+    # ru_maxrss is KiB on Linux
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "mode": mode,
+        "reviews": sum(len(v) for v in corpus.values()),
+        "peak_rss_mb": round(peak_kib / 1024, 1)
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare generator peak RSS: dicts vs. slotted records')
+    parser.add_argument('--reviews', type=int, default=1_000_000)
+    parser.add_argument('--child', choices=['dicts', 'records'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.reviews)
+        return
+
+    results = {}
+    for mode in ('dicts', 'records'):
+        out = subprocess.run([sys.executable, __file__, '--child', mode, '--reviews', str(args.reviews)],
+                             check=True, capture_output=True, text=True).stdout
+        results[mode] = json.loads(out.strip().splitlines()[-1])
+        print(f"{mode:<8} {results[mode]['reviews']:>10,} reviews  peak RSS {results[mode]['peak_rss_mb']:>8.1f} MB")
+
+    before = results['dicts']['peak_rss_mb']
+    after = results['records']['peak_rss_mb']
+    print(f"\n📉 Peak RSS {before:.1f} MB -> {after:.1f} MB ({(1 - after / before) * 100:.0f}% less)")
+
+
+if __name__ == '__main__':
+    main()
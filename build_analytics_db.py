@@ -0,0 +1,139 @@
+import argparse
+import os
+import sqlite3
+import time
+
+from generate_all_40_product_reviews import load_products
+from review_data import PRODUCTS_PATH, REVIEWS_TS_PATH, load_reviews
+from review_locales import detect_language
+
+# Materialize the catalog and generated reviews into an indexed SQLite file so
+# ad-hoc aggregates run locally in milliseconds, e.g.
+#
+#   python build_analytics_db.py
+#   python build_analytics_db.py --query "
+#     SELECT i.name, ROUND(AVG(r.rating), 2) AS avg_rating, COUNT(*) AS reviews
+#     FROM reviews r
+#     JOIN product_ingredients pi ON pi.product_id = r.product_id
+#     JOIN ingredients i ON i.id = pi.ingredient_id
+#     GROUP BY i.name ORDER BY reviews DESC"
+
+DB_PATH = 'review_analytics.sqlite'
+
+SCHEMA = """
+CREATE TABLE products (
+  id INTEGER PRIMARY KEY,
+  slug TEXT NOT NULL UNIQUE,
+  name TEXT NOT NULL,
+  category TEXT NOT NULL,
+  type TEXT NOT NULL
+);
+CREATE TABLE ingredients (
+  id INTEGER PRIMARY KEY,
+  name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE product_ingredients (
+  product_id INTEGER NOT NULL REFERENCES products(id),
+  ingredient_id INTEGER NOT NULL REFERENCES ingredients(id),
+  position INTEGER NOT NULL,
+  PRIMARY KEY (product_id, ingredient_id)
+) WITHOUT ROWID;
+CREATE TABLE reviews (
+  id INTEGER PRIMARY KEY,
+  product_id INTEGER NOT NULL REFERENCES products(id),
+  name TEXT NOT NULL,
+  rating INTEGER NOT NULL,
+  date TEXT NOT NULL,
+  comment TEXT NOT NULL,
+  lang TEXT NOT NULL
+);
+"""
+
+# Created after the bulk load; building an index once is cheaper than
+# maintaining it row by row
+INDEXES = """
+CREATE INDEX idx_products_category_type ON products(category, type);
+CREATE INDEX idx_product_ingredients_ingredient ON product_ingredients(ingredient_id, product_id);
+CREATE INDEX idx_reviews_product_rating ON reviews(product_id, rating);
+CREATE INDEX idx_reviews_rating ON reviews(rating);
+CREATE INDEX idx_reviews_lang ON reviews(lang);
+"""
+
+
+def build(db_path, products, all_reviews):
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    # Throwaway build file: no journal or fsync needed, it is swapped in at the end
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.executescript(SCHEMA)
+
+    product_rows = []
+    ingredient_ids = {}
+    link_rows = []
+    review_rows = []
+    for product_id, product in enumerate(products, 1):
+        product_rows.append((product_id, product.slug, ' '.join(product.name.split()), product.category, product.type))
+        for position, ingredient in enumerate(product.ingredients):
+            ingredient_id = ingredient_ids.setdefault(ingredient, len(ingredient_ids) + 1)
+            link_rows.append((product_id, ingredient_id, position))
+        for review in all_reviews.get(product.slug, []):
+            review_rows.append((product_id, review['name'], int(review['rating']), review['date'],
+                                review['comment'], detect_language(review['comment'])))
+
+    with conn:
+        conn.executemany("INSERT INTO products VALUES (?, ?, ?, ?, ?)", product_rows)
+        conn.executemany("INSERT INTO ingredients VALUES (?, ?)", [(i, name) for name, i in ingredient_ids.items()])
+        conn.executemany("INSERT OR IGNORE INTO product_ingredients VALUES (?, ?, ?)", link_rows)
+        conn.executemany(
+            "INSERT INTO reviews (product_id, name, rating, date, comment, lang) VALUES (?, ?, ?, ?, ?, ?)",
+            review_rows
+        )
+        conn.executescript(INDEXES)
+    conn.execute("ANALYZE")
+    conn.close()
+
+    os.replace(tmp_path, db_path)
+    return len(product_rows), len(ingredient_ids), len(review_rows)
+
+
+def run_query(db_path, sql):
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    started = time.perf_counter()
+    cur = conn.execute(sql)
+    rows = cur.fetchall()
+    elapsed = (time.perf_counter() - started) * 1000
+    columns = [d[0] for d in cur.description or []]
+    conn.close()
+
+    if columns:
+        widths = [max(len(str(c)), *(len(str(r[i])) for r in rows)) if rows else len(str(c)) for i, c in enumerate(columns)]
+        print('  '.join(str(c).ljust(w) for c, w in zip(columns, widths)))
+        for row in rows:
+            print('  '.join(str(v).ljust(w) for v, w in zip(row, widths)))
+    print(f"\n⏱️  {len(rows)} rows in {elapsed:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build (or query) the local SQLite review analytics cache')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH)
+    parser.add_argument('--db', default=DB_PATH)
+    parser.add_argument('--query', help='run SQL against an existing cache instead of rebuilding')
+    args = parser.parse_args()
+
+    if args.query:
+        run_query(args.db, args.query)
+        return
+
+    started = time.perf_counter()
+    n_products, n_ingredients, n_reviews = build(args.db, load_products(args.products), load_reviews(args.reviews))
+    print(f"✅ Built {args.db}: {n_products} products, {n_ingredients} ingredients, {n_reviews} reviews "
+          f"in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
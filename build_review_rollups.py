@@ -0,0 +1,208 @@
+import argparse
+import json
+import os
+from datetime import date, datetime, timedelta
+
+from db_utils import connect
+from review_data import write_json_atomic
+
+# Time-bucketed review rollups for the admin analytics dashboards.
+# Approved reviews are aggregated in Postgres into a (slug x day x rating)
+# cube, kept in a local state file and extended incrementally past an id
+# watermark. Week and month series are rolled up from the day cube, and every
+# granularity is written as small dense arrays the dashboards can plot
+# directly:
+#
+#   {"granularity": "week", "buckets": ["2026-01-05", ...],
+#    "series": {"<slug>": {"start": 3, "count": [...], "avg": [...], "ratings": {"5": [...], ...}},
+#               "_all": {...}}}
+#
+#   python build_review_rollups.py            # incremental since the watermark
+#   python build_review_rollups.py --full     # rebuild (after edits, deletes or un-approvals)
+#
+# A review can be approved long after it was created (admin moderation, or a
+# row inserted with the schema's default 'pending' status), so the watermark
+# is the id just below the oldest review still pending, never past it.
+# Approved reviews above the watermark are kept in the state by id so the
+# next run doesn't count them again.
+
+STATE_PATH = 'review_rollup_state.json'
+OUT_DIR = 'admin-panel/public/data/review-rollups'
+TIMEZONE = 'Asia/Kolkata'
+GRANULARITIES = ['day', 'week', 'month']
+ALL_KEY = '_all'
+
+CUBE_QUERY = """
+    SELECT p.slug,
+           (pr.created_at AT TIME ZONE %(tz)s)::date AS day,
+           pr.rating,
+           COUNT(*),
+           array_agg(pr.id)
+    FROM product_reviews pr
+    JOIN products p ON p.id = pr.product_id
+    WHERE pr.is_approved = true
+      AND (pr.status = 'approved' OR pr.status IS NULL)
+      AND pr.id > %(since)s
+      AND NOT pr.id = ANY(%(counted)s::int[])
+    GROUP BY 1, 2, 3
+"""
+
+# Where the next run can start: below the oldest review that may still be
+# approved, and below anything too recent for its transaction to be settled
+WATERMARK_QUERY = """
+    SELECT MIN(id) FILTER (WHERE status = 'pending'),
+           MIN(id) FILTER (WHERE created_at > now() - make_interval(secs => %(settle)s)),
+           MAX(id)
+    FROM product_reviews
+    WHERE id > %(since)s
+"""
+
+
+def empty_state():
+    return {"timezone": TIMEZONE, "watermark": 0, "counted": [], "cube": {}}
+
+
+def load_state(path):
+    if not os.path.exists(path):
+        return empty_state()
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    if not isinstance(state.get('watermark'), int):
+        # Written when the watermark was a created_at timestamp
+        print(f"⚠️  {path} predates the id watermark, rebuilding from scratch")
+        return empty_state()
+    return state
+
+
+def next_watermark(cur, since, settle_seconds):
+    """Highest id below which no review can still turn approved, read before counting"""
+    cur.execute(WATERMARK_QUERY, {"since": since, "settle": settle_seconds})
+    oldest_pending, oldest_recent, newest = cur.fetchone()
+    bounds = [i - 1 for i in (oldest_pending, oldest_recent) if i is not None]
+    if bounds:
+        return min(bounds)
+    return newest if newest is not None else since
+
+
+def fetch_increment(conn, state, settle_seconds):
+    """Add approved reviews not counted yet to the day cube; returns reviews merged"""
+    since = state['watermark']
+    counted = set(state['counted'])
+    with conn.cursor() as cur:
+        watermark = next_watermark(cur, since, settle_seconds)
+        cur.execute(CUBE_QUERY, {"tz": state['timezone'], "since": since, "counted": sorted(counted)})
+        rows = cur.fetchall()
+
+    cube = state['cube']
+    merged = 0
+    for slug, day, rating, count, review_ids in rows:
+        counts = cube.setdefault(slug, {}).setdefault(day.isoformat(), [0, 0, 0, 0, 0])
+        counts[rating - 1] += count
+        counted.update(review_ids)
+        merged += count
+    state['watermark'] = watermark
+    # At or below the watermark every review is decided, so the ids aren't needed
+    state['counted'] = sorted(i for i in counted if i > watermark)
+    return merged
+
+
+def bucket_start(day, granularity):
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(bucket, granularity):
+    if granularity == 'day':
+        return bucket + timedelta(days=1)
+    if granularity == 'week':
+        return bucket + timedelta(days=7)
+    return (bucket.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def build_series(cube, granularity):
+    """Roll the day cube up to `granularity` and lay it out as dense arrays"""
+    rolled = {}
+    for slug, days in cube.items():
+        per_slug = rolled.setdefault(slug, {})
+        totals = rolled.setdefault(ALL_KEY, {})
+        for day_text, counts in days.items():
+            bucket = bucket_start(date.fromisoformat(day_text), granularity)
+            for target in (per_slug, totals):
+                acc = target.setdefault(bucket, [0, 0, 0, 0, 0])
+                for i, count in enumerate(counts):
+                    acc[i] += count
+
+    all_buckets = [b for buckets in rolled.values() for b in buckets]
+    if not all_buckets:
+        return [], {}
+    axis = []
+    bucket, last = min(all_buckets), max(all_buckets)
+    while bucket <= last:
+        axis.append(bucket)
+        bucket = next_bucket(bucket, granularity)
+
+    # Each series only spans its own first..last active bucket; "start" is its
+    # offset into the shared axis, which keeps rarely-reviewed products small
+    position = {bucket: i for i, bucket in enumerate(axis)}
+    series = {}
+    for slug in sorted(rolled):
+        buckets = rolled[slug]
+        start = min(position[b] for b in buckets)
+        end = max(position[b] for b in buckets)
+        ratings = {str(r): [] for r in range(5, 0, -1)}
+        count_series, avg_series = [], []
+        for bucket in axis[start:end + 1]:
+            counts = buckets.get(bucket, [0, 0, 0, 0, 0])
+            total = sum(counts)
+            count_series.append(total)
+            avg_series.append(round(sum((i + 1) * c for i, c in enumerate(counts)) / total, 2) if total else None)
+            for r in range(5, 0, -1):
+                ratings[str(r)].append(counts[r - 1])
+        series[slug] = {"start": start, "count": count_series, "avg": avg_series, "ratings": ratings}
+    return [b.isoformat() for b in axis], series
+
+
+def write_rollups(state, out_dir):
+    for granularity in GRANULARITIES:
+        buckets, series = build_series(state['cube'], granularity)
+        path = os.path.join(out_dir, f"{granularity}.json")
+        write_json_atomic(path, {
+            "granularity": granularity,
+            "timezone": state['timezone'],
+            "watermark": state['watermark'],
+            "generated_at": datetime.now().astimezone().isoformat(timespec='seconds'),
+            "buckets": buckets,
+            "series": series
+        }, separators=(',', ':'))
+        print(f"💾 {path}: {len(buckets)} buckets x {len(series)} series")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build time-bucketed review rollups for the admin dashboards')
+    parser.add_argument('--state', default=STATE_PATH)
+    parser.add_argument('--out', default=OUT_DIR)
+    parser.add_argument('--full', action='store_true', help='discard the state and rebuild from scratch')
+    parser.add_argument('--settle', type=int, default=60,
+                        help='keep the watermark below reviews newer than this many seconds')
+    args = parser.parse_args()
+
+    state = empty_state() if args.full else load_state(args.state)
+    previous = state['watermark']
+
+    conn = connect()
+    try:
+        merged = fetch_increment(conn, state, args.settle)
+    finally:
+        conn.close()
+
+    print(f"📈 Merged {merged} reviews after id {previous}")
+    write_json_atomic(args.state, state, separators=(',', ':'))
+    write_rollups(state, args.out)
+    print(f"✅ Watermark is now id {state['watermark']} ({len(state['counted'])} counted reviews above it)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+
+from generate_all_40_product_reviews import (
+    PRODUCTS_PATH, SEED, generate_review, get_comments_for_product, load_products
+)
+from review_data import write_json_atomic
+
+# Bulk review generation for seeding runs, streamed to JSON Lines with
+# periodic checkpoints so an interrupted run can pick up where it stopped:
+#
+#   python bulk_generate_reviews.py --min-reviews 200000 --max-reviews 300000 --out seed_reviews.jsonl
+#   python bulk_generate_reviews.py ... --resume       # after a crash / Ctrl-C
+#
+# Draws come from the same seeded RNG sequence as
+# generate_all_40_product_reviews.py (with the default 60-80 reviews it
+# reproduces that corpus), and a checkpoint records the RNG state together
+# with the last completed slug/review and the byte offset of the output, so a
+# resumed run truncates any partial tail and produces a byte-identical file.
+
+CHECKPOINT_SCHEMA_VERSION = 1
+CHECKPOINT_EVERY = 100000
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def run_params(args):
+    """What has to match for a checkpoint to be resumable"""
+    return {
+        "products_sha256": file_sha256(args.products),
+        "seed": args.seed,
+        "min_reviews": args.min_reviews,
+        "max_reviews": args.max_reviews
+    }
+
+
+def rng_state_to_json(state):
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def rng_state_from_json(state):
+    version, internal, gauss_next = state
+    return version, tuple(internal), gauss_next
+
+
+def save_checkpoint(path, params, f, product_index, review_index, num_reviews, written):
+    # The checkpoint must never point past what is durably in the output
+    f.flush()
+    os.fsync(f.fileno())
+    write_json_atomic(path, {
+        "schema_version": CHECKPOINT_SCHEMA_VERSION,
+        "params": params,
+        "product_index": product_index,
+        "review_index": review_index,
+        "num_reviews": num_reviews,
+        "written": written,
+        "offset": f.tell(),
+        "rng_state": rng_state_to_json(random.getstate())
+    })
+
+
+def load_checkpoint(path, params):
+    with open(path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+    if checkpoint.get('schema_version') != CHECKPOINT_SCHEMA_VERSION:
+        raise SystemExit(f"❌ {path} was written by an incompatible version; start over without --resume")
+    if checkpoint['params'] != params:
+        raise SystemExit(f"❌ {path} was written with different inputs or options:\n"
+                         f"   checkpoint: {checkpoint['params']}\n   this run:   {params}")
+    return checkpoint
+
+
+def generate(products, f, checkpoint_path, params, every, start=None):
+    """Stream every product's reviews to `f`, checkpointing every `every` reviews"""
+    product_index, review_index, num_reviews, written = 0, 0, None, 0
+    if start:
+        product_index, review_index = start['product_index'], start['review_index']
+        num_reviews, written = start['num_reviews'], start['written']
+
+    since_checkpoint = 0
+    while product_index < len(products):
+        product = products[product_index]
+        if num_reviews is None:
+            num_reviews = random.randint(params['min_reviews'], params['max_reviews'])
+        comments_short, comments_long = get_comments_for_product(product)
+
+        while review_index < num_reviews:
+            review = generate_review(comments_short, comments_long).to_dict()
+            line = json.dumps(dict(slug=product.slug, **review), ensure_ascii=False)
+            f.write(line.encode('utf-8') + b'\n')
+            review_index += 1
+            written += 1
+            since_checkpoint += 1
+            if since_checkpoint >= every:
+                save_checkpoint(checkpoint_path, params, f, product_index, review_index, num_reviews, written)
+                since_checkpoint = 0
+
+        print(f"Generated {num_reviews} reviews for {product.slug} ({written} total)")
+        product_index, review_index, num_reviews = product_index + 1, 0, None
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream a large seeded review corpus to JSON Lines, resumably')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--out', required=True)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--min-reviews', type=int, default=60)
+    parser.add_argument('--max-reviews', type=int, default=80)
+    parser.add_argument('--checkpoint', help='checkpoint file (default: <out>.checkpoint.json)')
+    parser.add_argument('--checkpoint-every', type=int, default=CHECKPOINT_EVERY, help='reviews between checkpoints')
+    parser.add_argument('--resume', action='store_true', help='continue from the checkpoint of an interrupted run')
+    args = parser.parse_args()
+
+    checkpoint_path = args.checkpoint or f"{args.out}.checkpoint.json"
+    params = run_params(args)
+    products = load_products(args.products)
+
+    started = time.perf_counter()
+    if args.resume:
+        if not os.path.exists(checkpoint_path):
+            raise SystemExit(f"❌ No checkpoint at {checkpoint_path}; run without --resume")
+        checkpoint = load_checkpoint(checkpoint_path, params)
+        random.setstate(rng_state_from_json(checkpoint['rng_state']))
+        f = open(args.out, 'r+b')
+        # Drop whatever was written after the checkpoint; it will be regenerated
+        f.truncate(checkpoint['offset'])
+        f.seek(checkpoint['offset'])
+        print(f"⏩ Resuming at {products[checkpoint['product_index']].slug} review {checkpoint['review_index']} "
+              f"({checkpoint['written']} reviews already written)")
+    else:
+        checkpoint = None
+        random.seed(args.seed)
+        f = open(args.out, 'wb')
+
+    with f:
+        written = generate(products, f, checkpoint_path, params, args.checkpoint_every, checkpoint)
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f"\n✅ {written} reviews in {args.out} ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+import argparse
+import hashlib
+import marshal
+import os
+import time
+
+from extract_products_from_csv import CSV_PATH, extract_product, iter_catalog
+
+# Parsed-catalog cache shared by the pipeline scripts. The catalog CSV is
+# multi-line and quote-heavy, so instead of every tool re-parsing it, the
+# normalized rows and extracted product summaries are stored once in marshal
+# form and reloaded in a fraction of the parse time:
+#
+#   from catalog_cache import cached_pairs, cached_rows, cached_products
+#   rows = cached_rows()            # same as read_catalog(), from cache when fresh
+#
+#   python catalog_cache.py         # warm / refresh the cache and report timings
+#
+# A cache entry is valid while the CSV's size and mtime match. If only the
+# mtime moved (checkout, touch), the content hash decides and the entry is
+# re-stamped instead of rebuilt. Records are stored as one key list plus a
+# tuple per record: marshal then only rebuilds strings, and dict(zip()) is
+# several times faster than unmarshalling a dict per row.
+
+CACHE_DIR = '.catalog_cache'
+# Bump when the row/product shape changes; marshal's own format is part of the key too
+CACHE_SCHEMA_VERSION = 1
+
+
+def cache_path(csv_path, cache_dir=CACHE_DIR):
+    name = hashlib.sha1(os.path.abspath(csv_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{name}.marshal")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def pack(records):
+    """(keys, [value tuple, ...]) for dicts that all share the same keys"""
+    keys = tuple(records[0]) if records else ()
+    return keys, [tuple(record[key] for key in keys) for record in records]
+
+
+def unpack(keys, values):
+    return [dict(zip(keys, record)) for record in values]
+
+
+def build_entry(csv_path, stamp):
+    rows = list(iter_catalog(csv_path))
+    row_indexes, products = [], []
+    for index, row in enumerate(rows):
+        product = extract_product(row)
+        if product:
+            row_indexes.append(index)
+            products.append(product)
+    return {
+        "schema_version": CACHE_SCHEMA_VERSION,
+        "marshal_version": marshal.version,
+        "source": dict(stamp, sha256=file_sha256(csv_path)),
+        "rows": pack(rows),
+        "products": pack(products),
+        "product_rows": row_indexes
+    }
+
+
+def write_entry(path, entry):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(marshal.dumps(entry))
+    os.replace(tmp_path, path)
+
+
+def read_entry(path):
+    try:
+        with open(path, 'rb') as f:
+            entry = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (not isinstance(entry, dict) or entry.get('schema_version') != CACHE_SCHEMA_VERSION
+            or entry.get('marshal_version') != marshal.version):
+        return None
+    return entry
+
+
+def load_entry(csv_path=CSV_PATH, cache_dir=CACHE_DIR):
+    """Cache entry for the catalog CSV, re-extracted only when its content changed"""
+    path = cache_path(csv_path, cache_dir)
+    stamp = source_stamp(csv_path)
+    entry = read_entry(path)
+
+    if entry is not None:
+        source = entry['source']
+        if source['size'] == stamp['size'] and source['mtime_ns'] == stamp['mtime_ns']:
+            return entry
+        if source['size'] == stamp['size'] and source['sha256'] == file_sha256(csv_path):
+            # Touched but unchanged: keep the parse, remember the new mtime
+            entry['source'] = dict(stamp, sha256=source['sha256'])
+            write_entry(path, entry)
+            return entry
+
+    entry = build_entry(csv_path, stamp)
+    write_entry(path, entry)
+    return entry
+
+
+def load_catalog(csv_path=CSV_PATH, cache_dir=CACHE_DIR):
+    """(rows, products, pairs) for the catalog CSV; pairs share the row and product dicts"""
+    entry = load_entry(csv_path, cache_dir)
+    rows = unpack(*entry['rows'])
+    products = unpack(*entry['products'])
+    pairs = [(rows[index], product) for index, product in zip(entry['product_rows'], products)]
+    return rows, products, pairs
+
+
+def cached_rows(csv_path=CSV_PATH):
+    """Catalog rows as read_catalog() returns them"""
+    return unpack(*load_entry(csv_path)['rows'])
+
+
+def cached_products(csv_path=CSV_PATH):
+    """Product summaries as extract_products() returns them"""
+    return unpack(*load_entry(csv_path)['products'])
+
+
+def cached_pairs(csv_path=CSV_PATH):
+    """(row, product) pairs as extract_pairs() returns them"""
+    return load_catalog(csv_path)[2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm or inspect the parsed-catalog cache')
+    parser.add_argument('--csv', default=CSV_PATH)
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args()
+
+    path = cache_path(args.csv, args.cache_dir)
+    started = time.perf_counter()
+    load_entry(args.csv, args.cache_dir)
+    first = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rows, products, _ = load_catalog(args.csv, args.cache_dir)
+    warm = time.perf_counter() - started
+
+    print(f"✅ {len(rows)} rows, {len(products)} products cached in {path} "
+          f"({os.path.getsize(path)} bytes)")
+    print(f"⏱️  cache read {first * 1000:.1f} ms, rows and products rebuilt in {warm * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+import argparse
+import hashlib
+import json
+import os
+
+from catalog_cache import cached_rows
+from extract_products_from_csv import CSV_PATH
+
+# Catalog delta engine: compares the current catalog CSV with the previous
+# version and emits only what changed, so review regeneration, image
+# processing and DB sync can work on the delta instead of the whole catalog.
+#
+#   python catalog_delta.py                          # vs. the saved index, then keep it
+#   python catalog_delta.py --previous old.csv       # vs. another CSV version
+#   python catalog_delta.py --no-update-index        # dry run, keep the old baseline
+#
+# Rows are keyed by SKU (falling back to slug). Each row is indexed with one
+# hash per field plus a hash over all of them, so unchanged rows are skipped
+# with a single comparison and changed rows report exactly which fields moved.
+
+INDEX_PATH = 'catalog_index.json'
+DELTA_PATH = 'catalog_delta.json'
+INDEX_SCHEMA_VERSION = 1
+
+
+def normalize(value):
+    # Whitespace-only edits (the CSV is full of them) are not changes
+    return ' '.join((value or '').split())
+
+
+def field_hash(value):
+    return hashlib.blake2b(normalize(value).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def row_key(row):
+    sku = normalize(row.get('SKU'))
+    if sku:
+        return sku
+    slug = normalize(row.get('Slug'))
+    return f"slug:{slug}" if slug else None
+
+
+def file_fingerprint(path):
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return {"path": path, "size": os.path.getsize(path), "sha256": digest}
+
+
+def build_index(rows, source=None):
+    """Hash index of a catalog: {key: {sku, slug, row_hash, fields: {column: hash}}}
+
+    Keys and slugs must be unique: a repeated one would silently hide a row
+    from the delta, so it fails instead.
+    """
+    entries = {}
+    slugs = {}
+    duplicates = []
+    for row in rows:
+        key = row_key(row)
+        if key is None:
+            continue
+        slug = normalize(row.get('Slug'))
+        if key in entries:
+            duplicates.append(f"SKU {key}" if not key.startswith('slug:') else f"slug {slug}")
+            continue
+        if slug and slug in slugs:
+            duplicates.append(f"slug {slug} (SKUs {slugs[slug]}, {key})")
+            continue
+        slugs[slug] = key
+        fields = {column: field_hash(value) for column, value in row.items()}
+        row_hash = hashlib.blake2b(
+            ''.join(f"{column}\0{fields[column]}\0" for column in sorted(fields)).encode('utf-8'),
+            digest_size=8
+        ).hexdigest()
+        entries[key] = {
+            "sku": normalize(row.get('SKU')),
+            "slug": slug,
+            "row_hash": row_hash,
+            "fields": fields
+        }
+    if duplicates:
+        where = f" in {source['path']}" if source else ''
+        raise SystemExit(f"❌ {len(duplicates)} duplicate catalog rows{where}: {', '.join(duplicates)}")
+    return {"schema_version": INDEX_SCHEMA_VERSION, "source": source, "rows": entries}
+
+
+def load_index(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get('schema_version') != INDEX_SCHEMA_VERSION:
+        print(f"⚠️  {path} has an old schema version, treating every row as added")
+        return None
+    return index
+
+
+def compute_delta(previous, current, current_rows, previous_rows=None):
+    """Diff two indexes. Row values come from *_rows; old values only when previous_rows is given."""
+    prev_entries = previous['rows'] if previous else {}
+    cur_entries = current['rows']
+    cur_by_key = {row_key(row): row for row in current_rows}
+    prev_by_key = {row_key(row): row for row in previous_rows} if previous_rows else {}
+
+    added_keys = [k for k in cur_entries if k not in prev_entries]
+    removed_keys = [k for k in prev_entries if k not in cur_entries]
+
+    # A row whose SKU changed but kept its slug is an edit, not a remove + add
+    removed_by_slug = {prev_entries[k]['slug']: k for k in removed_keys if prev_entries[k]['slug']}
+    rekeyed = {}
+    for key in added_keys:
+        old_key = removed_by_slug.get(cur_entries[key]['slug'])
+        if old_key:
+            rekeyed[key] = old_key
+    added_keys = [k for k in added_keys if k not in rekeyed]
+    removed_keys = [k for k in removed_keys if k not in set(rekeyed.values())]
+
+    changed = []
+    unchanged = 0
+    for key, entry in cur_entries.items():
+        old_key = rekeyed.get(key, key)
+        old = prev_entries.get(old_key)
+        if old is None:
+            continue
+        if old['row_hash'] == entry['row_hash']:
+            unchanged += 1
+            continue
+
+        fields = {}
+        for column in sorted(set(entry['fields']) | set(old['fields'])):
+            if entry['fields'].get(column) == old['fields'].get(column):
+                continue
+            change = {"new": cur_by_key[key].get(column)}
+            if old_key in prev_by_key:
+                change["old"] = prev_by_key[old_key].get(column)
+            fields[column] = change
+        changed.append({"key": key, "previous_key": old_key, "sku": entry['sku'], "slug": entry['slug'], "fields": fields})
+
+    return {
+        "schema_version": INDEX_SCHEMA_VERSION,
+        "previous": previous['source'] if previous else None,
+        "current": current['source'],
+        "summary": {
+            "added": len(added_keys),
+            "removed": len(removed_keys),
+            "changed": len(changed),
+            "unchanged": unchanged
+        },
+        "added": [{"key": k, "sku": cur_entries[k]['sku'], "slug": cur_entries[k]['slug'], "row": cur_by_key[k]}
+                  for k in added_keys],
+        "removed": [{"key": k, "sku": prev_entries[k]['sku'], "slug": prev_entries[k]['slug']} for k in removed_keys],
+        "changed": changed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute the changed SKUs between catalog versions')
+    parser.add_argument('--csv', default=CSV_PATH, help='current catalog CSV')
+    parser.add_argument('--previous', help='previous catalog CSV (default: the saved index)')
+    parser.add_argument('--index', default=INDEX_PATH, help='saved hash index of the previous run')
+    parser.add_argument('--out', default=DELTA_PATH)
+    parser.add_argument('--no-update-index', action='store_true', help='keep the old baseline index')
+    args = parser.parse_args()
+
+    current_rows = cached_rows(args.csv)
+    current = build_index(current_rows, file_fingerprint(args.csv))
+
+    previous_rows = None
+    if args.previous:
+        previous_rows = cached_rows(args.previous)
+        previous = build_index(previous_rows, file_fingerprint(args.previous))
+    else:
+        previous = load_index(args.index)
+
+    delta = compute_delta(previous, current, current_rows, previous_rows)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(delta, f, indent=2, ensure_ascii=False)
+
+    summary = delta['summary']
+    print(f"➕ Added: {summary['added']}  ➖ Removed: {summary['removed']}  "
+          f"✏️  Changed: {summary['changed']}  ✅ Unchanged: {summary['unchanged']}")
+    for change in delta['changed']:
+        print(f"  {change['key']} ({change['slug']}): {', '.join(change['fields'])}")
+    print(f"💾 Delta saved to {args.out}")
+
+    if not args.previous and not args.no_update_index:
+        with open(args.index, 'w', encoding='utf-8') as f:
+            json.dump(current, f, separators=(',', ':'))
+        print(f"💾 Baseline index updated: {args.index}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+import re
+import time
+import unicodedata
+
+from review_data import clean_name, write_json_atomic
+
+# Typo-tolerant client-side catalog search, built by extract_products_from_csv.py.
+# Every product is indexed by the trigrams of its normalized name, title,
+# tagline, ingredients and category, and every word goes into a prefix trie
+# for autocomplete. The result is one small static file the storefront loads
+# once; search() below is the reference scorer that
+# user-panel/src/utils/catalogSearch.ts mirrors.
+#
+#   python catalog_search.py "hair leather"       # query the built index
+
+SEARCH_INDEX_PATH = 'user-panel/public/data/search-index.json'
+SEARCH_SCHEMA_VERSION = 1
+
+# Matches in the name/title count more than matches in the supporting fields
+FIELD_WEIGHTS = {'name': 3, 'title': 3, 'tagline': 1, 'ingredients': 1, 'category': 1}
+# Fraction of the query's trigrams a product has to share to count as a match
+MIN_SIMILARITY = 0.3
+PREFIX_BONUS = 1.0
+# Words shorter than this aren't worth an autocomplete entry
+MIN_TERM_LENGTH = 2
+# Trie key holding the products of the word that ends at a node
+TERM_END = ''
+
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation, collapse whitespace"""
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text).split())
+
+
+def trigrams(text):
+    """Padded word trigrams, so short words and word boundaries still match"""
+    grams = set()
+    for word in text.split():
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def search_fields(row, product):
+    return {
+        'name': row.get('Product Name', ''),
+        'title': row.get('Product Title', ''),
+        'tagline': row.get('Subtitle / Tagline', ''),
+        'ingredients': ' '.join(product['ingredients']),
+        'category': f"{row.get('Product Category', '')} {product['category']} {product['type']}",
+    }
+
+
+def trie_insert(trie, word, doc_id):
+    node = trie
+    while True:
+        for edge in list(node):
+            if edge == TERM_END:
+                continue
+            common = len(os.path.commonprefix([edge, word]))
+            if not common:
+                continue
+            if common < len(edge):
+                # Split the edge so the shared prefix becomes its own node
+                node[edge[:common]] = {edge[common:]: node.pop(edge)}
+            node = node[edge[:common]]
+            word = word[common:]
+            break
+        else:
+            if word:
+                node = node.setdefault(word, {})
+                word = ''
+        if not word:
+            ids = node.setdefault(TERM_END, [])
+            if doc_id not in ids:
+                ids.append(doc_id)
+            return
+
+
+def build_search_index(pairs):
+    """Index (catalog row, extracted product) pairs into the static search file"""
+    docs = []
+    postings = {}
+    trie = {}
+    for doc_id, (row, product) in enumerate(pairs):
+        # Titles are the cleanest display names; combo "names" carry their contents
+        docs.append({"slug": product['slug'], "name": clean_name(row.get('Product Title') or product['name'])})
+        weights = {}
+        for field, text in search_fields(row, product).items():
+            text = normalize(text)
+            for gram in trigrams(text):
+                weights[gram] = max(weights.get(gram, 0), FIELD_WEIGHTS[field])
+            for word in text.split():
+                if len(word) >= MIN_TERM_LENGTH:
+                    trie_insert(trie, word, doc_id)
+        for gram, weight in weights.items():
+            postings.setdefault(gram, []).append([doc_id, weight])
+
+    return {
+        "schema_version": SEARCH_SCHEMA_VERSION,
+        "min_similarity": MIN_SIMILARITY,
+        "prefix_bonus": PREFIX_BONUS,
+        "max_weight": max(FIELD_WEIGHTS.values()),
+        "docs": docs,
+        "grams": dict(sorted(postings.items())),
+        "trie": trie
+    }
+
+
+def trie_prefix_docs(trie, prefix):
+    """Products with a word starting with `prefix`"""
+    node = trie
+    while prefix:
+        for edge, child in node.items():
+            if edge and (edge.startswith(prefix) or prefix.startswith(edge)):
+                node = child
+                prefix = prefix[len(edge):] if prefix.startswith(edge) else ''
+                break
+        else:
+            return set()
+    found = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        for edge, child in node.items():
+            if edge == TERM_END:
+                found.update(child)
+            else:
+                stack.append(child)
+    return found
+
+
+def search(index, query, limit=10):
+    """Rank products for a (possibly misspelled, possibly unfinished) query"""
+    text = normalize(query)
+    grams = trigrams(text)
+    if not grams:
+        return []
+
+    max_weight = index['max_weight']
+    scores = {}
+    for gram in grams:
+        for doc_id, weight in index['grams'].get(gram, ()):
+            scores[doc_id] = scores.get(doc_id, 0) + weight / max_weight
+    scores = {doc_id: score / len(grams) for doc_id, score in scores.items()
+              if score / len(grams) >= index['min_similarity']}
+
+    # The last word is usually still being typed; complete it from the trie
+    last_word = text.split()[-1]
+    for doc_id in trie_prefix_docs(index['trie'], last_word):
+        scores[doc_id] = scores.get(doc_id, 0) + index['prefix_bonus']
+
+    # Equal scores favour the shorter, more specific product
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], len(index['docs'][item[0]]['name']), item[0]))[:limit]
+    return [dict(index['docs'][doc_id], score=round(score, 3)) for doc_id, score in ranked]
+
+
+def write_search_index(index, path=SEARCH_INDEX_PATH):
+    write_json_atomic(path, index, separators=(',', ':'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the static catalog search index')
+    parser.add_argument('query')
+    parser.add_argument('--index', default=SEARCH_INDEX_PATH)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    with open(args.index, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    started = time.perf_counter()
+    results = search(index, args.query, args.limit)
+    elapsed = (time.perf_counter() - started) * 1000
+    for result in results:
+        print(f"{result['score']:6.3f}  {result['slug']}  {result['name']}")
+    print(f"\n⏱️  {len(results)} results in {elapsed:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
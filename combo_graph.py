@@ -0,0 +1,113 @@
+import re
+
+from catalog_search import normalize
+from review_data import write_json_atomic
+
+# Resolve every combo in the catalog to the single products it contains and
+# emit both directions of the relation, so combo pages, "bought together"
+# and inventory can look components up instead of string-matching names:
+#
+#   {"combos": {"<combo slug>": [{"slug": "<component slug>", "quantity": 1}, ...]},
+#    "component_of": {"<component slug>": ["<combo slug>", ...]},
+#    "unresolved": ["<combo slug>", ...]}
+#
+# Component names are matched against aliases derived from each single
+# product's name, title and package content, plus the shorthand the combo
+# rows use below. Built by extract_products_from_csv.py.
+
+COMBO_GRAPH_PATH = 'user-panel/public/data/combo-graph.json'
+
+# Container words in "Package Content Details" ("Face Serum Bottle")
+CONTAINER_WORDS = {'bottle', 'jar', 'tube', 'pack', 'pouch'}
+
+# Shorthand seen in combo rows -> an alias derived from a single product
+COMPONENT_SYNONYMS = {
+    'face wash': 'face cleanser',
+    'facewash': 'face cleanser',
+    'facecleanser': 'face cleanser',
+    'cleanser': 'face cleanser',
+    'face scrub': 'furbish scrub',
+    'scrub': 'furbish scrub',
+    'hair shampoo': 'shampoo',
+    'hydrating moisture': 'hydrating moisturizer',
+    'moisturizer': 'hydrating moisturizer',
+    'serum': 'face serum',
+    'lotion': 'wine lotion',
+    'oil': 'hair oil',
+}
+
+
+def alias_key(text):
+    words = [w for w in normalize(text).split() if w != 'nefol' and w not in CONTAINER_WORDS]
+    return ' '.join(words)
+
+
+def build_aliases(singles):
+    """{alias: slug} for every single product; aliases shared by two products are dropped"""
+    candidates = {}
+    for row, product in singles:
+        for text in (row.get('Product Name'), row.get('Product Title'), row.get('Package Content Details')):
+            key = alias_key(text)
+            if key:
+                candidates.setdefault(key, set()).add(product['slug'])
+    aliases = {key: slugs.pop() for key, slugs in candidates.items() if len(slugs) == 1}
+    for synonym, target in COMPONENT_SYNONYMS.items():
+        if target in aliases:
+            aliases.setdefault(synonym, aliases[target])
+    return aliases
+
+
+def match_components(text, aliases):
+    """Component slugs named in `text`, longest alias first, in order (repeats kept)"""
+    words = alias_key(text).split()
+    longest = max((len(alias.split()) for alias in aliases), default=0)
+    found = []
+    i = 0
+    while i < len(words):
+        for size in range(min(longest, len(words) - i), 0, -1):
+            slug = aliases.get(' '.join(words[i:i + size]))
+            if slug:
+                found.append(slug)
+                i += size
+                break
+        else:
+            i += 1
+    return found
+
+
+def combo_components(row, aliases):
+    # "Package Content Details" lists components for the older combos; the
+    # newer ones only say "Face Care" there, and name them in the product name
+    for text in (row.get('Package Content Details'), re.sub(r'\([^)]*\)?', ' ', row.get('Product Name', ''))):
+        found = match_components(text, aliases)
+        if len(found) >= 2:
+            return found
+    return []
+
+
+def build_combo_graph(pairs):
+    """Bidirectional combo <-> component index from (catalog row, extracted product) pairs"""
+    singles = [(row, product) for row, product in pairs if product['category'] != 'combo']
+    combos = [(row, product) for row, product in pairs if product['category'] == 'combo']
+    aliases = build_aliases(singles)
+
+    graph = {}
+    component_of = {}
+    unresolved = []
+    for row, product in combos:
+        found = combo_components(row, aliases)
+        if not found:
+            unresolved.append(product['slug'])
+            continue
+        quantities = {}
+        for slug in found:
+            quantities[slug] = quantities.get(slug, 0) + 1
+        graph[product['slug']] = [{"slug": slug, "quantity": n} for slug, n in quantities.items()]
+        for slug in quantities:
+            component_of.setdefault(slug, []).append(product['slug'])
+
+    return {"combos": graph, "component_of": dict(sorted(component_of.items())), "unresolved": unresolved}
+
+
+def write_combo_graph(graph, path=COMBO_GRAPH_PATH):
+    write_json_atomic(path, graph, indent=2)
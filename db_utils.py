@@ -0,0 +1,30 @@
+import os
+
+# Postgres access for the offline pipeline jobs. Uses the same DATABASE_URL as
+# the backend, falling back to backend/.env so jobs run from the repo root.
+BACKEND_ENV_PATH = 'backend/.env'
+
+
+def database_url():
+    url = os.environ.get('DATABASE_URL')
+    if url:
+        return url
+
+    if os.path.exists(BACKEND_ENV_PATH):
+        with open(BACKEND_ENV_PATH, 'r', encoding='utf-8-sig') as f:
+            for line in f:
+                key, sep, value = line.strip().partition('=')
+                if sep and key.strip() == 'DATABASE_URL':
+                    return value.strip().strip('"').strip("'")
+
+    raise SystemExit("❌ DATABASE_URL is not set (checked environment and backend/.env)")
+
+
+def connect(url=None):
+    """Open a psycopg2 connection to the backend database"""
+    try:
+        import psycopg2
+    except ImportError:
+        raise SystemExit("❌ psycopg2 is required for database jobs: pip install psycopg2-binary")
+
+    return psycopg2.connect(url or database_url())
@@ -0,0 +1,203 @@
+import argparse
+import gzip
+import os
+import time
+from xml.sax.saxutils import escape
+
+from db_utils import connect
+from extract_products_from_csv import CSV_PATH, iter_catalog
+from generate_review_jsonld import BRAND, SITE_URL
+from review_data import clean_name
+
+# Marketplace product feeds straight from the catalog CSV:
+#   google_merchant.xml.gz    Google Merchant Center RSS 2.0 (g: namespace)
+#   facebook_catalog.tsv.gz   Facebook/Instagram catalog TSV
+#
+#   python export_product_feeds.py
+#   python export_product_feeds.py --csv big_catalog.csv --out-dir /tmp/feeds
+#
+# Rows are streamed from the CSV and written item by item into gzip streams,
+# so memory stays flat however many SKUs the catalog has. Ratings are not part
+# of these feeds: neither marketplace reads them from catalog attributes
+# (Google takes them from a separate product ratings feed), and the product
+# pages already carry them as JSON-LD from generate_review_jsonld.py.
+#
+# image_link is required by both marketplaces. The sheet's "Image Links"
+# column is usually empty, so products fall back to products.list_image, the
+# image the storefront itself shows. If an item still has no image the run
+# fails and the previous feeds stay in place (--skip-missing-images drops
+# those items instead).
+
+FEEDS_DIR = 'user-panel/public/feeds'
+GOOGLE_FEED = 'google_merchant.xml.gz'
+FACEBOOK_FEED = 'facebook_catalog.tsv.gz'
+CURRENCY = 'INR'
+# The CSV has no stock column; the backend's catalog CSV feed uses the same default
+AVAILABILITY = 'in stock'
+MAX_DESCRIPTION = 5000
+MAX_ADDITIONAL_IMAGES = 10
+# zlib dominates the run time on big catalogs; --gzip-level 1 is ~2x faster for ~35% bigger files
+GZIP_LEVEL = 6
+
+FACEBOOK_COLUMNS = ['id', 'title', 'description', 'availability', 'condition', 'price', 'sale_price', 'link',
+                    'image_link', 'additional_image_link', 'brand', 'product_type', 'google_product_category',
+                    'custom_label_0']
+
+
+def load_list_images():
+    """{slug: absolute list_image URL} from the products table"""
+    conn = connect()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT slug, list_image FROM products WHERE list_image <> ''")
+            return {slug: absolute_url(image) for slug, image in cur}
+    finally:
+        conn.close()
+
+
+def absolute_url(path):
+    # Uploads are stored as site paths; the backend's catalog CSV prefixes its host the same way
+    if path.startswith(('http://', 'https://')):
+        return path
+    return f"{SITE_URL}{path if path.startswith('/') else '/' + path}"
+
+
+def money(value):
+    try:
+        return f"{float(value):.2f} {CURRENCY}"
+    except (TypeError, ValueError):
+        return ''
+
+
+def feed_item(row, list_images):
+    """Flat feed fields for one catalog row, or None when it can't be listed"""
+    slug = row.get('Slug', '')
+    title = clean_name(row.get('Product Title') or row.get('Product Name'))
+    if not slug or not title:
+        return None
+
+    images = [link.strip() for link in row.get('Image Links', '').split(',') if link.strip()]
+    if not images and list_images.get(slug):
+        images = [list_images[slug]]
+    mrp = money(row.get('MRP'))
+    price = money(row.get('WEBSITE price'))
+
+    return {
+        'id': row.get('SKU') or slug,
+        'title': title[:150],
+        'description': clean_name(row.get('Product Description (Long)') or row.get('Subtitle / Tagline'))[:MAX_DESCRIPTION],
+        'availability': AVAILABILITY,
+        'condition': 'new',
+        # MRP is the list price; the website price is the discounted sale price
+        'price': mrp or price,
+        'sale_price': price if mrp and price and price != mrp else '',
+        'link': f"{SITE_URL}/#/user/product/{slug}",
+        'image_link': images[0] if images else '',
+        'additional_image_link': ','.join(images[1:MAX_ADDITIONAL_IMAGES + 1]),
+        'brand': clean_name(row.get('Brand Name')) or BRAND,
+        'product_type': ' > '.join(clean_name(row.get(c)) for c in ('Product Category', 'Product Sub-Category') if clean_name(row.get(c))),
+        'google_product_category': clean_name(row.get('Platform Category Mapping')),
+        'custom_label_0': f"GST {row['GST %']}%" if row.get('GST %') else '',
+    }
+
+
+class GoogleFeedWriter:
+    def __init__(self, f):
+        self.f = f
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<rss version="2.0" xmlns:g="http://base.google.com/ns/1.0">\n<channel>\n'
+                f'<title>{BRAND}</title>\n<link>{SITE_URL}</link>\n'
+                f'<description>{BRAND} product feed</description>\n')
+
+    def write(self, item):
+        parts = ['<item>']
+        for key, value in item.items():
+            if not value:
+                continue
+            if key in ('title', 'description', 'link'):
+                parts.append(f"<{key}>{escape(value)}</{key}>")
+            elif key == 'additional_image_link':
+                parts.extend(f"<g:{key}>{escape(link)}</g:{key}>" for link in value.split(','))
+            else:
+                parts.append(f"<g:{key}>{escape(value)}</g:{key}>")
+        parts.append('</item>\n')
+        self.f.write(''.join(parts))
+
+    def close(self):
+        self.f.write('</channel>\n</rss>\n')
+
+
+class FacebookFeedWriter:
+    def __init__(self, f):
+        self.f = f
+        f.write('\t'.join(FACEBOOK_COLUMNS) + '\n')
+
+    def write(self, item):
+        # TSV has no quoting; tabs and newlines inside values become spaces
+        self.f.write('\t'.join(' '.join(str(item[c]).split()) for c in FACEBOOK_COLUMNS) + '\n')
+
+    def close(self):
+        pass
+
+
+def open_feed(path, level):
+    tmp_path = f"{path}.tmp"
+    return tmp_path, gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=level, newline='')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export Google Merchant and Facebook catalog feeds from the catalog CSV')
+    parser.add_argument('--csv', default=CSV_PATH)
+    parser.add_argument('--out-dir', default=FEEDS_DIR)
+    parser.add_argument('--gzip-level', type=int, default=GZIP_LEVEL, choices=range(1, 10), metavar='1-9')
+    parser.add_argument('--no-db', action='store_true', help="don't fall back to products.list_image for images")
+    parser.add_argument('--skip-missing-images', action='store_true',
+                        help='leave out items without an image instead of failing')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    list_images = {} if args.no_db else load_list_images()
+    os.makedirs(args.out_dir, exist_ok=True)
+    google_path = os.path.join(args.out_dir, GOOGLE_FEED)
+    facebook_path = os.path.join(args.out_dir, FACEBOOK_FEED)
+    google_tmp, google_file = open_feed(google_path, args.gzip_level)
+    facebook_tmp, facebook_file = open_feed(facebook_path, args.gzip_level)
+
+    written = skipped = missing_images = 0
+    with google_file, facebook_file:
+        writers = [GoogleFeedWriter(google_file), FacebookFeedWriter(facebook_file)]
+        for row in iter_catalog(args.csv):
+            item = feed_item(row, list_images)
+            if item is None:
+                skipped += 1
+                continue
+            if not item['image_link']:
+                missing_images += 1
+                if args.skip_missing_images:
+                    continue
+            for writer in writers:
+                writer.write(item)
+            written += 1
+        for writer in writers:
+            writer.close()
+
+    if missing_images and not args.skip_missing_images:
+        os.remove(google_tmp)
+        os.remove(facebook_tmp)
+        raise SystemExit(f"❌ {missing_images} items have no image link (neither \"Image Links\" nor "
+                         f"products.list_image); the marketplaces would reject them. Feeds left unchanged.")
+
+    # Swap in complete files only, so a feed URL never serves a truncated gzip
+    os.replace(google_tmp, google_path)
+    os.replace(facebook_tmp, facebook_path)
+
+    print(f"✅ {written} items -> {google_path} ({os.path.getsize(google_path)} bytes), "
+          f"{facebook_path} ({os.path.getsize(facebook_path)} bytes) in {time.perf_counter() - started:.2f}s")
+    if skipped:
+        print(f"⏭️  Skipped {skipped} rows without a slug or title")
+    if missing_images:
+        print(f"⏭️  Left out {missing_images} items without an image link")
+
+
+if __name__ == '__main__':
+    main()
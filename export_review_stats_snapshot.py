@@ -0,0 +1,132 @@
+import argparse
+import json
+import os
+import time
+
+from db_utils import connect
+from review_data import (
+    PRODUCTS_PATH, REVIEWS_TS_PATH, STATS_SNAPSHOT_PATH,
+    build_stats_snapshot, load_products, load_reviews, review_stats, write_json_atomic
+)
+
+# Materialize review stats for every product into one static snapshot so the
+# listing pages load a single file instead of one stats query per slug.
+#
+#   python export_review_stats_snapshot.py                  # one-off from Postgres
+#   python export_review_stats_snapshot.py --watch 60       # refresh when reviews change
+#   python export_review_stats_snapshot.py --source corpus  # from the generated reviews
+
+# Same filters as /api/product-reviews/stats/slug/:slug, but one grouped pass
+# over every product instead of one query per slug.
+STATS_QUERY = """
+    SELECT
+      p.id AS product_id,
+      p.slug,
+      COALESCE(AVG(pr.rating), 0) AS average_rating,
+      COUNT(pr.id) AS review_count,
+      COUNT(*) FILTER (WHERE pr.is_verified = true) AS verified_count,
+      COUNT(*) FILTER (WHERE pr.rating = 5) AS r5,
+      COUNT(*) FILTER (WHERE pr.rating = 4) AS r4,
+      COUNT(*) FILTER (WHERE pr.rating = 3) AS r3,
+      COUNT(*) FILTER (WHERE pr.rating = 2) AS r2,
+      COUNT(*) FILTER (WHERE pr.rating = 1) AS r1
+    FROM products p
+    LEFT JOIN product_reviews pr ON p.id = pr.product_id
+      AND pr.is_approved = true
+      AND (pr.status = 'approved' OR pr.status IS NULL)
+    WHERE p.slug IS NOT NULL AND p.slug != ''
+    GROUP BY p.id, p.slug
+"""
+
+# Cheap change detector used by --watch: any insert, edit or delete moves it.
+WATERMARK_QUERY = "SELECT COUNT(*), MAX(updated_at), MAX(id) FROM product_reviews"
+
+
+def stats_from_db(conn):
+    stats = {}
+    with conn.cursor() as cur:
+        cur.execute(STATS_QUERY)
+        for product_id, slug, avg, count, verified, r5, r4, r3, r2, r1 in cur:
+            stats[slug] = {
+                "product_id": product_id,
+                "slug": slug,
+                "average_rating": round(float(avg), 2),
+                "review_count": int(count),
+                "verified_count": int(verified),
+                "histogram": {"5": r5, "4": r4, "3": r3, "2": r2, "1": r1}
+            }
+    return stats
+
+
+def stats_from_corpus(products_path, reviews_path):
+    all_reviews = load_reviews(reviews_path)
+    stats = {}
+    for product in load_products(products_path):
+        slug = product['slug']
+        stats[slug] = {"product_id": None, "slug": slug, **review_stats(all_reviews.get(slug, []))}
+    return stats
+
+
+def current_version(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('version')
+
+
+def export(stats, source, out_path):
+    snapshot = build_stats_snapshot(stats, source)
+    if snapshot['version'] == current_version(out_path):
+        print(f"⏭️  Snapshot unchanged (version {snapshot['version']})")
+        return False
+
+    write_json_atomic(out_path, snapshot, separators=(',', ':'))
+    print(f"✅ Wrote {len(stats)} products to {out_path} (version {snapshot['version']})")
+    return True
+
+
+def watch(interval, out_path):
+    """Re-export whenever product_reviews changes, polling a watermark every `interval` seconds"""
+    conn = connect()
+    conn.autocommit = True
+    last_mark = None
+    print(f"👀 Watching product_reviews every {interval}s (Ctrl+C to stop)")
+    try:
+        while True:
+            with conn.cursor() as cur:
+                cur.execute(WATERMARK_QUERY)
+                mark = cur.fetchone()
+            if mark != last_mark:
+                export(stats_from_db(conn), 'postgres', out_path)
+                last_mark = mark
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the review stats snapshot for the storefront')
+    parser.add_argument('--source', choices=['db', 'corpus'], default='db')
+    parser.add_argument('--out', default=STATS_SNAPSHOT_PATH)
+    parser.add_argument('--products', default=PRODUCTS_PATH, help='catalog for --source corpus')
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH, help='review corpus for --source corpus')
+    parser.add_argument('--watch', type=int, metavar='SECONDS',
+                        help='keep running and re-export after product_reviews changes')
+    args = parser.parse_args()
+
+    if args.source == 'corpus':
+        export(stats_from_corpus(args.products, args.reviews), 'corpus', args.out)
+    elif args.watch:
+        watch(args.watch, args.out)
+    else:
+        conn = connect()
+        try:
+            export(stats_from_db(conn), 'postgres', args.out)
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    main()
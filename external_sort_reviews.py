@@ -0,0 +1,210 @@
+import argparse
+import csv
+import heapq
+import json
+import os
+import struct
+import sys
+import tempfile
+import time
+
+from generate_all_40_product_reviews import PRODUCTS_PATH, SEED, load_products
+from review_data import load_reviews, phrase_days
+from review_unrank import ReviewUnranker
+
+# External merge sort for review corpora that don't fit in memory.
+# Reviews are streamed in, buffered up to --memory-mb, sorted and spilled to
+# temporary run files in a compact binary encoding, then k-way merged with a
+# heap and streamed straight to the output writer. At most --fan-in runs are
+# open at once; beyond that, consecutive runs are merged into longer ones in
+# extra passes first.
+#
+#   python external_sort_reviews.py --per-product 500000 --order date --out reviews_by_date.jsonl
+#   python external_sort_reviews.py --reviews user-panel/src/utils/product_reviews.ts --order slug --format csv --out reviews.csv
+#
+# --order date sorts newest first across every slug; --order slug sorts by
+# slug, then newest first. Ties keep their input order.
+
+ORDERS = ['date', 'slug']
+FORMATS = ['jsonl', 'csv']
+
+# Run record: slug id, rating, days ago, then name/date/comment as
+# length-prefixed UTF-8. Slugs live in one table shared by every run. Lengths
+# are 32-bit so no comment or title is too long to spill.
+RECORD_HEADER = struct.Struct('<IBIIII')
+# Sorting buffers Python objects, not just bytes; this approximates the
+# per-record overhead on top of the encoded size when enforcing the cap
+RECORD_OVERHEAD = 120
+READ_BUFFER = 1 << 16
+# Run files open at once in a merge; well under the usual 1024 open-file limit
+MERGE_FAN_IN = 64
+
+
+def encode(slug_id, review):
+    name = review['name'].encode('utf-8')
+    date = review['date'].encode('utf-8')
+    comment = review['comment'].encode('utf-8')
+    header = RECORD_HEADER.pack(slug_id, int(review['rating']), phrase_days(review['date']),
+                                len(name), len(date), len(comment))
+    return header + name + date + comment
+
+
+def read_run(path):
+    """Yield (slug_id, days, record bytes) from a spilled run file"""
+    with open(path, 'rb', buffering=READ_BUFFER) as f:
+        while True:
+            header = f.read(RECORD_HEADER.size)
+            if not header:
+                return
+            slug_id, _, days, n_name, n_date, n_comment = RECORD_HEADER.unpack(header)
+            yield slug_id, days, header + f.read(n_name + n_date + n_comment)
+
+
+def decode(slugs, record):
+    slug_id, rating, _, n_name, n_date, n_comment = RECORD_HEADER.unpack_from(record)
+    offset = RECORD_HEADER.size
+    name = record[offset:offset + n_name].decode('utf-8')
+    offset += n_name
+    date = record[offset:offset + n_date].decode('utf-8')
+    offset += n_date
+    comment = record[offset:offset + n_comment].decode('utf-8')
+    return {"slug": slugs[slug_id], "name": name, "rating": rating, "date": date, "comment": comment}
+
+
+def sort_key(order, slug_rank):
+    if order == 'slug':
+        return lambda item: (slug_rank[item[0]], item[1])
+    return lambda item: item[1]
+
+
+def spill(items, key, tmp_dir, run_index):
+    items.sort(key=key)
+    path = os.path.join(tmp_dir, f"run-{run_index:05d}.bin")
+    with open(path, 'wb') as f:
+        f.writelines(record for _, _, record in items)
+    return path
+
+
+def merge_pass(runs, key, tmp_dir, fan_in):
+    """Merge each group of `fan_in` consecutive runs into one; consecutive keeps ties in input order"""
+    merged_runs = []
+    for start in range(0, len(runs), fan_in):
+        group = runs[start:start + fan_in]
+        if len(group) == 1:
+            merged_runs.append(group[0])
+            continue
+        path = os.path.join(tmp_dir, f"merge-{os.path.basename(group[0])}-{len(merged_runs):05d}.bin")
+        with open(path, 'wb') as f:
+            f.writelines(record for _, _, record in heapq.merge(*(read_run(run) for run in group), key=key))
+        for run in group:
+            os.remove(run)
+        merged_runs.append(path)
+    return merged_runs
+
+
+def external_sort(reviews, slugs, order, memory_bytes, tmp_dir, fan_in=MERGE_FAN_IN):
+    """Sort (slug_id, review) pairs under a memory cap; yields review dicts in order"""
+    slug_rank = {slug_id: rank for rank, slug_id in enumerate(sorted(range(len(slugs)), key=slugs.__getitem__))}
+    key = sort_key(order, slug_rank)
+
+    runs = []
+    buffered = []
+    buffered_bytes = 0
+    for slug_id, review in reviews:
+        record = encode(slug_id, review)
+        buffered.append((slug_id, phrase_days(review['date']), record))
+        buffered_bytes += len(record) + RECORD_OVERHEAD
+        if buffered_bytes >= memory_bytes:
+            runs.append(spill(buffered, key, tmp_dir, len(runs)))
+            buffered = []
+            buffered_bytes = 0
+
+    if runs and buffered:
+        runs.append(spill(buffered, key, tmp_dir, len(runs)))
+        buffered = []
+
+    print(f"🧮 {len(runs) or 'no'} spilled runs", file=sys.stderr)
+    passes = 0
+    while len(runs) > fan_in:
+        runs = merge_pass(runs, key, tmp_dir, fan_in)
+        passes += 1
+    if passes:
+        print(f"🔀 {passes} intermediate merge passes down to {len(runs)} runs", file=sys.stderr)
+    if runs:
+        # heapq.merge is a stable heap-based k-way merge; runs are in input
+        # order, so equal keys stay in input order too
+        merged = heapq.merge(*(read_run(path) for path in runs), key=key)
+    else:
+        buffered.sort(key=key)
+        merged = buffered
+    for _, _, record in merged:
+        yield decode(slugs, record)
+
+
+def unranked_reviews(products, seed, per_product):
+    for slug_id, product in enumerate(products):
+        unranker = ReviewUnranker(product, seed)
+        for k in range(per_product):
+            yield slug_id, unranker.review(k).to_dict()
+
+
+def corpus_reviews(all_product_reviews, slugs):
+    for slug_id, slug in enumerate(slugs):
+        for review in all_product_reviews[slug]:
+            yield slug_id, review
+
+
+def write_output(rows, fmt, f):
+    count = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(f, fieldnames=['slug', 'name', 'rating', 'date', 'comment'])
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sort a large review corpus by date or slug under a memory cap')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--reviews', help='generated corpus (.ts or .json) to sort')
+    source.add_argument('--per-product', type=int, help='generate this many reviews per product on the fly')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--order', choices=ORDERS, default='date')
+    parser.add_argument('--format', choices=FORMATS, default='jsonl')
+    parser.add_argument('--memory-mb', type=float, default=256, help='approximate cap for buffered records')
+    parser.add_argument('--tmp-dir', help='where to spill runs (default: system temp dir)')
+    parser.add_argument('--fan-in', type=int, default=MERGE_FAN_IN, help='most run files merged at once')
+    parser.add_argument('--out', required=True)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.reviews:
+        all_product_reviews = load_reviews(args.reviews)
+        slugs = list(all_product_reviews)
+        reviews = corpus_reviews(all_product_reviews, slugs)
+    else:
+        products = load_products(args.products)
+        slugs = [product.slug for product in products]
+        reviews = unranked_reviews(products, args.seed, args.per_product)
+
+    with tempfile.TemporaryDirectory(prefix='review-sort-', dir=args.tmp_dir) as tmp_dir:
+        rows = external_sort(reviews, slugs, args.order, int(args.memory_mb * 1024 * 1024), tmp_dir,
+                             max(2, args.fan_in))
+        newline = '' if args.format == 'csv' else None
+        with open(args.out, 'w', encoding='utf-8', newline=newline) as f:
+            count = write_output(rows, args.format, f)
+
+    print(f"✅ Sorted {count} reviews by {args.order} into {args.out} "
+          f"in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+import argparse
+import base64
+import json
+import re
+import time
+from functools import lru_cache
+
+from catalog_search import normalize
+from review_data import write_json_atomic
+
+# Static facet index for multi-facet filtering on Shop / Category, built by
+# extract_products_from_csv.py. Every product gets an ordinal (its position
+# in "slugs"), and every facet value is stored as a bitset over those
+# ordinals with its count precomputed:
+#
+#   {"size": 40, "slugs": ["<slug>", ...],
+#    "facets": {"suits": {"label": "Skin/Hair Type",
+#                         "values": [{"value": "skin:oily", "label": "Oily Skin",
+#                                     "count": 21, "bits": "<base64>"}, ...]}, ...}}
+#
+# Bitsets are base64 of little-endian 32-bit words, so the client decodes
+# each into a Uint32Array once. Values within a facet are ORed, facets are
+# ANDed, and the count of a value under the current filters is the popcount
+# of its bitset ANDed with the other facets' selections. filter_products()
+# and facet_counts() below are the reference that
+# user-panel/src/utils/catalogFacets.ts mirrors.
+#
+#   python facet_index.py --filter suits=skin:oily --filter price=500-800
+
+FACET_INDEX_PATH = 'user-panel/public/data/facet-index.json'
+FACET_SCHEMA_VERSION = 1
+
+FACET_LABELS = {
+    'suits': 'Skin/Hair Type',
+    'concern': 'Concern',
+    'ingredient': 'Ingredient',
+    'category': 'Category',
+    'sub_category': 'Product',
+    'badge': 'Badges',
+    'price': 'Price',
+}
+
+# Aprajita is the Hindi name the catalog gives Blue Tea ("Aprajita (Blue Tea)")
+INGREDIENT_ALIASES = {'Aprajita': 'Blue Tea'}
+
+# Upper bounds (₹) of the price bands
+PRICE_BANDS = [500, 800, 1100, 1500]
+
+# "Ingredient Benefits" is free text; a product is filed under a concern when
+# the text mentions one of its keywords
+CONCERN_KEYWORDS = {
+    'acne': ('Acne & Oil Control', ('acne', 'oil control', 'excess oil')),
+    'anti-aging': ('Anti-Aging', ('anti aging', 'fine lines', 'elasticity', 'firms', 'oxidative stress')),
+    'brightening': ('Brightening', ('brighten', 'glow', 'complexion', 'pigmentation', 'spots', 'tone', 'dull')),
+    'hydration': ('Hydration', ('hydrat', 'dryness', 'moistur')),
+    'exfoliation': ('Exfoliation', ('exfoliat', 'dead cells', 'texture')),
+    'detox': ('Detox & Pores', ('detox', 'purif', 'impurities', 'pores', 'clarif', 'buildup')),
+    'soothing': ('Soothing', ('sooth', 'calm')),
+    'hair-fall': ('Hair Fall & Growth', ('hair loss', 'hair fall', 'roots', 'growth', 'volume')),
+    'dandruff': ('Dandruff & Scalp', ('dandruff', 'scalp')),
+    'shine': ('Shine & Frizz', ('shine', 'frizz', 'smoothen')),
+}
+
+
+def price_band(price):
+    try:
+        value = float(price)
+    except (TypeError, ValueError):
+        return None
+    return next((i for i, bound in enumerate(PRICE_BANDS) if value < bound), len(PRICE_BANDS))
+
+
+def price_band_label(band):
+    if band == 0:
+        return f"under-{PRICE_BANDS[0]}", f"Under ₹{PRICE_BANDS[0]}"
+    if band == len(PRICE_BANDS):
+        return f"{PRICE_BANDS[-1]}-plus", f"₹{PRICE_BANDS[-1]}+"
+    low, high = PRICE_BANDS[band - 1], PRICE_BANDS[band]
+    return f"{low}-{high}", f"₹{low} – ₹{high}"
+
+
+def suits_tokens(text):
+    """'All Skin Types (dry, oily, combination)' -> {'skin:dry', 'skin:oily', ...}"""
+    text = (text or '').lower()
+    scope = 'hair' if 'hair' in text else 'skin'
+    inner = re.search(r'\(([^)]*)\)', text)
+    kinds = [k.strip() for k in inner.group(1).split(',')] if inner else []
+    return {f"{scope}:{kind}" for kind in kinds if kind} | {scope}
+
+
+def suits_label(token):
+    scope, _, kind = token.partition(':')
+    if not kind:
+        return f"All {scope.title()} Types"
+    return f"{kind.title()} {scope.title()}"
+
+
+def split_ingredients(pairs):
+    """{extracted ingredient: [facet ingredient, ...]} with joined entries split back apart
+
+    The extractor keeps "Saw Palmetto & Aprajita" as one ingredient when the
+    sheet lists them in one cell; peel trailing parts off while both sides are
+    ingredients in their own right, so "AHA & BHA" stays whole.
+    """
+    joined = {ingredient: re.split(r'\s*&\s*', ingredient) for _, product in pairs
+              for ingredient in product['ingredients']}
+    known = {' & '.join(parts) for parts in joined.values()}
+    names = {}
+    for ingredient, parts in joined.items():
+        split = len(parts)
+        while split > 1 and ' & '.join(parts[:split - 1]) in known and parts[split - 1] in known:
+            split -= 1
+        # parts[:split] is one ingredient ("AHA & BHA"), each later part one of its own
+        facet_names = [' & '.join(parts[:split])] + parts[split:]
+        names[ingredient] = [INGREDIENT_ALIASES.get(name, name) for name in facet_names]
+    return names
+
+
+@lru_cache(maxsize=None)
+def value_key(label):
+    return normalize(label).replace(' ', '-')
+
+
+@lru_cache(maxsize=None)
+def concerns(benefits):
+    """{concern: label} an "Ingredient Benefits" cell mentions; catalog rows repeat these a lot"""
+    text = f" {normalize(benefits)}"
+    return {key: label for key, (label, keywords) in CONCERN_KEYWORDS.items()
+            if any(f" {normalize(keyword)}" in text for keyword in keywords)}
+
+
+@lru_cache(maxsize=None)
+def display_name(text):
+    """'body Care' -> 'Body Care'"""
+    return normalize(text).title()
+
+
+def product_facets(row, product, ingredient_names):
+    """{facet: {value: label}} for one catalog row and its extracted product"""
+    facets = {facet: {} for facet in FACET_LABELS}
+
+    for token in suits_tokens(row.get('Skin/Hair Type')):
+        facets['suits'][token] = suits_label(token)
+
+    facets['concern'].update(concerns(row.get('Ingredient Benefits') or ''))
+
+    for ingredient in product['ingredients']:
+        for name in ingredient_names[ingredient]:
+            facets['ingredient'][value_key(name)] = name
+
+    # The sheet mixes "Body care" / "body Care"; sets list their parts ("Shampoo+Hair mask+ lotion")
+    category = display_name(row.get('Product Category') or '')
+    if category:
+        facets['category'][value_key(category)] = category
+    for part in (row.get('Product Sub-Category') or '').split('+'):
+        part = display_name(part)
+        if part:
+            facets['sub_category'][value_key(part)] = part
+
+    for badge in (row.get('Special Attributes (Badges)') or '').split('|'):
+        badge = badge.strip()
+        if badge:
+            facets['badge'][value_key(badge)] = badge
+
+    band = price_band(row.get('WEBSITE price'))
+    if band is not None:
+        key, label = price_band_label(band)
+        facets['price'][key] = label
+    return facets
+
+
+def encode_bits(ordinals, size):
+    """Base64 of the little-endian 32-bit words of a bitset with `ordinals` set"""
+    # Byte i holds ordinals 8i..8i+7, lowest bit first, which is also little-endian word order
+    bits = bytearray(4 * ((size + 31) // 32))
+    for ordinal in ordinals:
+        bits[ordinal >> 3] |= 1 << (ordinal & 7)
+    return base64.b64encode(bits).decode('ascii')
+
+
+def decode_bits(encoded):
+    return int.from_bytes(base64.b64decode(encoded), 'little')
+
+
+def build_facet_index(pairs):
+    """Index (catalog row, extracted product) pairs into the static facet file"""
+    members = {facet: {} for facet in FACET_LABELS}
+    labels = {facet: {} for facet in FACET_LABELS}
+    ingredient_names = split_ingredients(pairs)
+    for ordinal, (row, product) in enumerate(pairs):
+        for facet, values in product_facets(row, product, ingredient_names).items():
+            for value, label in values.items():
+                members[facet].setdefault(value, []).append(ordinal)
+                labels[facet].setdefault(value, label)
+
+    size = len(pairs)
+    facets = {}
+    for facet, facet_label in FACET_LABELS.items():
+        if facet == 'price':
+            # Bands read best in price order, everything else by how many products it narrows to
+            bands = [price_band_label(band)[0] for band in range(len(PRICE_BANDS) + 1)]
+            order = sorted(members[facet], key=bands.index)
+        else:
+            order = sorted(members[facet], key=lambda v: (-len(members[facet][v]), labels[facet][v]))
+        facets[facet] = {
+            "label": facet_label,
+            "values": [{
+                "value": value,
+                "label": labels[facet][value],
+                "count": len(members[facet][value]),
+                "bits": encode_bits(members[facet][value], size)
+            } for value in order]
+        }
+
+    return {
+        "schema_version": FACET_SCHEMA_VERSION,
+        "size": size,
+        "slugs": [product['slug'] for _, product in pairs],
+        "facets": facets
+    }
+
+
+def decode_index(index):
+    """{facet: {value: bitset int}} for the reference queries below"""
+    return {facet: {v['value']: decode_bits(v['bits']) for v in data['values']}
+            for facet, data in index['facets'].items()}
+
+
+def selection_bits(bitsets, selections, size, skip=None):
+    """Products matching every selected facet but `skip`: OR within a facet, AND across facets"""
+    matched = (1 << size) - 1
+    for facet, values in selections.items():
+        if facet == skip or not values:
+            continue
+        union = 0
+        for value in values:
+            union |= bitsets[facet].get(value, 0)
+        matched &= union
+    return matched
+
+
+def filter_products(index, selections, bitsets=None):
+    """Slugs matching {facet: [value, ...]}, in catalog order"""
+    bitsets = bitsets or decode_index(index)
+    matched = selection_bits(bitsets, selections, index['size'])
+    return [slug for ordinal, slug in enumerate(index['slugs']) if matched >> ordinal & 1]
+
+
+def facet_counts(index, selections, bitsets=None):
+    """{facet: {value: count}} under the current selections, each facet ignoring its own"""
+    bitsets = bitsets or decode_index(index)
+    counts = {}
+    for facet, values in bitsets.items():
+        others = selection_bits(bitsets, selections, index['size'], skip=facet)
+        counts[facet] = {value: (bits & others).bit_count() for value, bits in values.items()}
+    return counts
+
+
+def write_facet_index(index, path=FACET_INDEX_PATH):
+    write_json_atomic(path, index, separators=(',', ':'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the static facet index')
+    parser.add_argument('--filter', action='append', default=[], metavar='FACET=VALUE',
+                        help='repeat to combine; values of the same facet are ORed')
+    parser.add_argument('--index', default=FACET_INDEX_PATH)
+    args = parser.parse_args()
+
+    with open(args.index, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    selections = {}
+    for spec in args.filter:
+        facet, _, value = spec.partition('=')
+        if facet not in index['facets']:
+            raise SystemExit(f"❌ Unknown facet {facet!r}; one of: {', '.join(index['facets'])}")
+        selections.setdefault(facet, []).append(value)
+
+    started = time.perf_counter()
+    bitsets = decode_index(index)
+    decoded = time.perf_counter() - started
+    started = time.perf_counter()
+    slugs = filter_products(index, selections, bitsets)
+    counts = facet_counts(index, selections, bitsets)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    for facet, data in index['facets'].items():
+        shown = [f"{v['label']} ({counts[facet][v['value']]})" for v in data['values'] if counts[facet][v['value']]]
+        print(f"{data['label']:>15}: {', '.join(shown)}")
+    print()
+    for slug in slugs:
+        print(f"  {slug}")
+    print(f"\n⏱️  {len(slugs)} of {index['size']} products; decoded in {decoded * 1000:.3f} ms, "
+          f"filtered and counted in {elapsed:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,20 @@
+import argparse
 import random
 import json
 import re
+import textwrap
 
-random.seed(789)
+from catalog_cache import cached_products
+from review_locales import CATALOG_LOCALE_SHARDS_DIR, detect_language, write_locale_shards
+from review_records import Product, Review
 
-# Load products from extracted JSON
-with open('products_extracted.json', 'r', encoding='utf-8') as f:
-    products = json.load(f)
+SEED = 789
+PRODUCTS_PATH = 'products_extracted.json'
+TS_PATH = "user-panel/src/utils/product_reviews.ts"
 
-print(f"✅ Loaded {len(products)} products from CSV")
+# Higher ratings are more common
+RATINGS = [5, 4, 3, 2, 1]
+RATING_WEIGHTS = [55, 30, 8, 4, 3]
 
 # Clean up ingredient names (remove duplicates like "Blue Tea" and "Aprajita" when they're the same)
 def clean_ingredients(ingredients):
@@ -51,12 +57,24 @@ def clean_ingredients(ingredients):
     
     return cleaned[:5]  # Limit to 5 main ingredients
 
-# Clean ingredients for all products
-for product in products:
-    product['ingredients'] = clean_ingredients(product.get('ingredients', ['Blue Tea']))
-    # Normalize "Aprajita" to "Blue Tea" for consistency in reviews
-    product['ingredients'] = [ing.replace('Aprajita', 'Blue Tea') if 'Aprajita' in ing else ing for ing in product['ingredients']]
-    product['ingredients'] = [ing for ing in product['ingredients'] if ing.strip()]
+def normalize_ingredients(ingredients):
+    """Clean once and normalize "Aprajita" to "Blue Tea" for consistency in reviews"""
+    cleaned = clean_ingredients(ingredients)
+    cleaned = [ing.replace('Aprajita', 'Blue Tea') if 'Aprajita' in ing else ing for ing in cleaned]
+    return [ing for ing in cleaned if ing.strip()]
+
+def to_products(rows):
+    """Product records with cleaned ingredients from extracted product dicts"""
+    products = []
+    for row in rows:
+        row = dict(row, ingredients=normalize_ingredients(row.get('ingredients', ['Blue Tea'])))
+        products.append(Product.from_dict(row))
+    return products
+
+def load_products(path=PRODUCTS_PATH):
+    """Load products from extracted JSON as Product records with cleaned ingredients"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return to_products(json.load(f))
 
 # Female names (70%)
 female_names = [
@@ -81,7 +99,10 @@ male_names = [
 ]
 
 def rel_date_phrase():
-    days = random.randint(2, 365)
+    return date_phrase(random.randint(2, 365))
+
+def date_phrase(days):
+    """Relative date text for a review posted `days` ago"""
     if days <= 7:
         return f"{days} days ago" if days > 1 else "1 day ago"
     elif days < 30:
@@ -120,9 +141,9 @@ def get_ingredient_mention(ingredients):
 
 def get_comments_for_product(product):
     """Generate product-specific comments with ingredient mentions"""
-    category = product["category"]
-    ptype = product["type"]
-    ingredients = product.get("ingredients", ["Blue Tea"])
+    category = product.category
+    ptype = product.type
+    ingredients = product.ingredients or ("Blue Tea",)
     primary_ing = get_ingredient_mention(ingredients)
     
     # Build ingredient string for comments (2-3 ingredients max)
@@ -309,60 +330,74 @@ def get_comments_for_product(product):
     
     return comments_short, comments_long
 
-# Generate reviews for each product
-all_product_reviews = {}
+def tagged_review(name, rating, date, comment):
+    """Review record tagged with the comment's language, for runs that write locale shards"""
+    return Review(name, rating, date, comment, detect_language(comment))
 
-for product in products:
-    slug = product["slug"]
-    comments_short, comments_long = get_comments_for_product(product)
+def generate_review(comments_short, comments_long, make_review=Review):
+    """Draw the next review from the global RNG"""
+    # 70% female, 30% male
+    if random.random() < 0.7:
+        name = random.choice(female_names)
+    else:
+        name = random.choice(male_names)
     
-    # Generate 60-80 reviews per product
-    num_reviews = random.randint(60, 80)
-    product_reviews = []
+    # Higher ratings are more common
+    rating = random.choices(RATINGS, weights=RATING_WEIGHTS)[0]
+    date = rel_date_phrase()
     
-    for i in range(num_reviews):
-        # 70% female, 30% male
-        if random.random() < 0.7:
-            name = random.choice(female_names)
-        else:
-            name = random.choice(male_names)
-        
-        # Higher ratings are more common
-        rating = random.choices([5, 4, 3, 2, 1], weights=[55, 30, 8, 4, 3])[0]
-        date = rel_date_phrase()
-        
-        # Choose short or long comment
-        comment = random.choice(comments_long if random.random() > 0.4 else comments_short)
-        
-        # Sometimes add suffix (30% chance)
-        if random.random() < 0.3:
-            comment += " " + random.choice(suffixes)
-        
-        product_reviews.append({
-            "name": name,
-            "rating": rating,
-            "date": date,
-            "comment": comment
-        })
+    # Choose short or long comment
+    comment = random.choice(comments_long if random.random() > 0.4 else comments_short)
+    
+    # Sometimes add suffix (30% chance)
+    if random.random() < 0.3:
+        comment += " " + random.choice(suffixes)
     
-    all_product_reviews[slug] = product_reviews
-    print(f"Generated {num_reviews} reviews for {product['slug']} ({product['name'][:50]}...)")
+    return make_review(name, rating, date, comment)
 
-# Write TypeScript file
-ts_path = "user-panel/src/utils/product_reviews.ts"
-with open(ts_path, "w", encoding="utf-8") as f:
-    f.write("// Product Reviews Data\n")
-    f.write("// Generated reviews for all 40 NEFOL products - English/Hinglish only\n")
-    f.write("// Based on actual product ingredients from CSV\n\n")
-    f.write("export const productReviews = ")
+def generate_product_reviews(product, num_reviews, make_review=Review):
+    """Generate `num_reviews` reviews for one product"""
+    comments_short, comments_long = get_comments_for_product(product)
+    return [generate_review(comments_short, comments_long, make_review) for _ in range(num_reviews)]
+
+def generate_all_reviews(products, min_reviews=60, max_reviews=80, make_review=Review, verbose=True):
+    """Generate reviews for each product, keyed by slug"""
+    all_product_reviews = {}
+    
+    for product in products:
+        # Generate 60-80 reviews per product by default
+        num_reviews = random.randint(min_reviews, max_reviews)
+        all_product_reviews[product.slug] = generate_product_reviews(product, num_reviews, make_review)
+        if verbose:
+            print(f"Generated {num_reviews} reviews for {product.slug} ({product.name[:50]}...)")
     
-    # Convert to JS format with proper escaping
-    js_content = json.dumps(all_product_reviews, ensure_ascii=False, indent=2)
-    f.write(js_content)
-    f.write(";\n\n")
+    return all_product_reviews
+
+def write_reviews_json(f, all_product_reviews):
+    """Stream {slug: [review, ...]} as JSON, byte-identical to json.dumps(..., indent=2).
     
-    # Add helper functions
-    f.write("""// Helper function to get reviews for a product by slug
+    Records are converted to dicts one at a time here, at the serialization
+    boundary, so the whole corpus never exists as dicts at once.
+    """
+    if not all_product_reviews:
+        f.write("{}")
+        return
+    f.write("{\n")
+    for slug_index, (slug, reviews) in enumerate(all_product_reviews.items()):
+        f.write(f"  {json.dumps(slug, ensure_ascii=False)}: ")
+        if not reviews:
+            f.write("[]")
+        else:
+            f.write("[\n")
+            for review_index, review in enumerate(reviews):
+                f.write(textwrap.indent(json.dumps(review.to_dict(), ensure_ascii=False, indent=2), "    "))
+                f.write(",\n" if review_index < len(reviews) - 1 else "\n")
+            f.write("  ]")
+        f.write(",\n" if slug_index < len(all_product_reviews) - 1 else "\n")
+    f.write("}")
+
+# Helper functions appended after the data in the generated module
+TS_HELPERS = """// Helper function to get reviews for a product by slug
 // Import the cache function (using dynamic import to avoid circular dependencies)
 let getCachedReviewStats: ((slug: string) => { average_rating: number; review_count: number; verified_count: number }) | null = null
 
@@ -457,9 +492,51 @@ export function hasVerifiedReviews(slug: string): boolean {
   // Show badge if explicitly verified, or if product has reviews (practical for listing pages)
   return hasVerified || reviews.length > 0
 }
-""")
+"""
 
-print(f"\n✅ Generated reviews for {len(products)} products")
-print(f"📄 TypeScript file saved: {ts_path}")
-print(f"📊 Total reviews: {sum(len(v) for v in all_product_reviews.values())}")
+def write_typescript(all_product_reviews, ts_path=TS_PATH):
+    with open(ts_path, "w", encoding="utf-8") as f:
+        f.write("// Product Reviews Data\n")
+        f.write("// Generated reviews for all 40 NEFOL products - English/Hinglish only\n")
+        f.write("// Based on actual product ingredients from CSV\n\n")
+        f.write("export const productReviews = ")
+        write_reviews_json(f, all_product_reviews)
+        f.write(";\n\n")
+        
+        # Add helper functions
+        f.write(TS_HELPERS)
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate reviews for all catalog products')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--csv', help='extract products from this catalog CSV (via the catalog cache) '
+                                      'instead of reading --products')
+    parser.add_argument('--out', default=TS_PATH)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--min-reviews', type=int, default=60)
+    parser.add_argument('--max-reviews', type=int, default=80)
+    parser.add_argument('--locale-shards', metavar='DIR', nargs='?', const=CATALOG_LOCALE_SHARDS_DIR,
+                        help=f'also write per-locale review shards (default {CATALOG_LOCALE_SHARDS_DIR}; '
+                             f'keep them apart from the multilingual corpus in user-panel/public/data/reviews)')
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    
+    products = to_products(cached_products(args.csv)) if args.csv else load_products(args.products)
+    print(f"✅ Loaded {len(products)} products from CSV")
+    
+    # Only the locale shards need each review's language
+    make_review = tagged_review if args.locale_shards else Review
+    all_product_reviews = generate_all_reviews(products, args.min_reviews, args.max_reviews, make_review)
+    write_typescript(all_product_reviews, args.out)
+    if args.locale_shards:
+        index = write_locale_shards(all_product_reviews, args.locale_shards)
+        counts = ', '.join(f"{locale}: {info['reviews']}" for locale, info in index['locales'].items())
+        print(f"🌐 Locale shards saved to {args.locale_shards} ({counts})")
+    
+    print(f"\n✅ Generated reviews for {len(products)} products")
+    print(f"📄 TypeScript file saved: {args.out}")
+    print(f"📊 Total reviews: {sum(len(v) for v in all_product_reviews.values())}")
 
+if __name__ == '__main__':
+    main()
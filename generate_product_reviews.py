@@ -2,6 +2,8 @@ import random
 import json
 import datetime
 
+from review_locales import LOCALE_SHARDS_DIR, write_locale_shards
+
 random.seed(123)
 
 # Product list with categories
@@ -296,9 +298,14 @@ with open(js_path, "w", encoding="utf-8") as f:
     f.write("  return productReviews[slug] || [];\n")
     f.write("}\n")
 
+# Write per-locale shards so the storefront only loads the active language
+locale_index = write_locale_shards(all_product_reviews, LOCALE_SHARDS_DIR)
+
 print(f"\n✅ Generated reviews for {len(products)} products")
 print(f"📄 JSON file saved: {json_path}")
 print(f"📄 JS file saved: {js_path}")
+locale_counts = ', '.join(f"{locale}: {info['reviews']}" for locale, info in locale_index['locales'].items())
+print(f"🌐 Locale shards saved: {LOCALE_SHARDS_DIR} ({locale_counts})")
 
 total_reviews = sum(len(reviews) for reviews in all_product_reviews.values())
 print(f"📊 Total reviews generated: {total_reviews}")
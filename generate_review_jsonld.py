@@ -0,0 +1,97 @@
+import argparse
+import json
+import os
+
+from review_data import PRODUCTS_PATH, REVIEWS_TS_PATH, clean_name, load_products, load_reviews, review_stats
+
+# Precompute schema.org Product/AggregateRating/Review markup per slug so the
+# prerenderer or nginx can inline it instead of aggregating at render time.
+SITE_URL = 'https://thenefol.com'
+BRAND = 'NEFOL'
+
+
+def top_reviews(reviews, limit):
+    """Pick the most useful reviews: highest rating first, then longest text, no repeats"""
+    ranked = sorted(reviews, key=lambda r: (-int(r['rating']), -len(r['comment'])))
+    picked = []
+    seen = set()
+    for review in ranked:
+        if review['comment'] in seen:
+            continue
+        seen.add(review['comment'])
+        picked.append(review)
+        if len(picked) == limit:
+            break
+    return picked
+
+
+def build_jsonld(product, reviews, limit):
+    slug = product['slug']
+    stats = review_stats(reviews)
+    block = {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "name": clean_name(product['name']),
+        "url": f"{SITE_URL}/#/user/product/{slug}",
+        "brand": {"@type": "Brand", "name": BRAND},
+        "category": product.get('category', '')
+    }
+    if stats['review_count'] == 0:
+        return block
+
+    block["aggregateRating"] = {
+        "@type": "AggregateRating",
+        "ratingValue": stats['average_rating'],
+        "reviewCount": stats['review_count'],
+        "bestRating": 5,
+        "worstRating": 1
+    }
+    block["review"] = [
+        {
+            "@type": "Review",
+            "author": {"@type": "Person", "name": r['name']},
+            "reviewRating": {"@type": "Rating", "ratingValue": int(r['rating']), "bestRating": 5, "worstRating": 1},
+            "reviewBody": r['comment']
+        }
+        for r in top_reviews(reviews, limit)
+    ]
+    return block
+
+
+def script_tag(block):
+    # "<" is escaped so review text can never close the script element early
+    payload = json.dumps(block, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c')
+    return f'<script type="application/ld+json">{payload}</script>\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write per-product JSON-LD review snippets')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH)
+    parser.add_argument('--out', default='user-panel/public/seo/reviews')
+    parser.add_argument('--top', type=int, default=5, help='reviews to embed per product')
+    args = parser.parse_args()
+
+    products = load_products(args.products)
+    all_reviews = load_reviews(args.reviews)
+    os.makedirs(args.out, exist_ok=True)
+
+    for product in products:
+        slug = product['slug']
+        block = build_jsonld(product, all_reviews.get(slug, []), args.top)
+
+        with open(os.path.join(args.out, f"{slug}.json"), 'w', encoding='utf-8') as f:
+            json.dump(block, f, ensure_ascii=False, separators=(',', ':'))
+        # Ready-to-include fragment for nginx SSI / the prerenderer
+        with open(os.path.join(args.out, f"{slug}.html"), 'w', encoding='utf-8') as f:
+            f.write(script_tag(block))
+
+        rating = block.get('aggregateRating', {})
+        print(f"Wrote {slug} | {rating.get('ratingValue', 0)} from {rating.get('reviewCount', 0)} reviews")
+
+    print(f"\n✅ JSON-LD written for {len(products)} products")
+    print(f"📁 Output directory: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,340 @@
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from review_data import PRODUCTS_PATH, REVIEWS_TS_PATH, load_products, load_reviews
+from review_server import SERVER_NAME
+from seed_synthetic_world import LOADTEST_DOMAIN
+
+# Open-loop load generator for the review endpoints of a locally running backend.
+# Request mixes come from the generated catalog and review corpus:
+#   reviews       GET  /api/product-reviews/product/:productId  (Zipf-hot products)
+#   stats         GET  /api/product-reviews/stats/slug/:slug    (Zipf-hot products)
+#   burst         one stats request per product in a category, all at once,
+#                 like a Category/Shop page mounting 40+ cards
+#   testimonials  GET  /api/testimonials
+#   submit        POST /api/product-reviews with a review taken from the corpus,
+#                 as an @LOADTEST_DOMAIN customer so seed_synthetic_world.py --purge
+#                 removes it afterwards
+#
+#   python load_test_reviews.py --rps 200 --concurrency 64 --duration 60
+#
+# Every catalog slug must exist in /api/products (run sync_products_to_db.py
+# first). Against review_server.py, which only serves the review reads,
+# testimonials and submit are dropped from the mix.
+#
+# Latency is measured from the scheduled send time, so queueing behind the
+# concurrency limit shows up in the percentiles instead of being hidden.
+
+DEFAULT_MIX = "reviews=40,stats=30,burst=5,testimonials=20,submit=5"
+# Kinds whose routes the review_server.py stand-in doesn't have
+BACKEND_ONLY_KINDS = ('testimonials', 'submit')
+
+# Histogram bucket upper bounds in ms (roughly log-spaced)
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, math.inf]
+
+
+class HttpConnection:
+    """Minimal keep-alive HTTP/1.1 client, enough for the backend's JSON responses"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+        # Headers of the last response
+        self.headers = {}
+
+    async def request(self, method, path, body=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                "Connection: keep-alive", "Accept: application/json",
+                f"Content-Length: {len(payload)}"]
+        if body is not None:
+            head.append("Content-Type: application/json")
+        try:
+            self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + payload)
+            await self.writer.drain()
+            return await self._read_response()
+        except Exception:
+            self.close()
+            raise
+
+    async def _read_response(self):
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            data = b''.join(chunks)
+        else:
+            data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+
+        self.headers = headers
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class RequestMix:
+    """Turns the catalog + corpus into a stream of weighted request batches"""
+
+    def __init__(self, products, reviews, product_ids, mix, zipf_s, rng):
+        self.rng = rng
+        self.products = products
+        self.reviews = reviews
+        self.product_ids = product_ids
+        self.kinds, self.kind_weights = zip(*mix.items())
+
+        # Zipf popularity over a shuffled ranking so "hot" isn't just CSV order
+        ranked = products[:]
+        rng.shuffle(ranked)
+        self.hot = ranked
+        self.hot_weights = [1 / (rank ** zipf_s) for rank in range(1, len(ranked) + 1)]
+
+        self.by_category = defaultdict(list)
+        for product in products:
+            self.by_category[product['category']].append(product['slug'])
+        self.categories = sorted(self.by_category)
+        self.submitted = 0
+
+    def _hot_product(self):
+        return self.rng.choices(self.hot, weights=self.hot_weights)[0]
+
+    def next_batch(self):
+        """Return [(label, method, path, body), ...] for one simulated user action"""
+        kind = self.rng.choices(self.kinds, weights=self.kind_weights)[0]
+
+        if kind == 'reviews':
+            product = self._hot_product()
+            return [('reviews', 'GET', f"/api/product-reviews/product/{self.product_ids[product['slug']]}", None)]
+        if kind == 'stats':
+            product = self._hot_product()
+            return [('stats', 'GET', f"/api/product-reviews/stats/slug/{product['slug']}", None)]
+        if kind == 'burst':
+            category = self.rng.choice(self.categories)
+            return [('burst', 'GET', f"/api/product-reviews/stats/slug/{slug}", None)
+                    for slug in self.by_category[category]]
+        if kind == 'testimonials':
+            return [('testimonials', 'GET', '/api/testimonials', None)]
+
+        product = self._hot_product()
+        review = self.rng.choice(self.reviews.get(product['slug']) or [{"name": "Load Test", "rating": 5, "comment": "Great product!"}])
+        self.submitted += 1
+        body = {
+            "product_id": self.product_ids[product['slug']],
+            "customer_email": f"loadtest.{self.submitted}@{LOADTEST_DOMAIN}",
+            "customer_name": review['name'],
+            "rating": review['rating'],
+            "comment": review['comment']
+        }
+        return [('submit', 'POST', '/api/product-reviews', body)]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def record(self, label, latency_ms, status):
+        self.latencies[label].append(latency_ms)
+        self.statuses[label][status] += 1
+
+    def summary(self, elapsed):
+        report = {}
+        for label in sorted(self.latencies):
+            values = sorted(self.latencies[label])
+            statuses = self.statuses[label]
+            errors = sum(n for s, n in statuses.items() if not (isinstance(s, int) and 200 <= s < 300))
+            histogram = []
+            index = 0
+            for bound in BUCKETS_MS:
+                start = index
+                while index < len(values) and values[index] <= bound:
+                    index += 1
+                histogram.append([bound if bound != math.inf else 'inf', index - start])
+            report[label] = {
+                "requests": len(values),
+                "rps": round(len(values) / elapsed, 1),
+                "error_rate": round(errors / len(values), 4),
+                "statuses": {str(s): n for s, n in sorted(statuses.items(), key=lambda kv: str(kv[0]))},
+                "p50_ms": round(percentile(values, 50), 2),
+                "p90_ms": round(percentile(values, 90), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+                "max_ms": round(values[-1], 2),
+                "histogram_ms": histogram
+            }
+        return report
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        kind, _, weight = part.partition('=')
+        kind = kind.strip()
+        if kind not in ('reviews', 'stats', 'burst', 'testimonials', 'submit'):
+            raise SystemExit(f"❌ Unknown request kind in --mix: {kind}")
+        mix[kind] = float(weight)
+    return {k: w for k, w in mix.items() if w > 0}
+
+
+async def resolve_product_ids(conn, products):
+    """Map slugs to backend product ids via /api/products"""
+    try:
+        status, data = await conn.request('GET', '/api/products')
+    except OSError as e:
+        raise SystemExit(f"❌ Could not reach /api/products: {e}")
+    try:
+        rows = json.loads(data) if status == 200 else []
+    except ValueError:
+        rows = []
+    ids = {row['slug']: row['id'] for row in rows if row.get('slug')}
+
+    # Reads of made-up ids would be fast empty 200s and writes would fail the
+    # foreign key, so the latencies would be meaningless
+    missing = [p['slug'] for p in products if p['slug'] not in ids]
+    if missing:
+        raise SystemExit(f"❌ {len(missing)} catalog slugs not found in /api/products "
+                         f"(run sync_products_to_db.py first): {', '.join(missing)}")
+    return ids
+
+
+async def run(args):
+    url = urlsplit(args.base_url)
+    host, port = url.hostname, url.port or 80
+    rng = random.Random(args.seed)
+
+    products = load_products(args.products)
+    reviews = load_reviews(args.reviews)
+    mix = parse_mix(args.mix)
+    if args.no_writes:
+        mix.pop('submit', None)
+
+    probe = HttpConnection(host, port)
+    product_ids = await resolve_product_ids(probe, products)
+    probe.close()
+    if probe.headers.get('server') == SERVER_NAME:
+        dropped = [kind for kind in BACKEND_ONLY_KINDS if mix.pop(kind, None)]
+        if dropped:
+            print(f"ℹ️  {SERVER_NAME} has no {'/'.join(dropped)} routes, dropped them from the mix")
+    if not mix:
+        raise SystemExit("❌ Nothing left in --mix to send")
+
+    request_mix = RequestMix(products, reviews, product_ids, mix, args.zipf, rng)
+    recorder = Recorder()
+    connections = asyncio.Queue()
+    for _ in range(args.concurrency):
+        connections.put_nowait(HttpConnection(host, port))
+
+    async def send(label, method, path, body, scheduled):
+        conn = await connections.get()
+        try:
+            status, _ = await asyncio.wait_for(conn.request(method, path, body), args.timeout)
+        except asyncio.TimeoutError:
+            conn.close()
+            status = 'timeout'
+        except (OSError, EOFError, ValueError) as e:
+            status = type(e).__name__
+        finally:
+            connections.put_nowait(conn)
+        recorder.record(label, (time.perf_counter() - scheduled) * 1000, status)
+
+    print(f"🚀 {args.rps} actions/s for {args.duration}s, concurrency {args.concurrency}, mix {mix}")
+    tasks = set()
+    start = time.perf_counter()
+    next_at = start
+    while next_at - start < args.duration:
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        for label, method, path, body in request_mix.next_batch():
+            task = asyncio.create_task(send(label, method, path, body, next_at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        # Poisson arrivals: exponential gaps averaging 1/rps
+        next_at += rng.expovariate(args.rps)
+
+    if tasks:
+        await asyncio.wait(tasks)
+    elapsed = time.perf_counter() - start
+    while not connections.empty():
+        connections.get_nowait().close()
+    return recorder.summary(elapsed), elapsed
+
+
+def print_report(report, elapsed):
+    print(f"\n📊 Results over {elapsed:.1f}s")
+    print(f"{'endpoint':<14}{'reqs':>8}{'rps':>8}{'err%':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+    for label, row in report.items():
+        print(f"{label:<14}{row['requests']:>8}{row['rps']:>8}{row['error_rate'] * 100:>7.1f}%"
+              f"{row['p50_ms']:>9.1f}{row['p90_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}")
+    for label, row in report.items():
+        buckets = '  '.join(f"≤{bound}:{count}" for bound, count in row['histogram_ms'] if count)
+        print(f"  {label} ms histogram: {buckets}")
+        if row['error_rate']:
+            print(f"  {label} statuses: {row['statuses']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the review endpoints of a local backend')
+    parser.add_argument('--base-url', default='http://localhost:2000')
+    parser.add_argument('--rps', type=float, default=50, help='target user actions per second')
+    parser.add_argument('--concurrency', type=int, default=32, help='max in-flight requests')
+    parser.add_argument('--duration', type=float, default=30, help='seconds to generate load')
+    parser.add_argument('--timeout', type=float, default=10, help='per-request timeout in seconds')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'weighted request kinds (default: {DEFAULT_MIX})')
+    parser.add_argument('--zipf', type=float, default=1.1, help='skew of product popularity')
+    parser.add_argument('--no-writes', action='store_true', help='skip review submissions')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH)
+    parser.add_argument('--json-out', help='also write the report as JSON')
+    args = parser.parse_args()
+
+    report, elapsed = asyncio.run(run(args))
+    print_report(report, elapsed)
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump({"elapsed_s": round(elapsed, 2), "endpoints": report}, f, indent=2)
+        print(f"\n💾 Report saved to {args.json_out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+import argparse
+import os
+from html import escape
+
+from review_data import PRODUCTS_PATH, REVIEWS_TS_PATH, load_products, load_reviews, review_stats
+
+# Static HTML for the Customer Reviews section of each product page, so the
+# prerenderer or nginx can inline it and the rating summary and first reviews
+# paint before the JS bundle (and the big review module) loads.
+#
+#   python prerender_review_fragments.py
+#   python prerender_review_fragments.py --page-size 10 --out /tmp/fragments
+#
+# The markup is a static copy of the Customer Reviews section in
+# user-panel/src/pages/Product.tsx: the same elements and Tailwind classes,
+# including the header row with its "Write a review" / "Ask a question"
+# buttons (inert until React mounts) and "Load More". Changes to that section
+# need the same change here, or the swap on mount will shift the layout.
+# All review text is HTML-escaped, attributes included.
+
+FRAGMENTS_DIR = 'user-panel/public/prerender/reviews'
+# Product.tsx shows 5 reviews before "Load More"
+PAGE_SIZE = 5
+
+STAR_PATH = ('M9.049 2.927c.3-.921 1.603-.921 1.902 0l1.07 3.292a1 1 0 00.95.69h3.462c.969 0 1.371 1.24.588 '
+             '1.81l-2.8 2.034a1 1 0 00-.364 1.118l1.07 3.292c.3.921-.755 1.688-1.54 1.118l-2.8-2.034a1 1 0 '
+             '00-1.175 0l-2.8 2.034c-.784.57-1.838-.197-1.539-1.118l1.07-3.292a1 1 0 00-.364-1.118L2.98 '
+             '8.72c-.783-.57-.38-1.81.588-1.81h3.461a1 1 0 00.951-.69l1.07-3.292z')
+# The star path is defined once per fragment and referenced by every star
+STAR_SYMBOL = (f'<svg width="0" height="0" style="position:absolute" aria-hidden="true">'
+               f'<symbol id="review-star" viewBox="0 0 20 20"><path d="{STAR_PATH}"/></symbol></svg>')
+
+
+def js_round(value):
+    """Math.round, which rounds .5 up where Python's round() goes to even"""
+    return int(value + 0.5)
+
+
+def stars(rating, size, half=False):
+    parts = []
+    for i in range(5):
+        if i < (js_round(rating) if half else rating):
+            state = 'fill-current'
+        elif half and i < rating < i + 1:
+            state = 'fill-current opacity-50'
+        else:
+            state = 'text-gray-300'
+        parts.append(f'<svg class="{size} {state}" viewBox="0 0 20 20"><use href="#review-star"/></svg>')
+    return f'<div class="flex text-yellow-400" aria-hidden="true">{"".join(parts)}</div>'
+
+
+VERIFIED_BADGE = ('<span class="inline-flex items-center justify-center ml-1" title="Verified Purchase">'
+                  '<svg class="w-3 h-3" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">'
+                  '<circle cx="12" cy="12" r="10" fill="#0095F6"/><path d="M8 12L10.5 14.5L16 9" stroke="white" '
+                  'stroke-width="2" stroke-linecap="round" stroke-linejoin="round" fill="none"/></svg></span>')
+
+
+def header_html(stats):
+    count = stats['review_count']
+    average = stats['average_rating']
+    plural = '' if count == 1 else 's'
+    return (f'<div class="flex items-center justify-between mb-8"><div class="flex items-center space-x-4">'
+            f'{stars(average, "h-5 w-5", half=True)}'
+            f'<span class="text-lg font-semibold text-gray-900">{average:.2f} out of 5</span>'
+            f'<span class="text-sm text-gray-600">Based on {count} review{plural}</span></div>'
+            f'<div class="flex space-x-2">'
+            f'<button type="button" class="px-4 py-2 bg-gray-900 text-white text-sm font-medium rounded-md '
+            f'hover:bg-gray-800 transition-colors">Write a review</button>'
+            f'<button type="button" class="px-4 py-2 border border-gray-300 text-gray-900 text-sm font-medium '
+            f'rounded-md hover:bg-gray-50 transition-colors">Ask a question</button></div></div>')
+
+
+def review_html(review):
+    name = review['name']
+    featured = review.get('isFeatured')
+    border = 'border-yellow-300 bg-yellow-50' if featured else 'border-gray-200'
+    badges = VERIFIED_BADGE if review.get('isVerified') else ''
+    if featured:
+        badges += '<span class="text-xs bg-yellow-100 text-yellow-700 px-2 py-0.5 rounded">Featured</span>'
+    title = f'<h5 class="font-semibold text-gray-900 mb-1">{escape(review["title"])}</h5>' if review.get('title') else ''
+    return (f'<div class="p-4 border rounded-lg {border}">'
+            f'<div class="flex items-center justify-between mb-2"><div class="flex items-center space-x-2">'
+            f'<div class="h-8 w-8 rounded-full bg-gray-200 flex items-center justify-center">'
+            f'<span class="text-sm font-semibold text-gray-600">{escape(name[:1].upper())}</span></div>'
+            f'<div><div class="flex items-center gap-2"><h4 class="font-semibold text-gray-900">{escape(name)}</h4>{badges}</div>'
+            f'{stars(int(review.get("rating") or 0), "h-4 w-4")}</div></div>'
+            f'<span class="text-sm text-gray-600">{escape(review["date"])}</span></div>'
+            f'{title}<p class="text-gray-700">{escape(review["comment"])}</p></div>')
+
+
+def build_fragment(slug, reviews, page_size):
+    stats = review_stats(reviews)
+    if reviews:
+        listing = "".join(review_html(r) for r in reviews[:page_size])
+    else:
+        listing = '<p class="text-gray-600 text-center py-8">No reviews yet. Be the first to review this product!</p>'
+    load_more = ''
+    if len(reviews) > page_size:
+        load_more = ('<div class="text-center mt-8"><button type="button" class="px-6 py-2 bg-gray-900 text-white '
+                     'font-medium rounded-md hover:bg-gray-800 transition-colors">Load More</button></div>')
+    return (f'<section class="border-t border-gray-200 pt-12 mb-16" data-prerendered="reviews" '
+            f'data-slug="{escape(slug)}" data-review-count="{stats["review_count"]}" data-page-size="{page_size}">'
+            f'<h2 class="text-2xl font-bold text-gray-900 text-center mb-8">Customer Reviews</h2>'
+            f'{STAR_SYMBOL}{header_html(stats)}<div class="space-y-4">{listing}</div>{load_more}</section>\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write prerendered HTML review fragments per product')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH)
+    parser.add_argument('--out', default=FRAGMENTS_DIR)
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE, help='reviews in the first page')
+    args = parser.parse_args()
+
+    products = load_products(args.products)
+    all_reviews = load_reviews(args.reviews)
+    os.makedirs(args.out, exist_ok=True)
+
+    total_bytes = 0
+    for product in products:
+        slug = product['slug']
+        fragment = build_fragment(slug, all_reviews.get(slug, []), args.page_size)
+        path = os.path.join(args.out, f"{slug}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(fragment)
+        total_bytes += len(fragment.encode('utf-8'))
+
+    print(f"✅ Review fragments written for {len(products)} products ({total_bytes} bytes)")
+    print(f"📁 Output directory: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import math
+import time
+
+from catalog_cache import cached_rows
+from extract_products_from_csv import CSV_PATH
+from facet_index import PRICE_BANDS, price_band, suits_tokens
+from generate_all_40_product_reviews import PRODUCTS_PATH, load_products
+from review_data import write_json_atomic
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Precomputed "related products" for RelatedProductsCarousel / RecentlyViewed.
+# Each product becomes a sparse weighted feature vector (ingredients, category,
+# type, price band, skin/hair type), stored as per-feature postings; cosine
+# similarity is accumulated with NumPy one block of rows at a time, from only
+# the features two products share, and the top-k neighbours per slug are
+# written out, so
+# the storefront does a single lookup instead of scoring at request time:
+#
+#   {"k": 8, "related": {"<slug>": [["<slug>", 0.83], ...]}}
+
+RELATED_PATH = 'user-panel/public/data/related-products.json'
+TOP_K = 8
+
+# Relative importance of each feature group
+GROUP_WEIGHTS = {'ingredient': 1.0, 'category': 1.0, 'type': 0.8, 'price': 0.5, 'suits': 0.5}
+# Neighbouring price bands count as half a match
+NEIGHBOUR_BAND_WEIGHT = 0.5
+# Similarity scores held at once (~128 MB of float32); a block covers
+# BLOCK_CELLS // n rows, so memory stays flat however large the catalog gets
+BLOCK_CELLS = 32 * 1024 * 1024
+
+
+def product_features(product, row):
+    """Sparse {feature: weight} for one product, before IDF and normalization"""
+    features = {}
+    for ingredient in product.ingredients:
+        features[f"ingredient:{ingredient.lower()}"] = GROUP_WEIGHTS['ingredient']
+    features[f"category:{product.category}"] = GROUP_WEIGHTS['category']
+    features[f"type:{product.type}"] = GROUP_WEIGHTS['type']
+
+    band = price_band(row.get('WEBSITE price')) if row else None
+    if band is not None:
+        features[f"price:{band}"] = GROUP_WEIGHTS['price']
+        for neighbour in (band - 1, band + 1):
+            if 0 <= neighbour <= len(PRICE_BANDS):
+                features[f"price:{neighbour}"] = GROUP_WEIGHTS['price'] * NEIGHBOUR_BAND_WEIGHT
+
+    if row:
+        tokens = suits_tokens(row.get('Skin/Hair Type'))
+        for token in tokens:
+            features[f"suits:{token}"] = GROUP_WEIGHTS['suits'] / math.sqrt(len(tokens))
+    return features
+
+
+def sparse_features(feature_dicts):
+    """Per-feature postings (row indices, weights) with IDF and row normalization applied
+
+    IDF makes ubiquitous features (Blue Tea) count less. Only the non-zero
+    weights are kept, so memory grows with the number of features products
+    actually have, not with products x vocabulary.
+    """
+    columns = {}
+    for i, features in enumerate(feature_dicts):
+        for name, weight in features.items():
+            rows, weights = columns.setdefault(name, ([], []))
+            rows.append(i)
+            weights.append(weight)
+
+    n = len(feature_dicts)
+    squared_norms = np.zeros(n, dtype=np.float64)
+    postings = []
+    for rows, weights in columns.values():
+        rows = np.asarray(rows, dtype=np.int64)
+        weights = np.asarray(weights, dtype=np.float64) * (np.log((1 + n) / (1 + len(rows))) + 1)
+        np.add.at(squared_norms, rows, weights ** 2)
+        postings.append((rows, weights))
+
+    norms = np.sqrt(squared_norms)
+    norms[norms == 0] = 1
+    return [(rows, (weights / norms[rows]).astype(np.float32)) for rows, weights in postings]
+
+
+def top_k_related(postings, n, k):
+    """(indices, scores) of the k most similar other rows, best first"""
+    # With fewer than two products there is nothing to relate
+    k = max(0, min(k, n - 1))
+    indices = np.empty((n, k), dtype=np.int64)
+    scores = np.empty((n, k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+    block_rows = max(1, BLOCK_CELLS // max(n, 1))
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        # Cosine similarity of the block's rows against everything, one shared feature at a time
+        block = np.zeros((stop - start, n), dtype=np.float32)
+        for rows, weights in postings:
+            lo, hi = np.searchsorted(rows, (start, stop))
+            if lo < hi:
+                block[np.ix_(rows[lo:hi] - start, rows)] += np.outer(weights[lo:hi], weights)
+        block[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        candidates = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(block, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind='stable')
+        indices[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        scores[start:stop] = np.take_along_axis(candidate_scores, order, axis=1)
+    return indices, scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute top-k related products for the storefront')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--csv', default=CSV_PATH)
+    parser.add_argument('--out', default=RELATED_PATH)
+    parser.add_argument('-k', type=int, default=TOP_K)
+    args = parser.parse_args()
+
+    if np is None:
+        raise SystemExit("❌ numpy is required: pip install numpy")
+
+    started = time.perf_counter()
+    products = load_products(args.products)
+    rows_by_slug = {row.get('Slug'): row for row in cached_rows(args.csv)}
+    postings = sparse_features([product_features(p, rows_by_slug.get(p.slug)) for p in products])
+    indices, scores = top_k_related(postings, len(products), args.k)
+
+    # Products sharing no feature score 0 and aren't related at all, so a list can be shorter than k
+    related = {
+        product.slug: [[products[j].slug, round(float(score), 3)] for j, score in zip(indices[i], scores[i]) if score > 0]
+        for i, product in enumerate(products)
+    }
+    write_json_atomic(args.out, {"k": indices.shape[1], "related": related}, separators=(',', ':'))
+    print(f"✅ {len(products)} products x {len(postings)} features -> top {indices.shape[1]} related "
+          f"in {time.perf_counter() - started:.2f}s, saved to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
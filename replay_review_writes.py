@@ -0,0 +1,392 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import struct
+import time
+from urllib.parse import urlsplit
+
+from load_test_reviews import HttpConnection, Recorder, percentile, resolve_product_ids
+from review_data import PRODUCTS_PATH, REVIEWS_TS_PATH, load_products, load_reviews, phrase_days
+from seed_synthetic_world import LOADTEST_DOMAIN
+
+# Timed replay of the generated review corpus against POST /api/product-reviews
+# on a locally running backend, with websocket subscribers listening for the
+# broadcasts that follow every insert:
+#   admins  join-admin         -> 'update' {type: 'product_reviews_created'}
+#   users   join-users-room    -> 'product-reviews-created'
+#
+#   python replay_review_writes.py --rate 50 --duration 30 --subscribers 200 --admins 5
+#   python replay_review_writes.py --ramp 25,50,100,200,400 --duration 15   # find the ceiling
+#   python replay_review_writes.py --arrivals recorded --speedup 86400      # a corpus day per second
+#
+# Arrivals are open-loop: Poisson at --rate, or the corpus' own review dates
+# compressed by --speedup. Reported per stage: insert latency (scheduled send
+# to response), fan-out delay (scheduled send to receipt, per subscriber) and
+# delivery ratio. Reviews are posted as @LOADTEST_DOMAIN customers, so
+# `python seed_synthetic_world.py --purge` removes them afterwards.
+#
+# Subscribers share this process's event loop. Past a few tens of thousands of
+# deliveries per second the client becomes the bottleneck, so compare with a
+# --subscribers 0 run before blaming the backend.
+
+# Time for the server to process the room joins before the first write
+SUBSCRIBE_SETTLE_S = 1.0
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+USER_EVENT = 'product-reviews-created'
+ADMIN_EVENT_TYPE = 'product_reviews_created'
+
+
+class SocketIOSubscriber:
+    """Minimal Socket.IO v4 (Engine.IO 4) client over a raw websocket that joins
+    a room and reports review broadcasts to `on_review(role, review)`"""
+
+    def __init__(self, host, port, role, on_review):
+        self.host = host
+        self.port = port
+        self.role = role
+        self.on_review = on_review
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        head = ["GET /socket.io/?EIO=4&transport=websocket HTTP/1.1", f"Host: {self.host}:{self.port}",
+                "Upgrade: websocket", "Connection: Upgrade", f"Sec-WebSocket-Key: {key}",
+                "Sec-WebSocket-Version: 13"]
+        self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1'))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode('ascii')).digest()).decode('ascii')
+        if b' 101 ' not in status_line or headers.get('sec-websocket-accept') != accept:
+            raise ConnectionError(f"websocket upgrade refused: {status_line.decode('latin-1').strip()}")
+
+        # Engine.IO open packet, then connect to the default namespace and join the room
+        if not (await self.receive()).startswith('0'):
+            raise ConnectionError("expected an Engine.IO open packet")
+        await self.send('40')
+        while not (await self.receive()).startswith('40'):
+            pass
+        await self.send('42' + json.dumps(['join-admin' if self.role == 'admin' else 'join-users-room']))
+
+    async def listen(self):
+        try:
+            while True:
+                packet = await self.receive()
+                if packet == '2':
+                    await self.send('3')
+                elif packet.startswith('42'):
+                    received = time.perf_counter()
+                    event, *data = json.loads(packet[2:])
+                    if self.role == 'user' and event == USER_EVENT and data:
+                        self.on_review(self.role, data[0], received)
+                    elif self.role == 'admin' and event == 'update' and data and data[0].get('type') == ADMIN_EVENT_TYPE:
+                        self.on_review(self.role, data[0].get('data') or {}, received)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+    async def receive(self):
+        """Next complete text message, answering websocket pings on the way"""
+        parts = []
+        while True:
+            first, second = await self.reader.readexactly(2)
+            opcode, length = first & 0x0F, second & 0x7F
+            if length == 126:
+                length = struct.unpack('!H', await self.reader.readexactly(2))[0]
+            elif length == 127:
+                length = struct.unpack('!Q', await self.reader.readexactly(8))[0]
+            payload = await self.reader.readexactly(length)
+            if opcode == 0x8:
+                raise ConnectionError("websocket closed by server")
+            if opcode == 0x9:
+                await self.send_frame(0xA, payload)
+                continue
+            if opcode in (0x0, 0x1, 0x2):
+                parts.append(payload)
+                if first & 0x80:
+                    return b''.join(parts).decode('utf-8')
+
+    async def send(self, text):
+        await self.send_frame(0x1, text.encode('utf-8'))
+
+    async def send_frame(self, opcode, payload):
+        # Client frames must be masked
+        mask = os.urandom(4)
+        length = len(payload)
+        if length < 126:
+            head = struct.pack('!BB', 0x80 | opcode, 0x80 | length)
+        elif length < 1 << 16:
+            head = struct.pack('!BBH', 0x80 | opcode, 0x80 | 126, length)
+        else:
+            head = struct.pack('!BBQ', 0x80 | opcode, 0x80 | 127, length)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self.writer.write(head + mask + masked)
+        await self.writer.drain()
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def corpus_events(reviews, rng):
+    """[(slug, review), ...] for the whole corpus in a seeded random order"""
+    events = [(slug, review) for slug, slug_reviews in reviews.items() for review in slug_reviews]
+    rng.shuffle(events)
+    return events
+
+
+def poisson_schedule(events, rate, duration, rng):
+    """(offset_s, slug, review) with exponential gaps averaging 1/rate, cycling the corpus"""
+    schedule = []
+    offset = 0.0
+    while True:
+        offset += rng.expovariate(rate)
+        if offset >= duration:
+            return schedule
+        slug, review = events[len(schedule) % len(events)]
+        schedule.append((offset, slug, review))
+
+
+def recorded_schedule(events, speedup, duration, rng):
+    """(offset_s, slug, review) following the corpus' relative review dates, oldest
+    first, with each day's reviews spread across it, compressed by `speedup`"""
+    oldest = max(phrase_days(review['date']) for _, review in events)
+    timed = sorted((((oldest - phrase_days(review['date'])) * 86400 + rng.uniform(0, 86400), slug, review)
+                    for slug, review in events), key=lambda event: event[0])
+    return [(offset / speedup, slug, review) for offset, slug, review in timed if offset / speedup < duration]
+
+
+class Stage:
+    """Results of one arrival stage: insert latency plus per-role fan-out"""
+
+    def __init__(self, label, offered_rate):
+        self.label = label
+        self.offered_rate = offered_rate
+        self.recorder = Recorder()
+        self.created = 0
+        self.elapsed = 0.0
+
+
+class Replay:
+    def __init__(self, args, product_ids):
+        self.args = args
+        self.product_ids = product_ids
+        self.run_id = f"{int(time.time()):x}"
+        self.sent = {}
+        self.subscribers = {'user': args.subscribers, 'admin': args.admins}
+        self.count = 0
+
+    def body(self, slug, review):
+        self.count += 1
+        return {
+            "product_id": self.product_ids[slug],
+            "customer_email": f"replay.{self.run_id}.{self.count}@{LOADTEST_DOMAIN}",
+            "customer_name": review['name'],
+            "rating": int(review['rating']),
+            "comment": review['comment']
+        }
+
+    def on_review(self, role, review, received):
+        sent = self.sent.get(review.get('customer_email'))
+        if sent is not None:
+            stage, scheduled = sent
+            stage.recorder.record(f"fanout:{role}", (received - scheduled) * 1000, 'delivered')
+
+    async def run_stage(self, stage, schedule, connections):
+        async def post(body, scheduled):
+            conn = await connections.get()
+            try:
+                status, _ = await asyncio.wait_for(conn.request('POST', '/api/product-reviews', body), self.args.timeout)
+            except asyncio.TimeoutError:
+                conn.close()
+                status = 'timeout'
+            except (OSError, EOFError, ValueError) as e:
+                status = type(e).__name__
+            finally:
+                connections.put_nowait(conn)
+            stage.recorder.record('insert', (time.perf_counter() - scheduled) * 1000, status)
+            if status == 201:
+                stage.created += 1
+
+        tasks = set()
+        start = time.perf_counter()
+        for offset, slug, review in schedule:
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            body = self.body(slug, review)
+            # Registered before sending: the broadcast can beat the HTTP response
+            self.sent[body['customer_email']] = (stage, scheduled)
+            task = asyncio.create_task(post(body, scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.wait(tasks)
+        stage.elapsed = time.perf_counter() - start
+        # Late broadcasts still count towards this stage
+        await asyncio.sleep(self.args.drain)
+
+    def stage_report(self, stage):
+        report = stage.recorder.summary(max(stage.elapsed, 1e-9))
+        insert = report.get('insert', {})
+        row = {
+            "stage": stage.label,
+            "offered_rps": round(stage.offered_rate, 1),
+            "writes": insert.get('requests', 0),
+            "created": stage.created,
+            "achieved_rps": round(stage.created / stage.elapsed, 1) if stage.elapsed else 0,
+            "error_rate": insert.get('error_rate', 0),
+            "insert": {k: insert.get(k) for k in ('p50_ms', 'p90_ms', 'p99_ms', 'max_ms', 'statuses')},
+            "fanout": {}
+        }
+        for role, subscribers in self.subscribers.items():
+            if not subscribers:
+                continue
+            values = sorted(stage.recorder.latencies.get(f"fanout:{role}", []))
+            expected = stage.created * subscribers
+            row["fanout"][role] = {
+                "subscribers": subscribers,
+                "delivered": len(values),
+                "delivery_ratio": round(len(values) / expected, 4) if expected else 0,
+                "p50_ms": round(percentile(values, 50), 2),
+                "p90_ms": round(percentile(values, 90), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+                "max_ms": round(values[-1], 2) if values else 0
+            }
+        return row
+
+
+def ceiling(rows):
+    """Highest stage that kept up: >= 95% of the offered rate, < 1% errors, every broadcast delivered"""
+    sustained = [row for row in rows
+                 if row['achieved_rps'] >= 0.95 * row['offered_rps'] and row['error_rate'] < 0.01
+                 and all(f['delivery_ratio'] >= 0.999 for f in row['fanout'].values())]
+    return max(sustained, key=lambda row: row['achieved_rps']) if sustained else None
+
+
+async def run(args):
+    url = urlsplit(args.base_url)
+    host, port = url.hostname, url.port or 80
+    rng = random.Random(args.seed)
+
+    products = load_products(args.products)
+    reviews = load_reviews(args.reviews)
+    probe = HttpConnection(host, port)
+    product_ids = await resolve_product_ids(probe, products)
+    probe.close()
+    events = [(slug, review) for slug, review in corpus_events(reviews, rng) if slug in product_ids]
+    if not events:
+        raise SystemExit(f"❌ No reviews in {args.reviews} for known products")
+
+    replay = Replay(args, product_ids)
+    subscribers = [SocketIOSubscriber(host, port, role, replay.on_review)
+                   for role, count in replay.subscribers.items() for _ in range(count)]
+    try:
+        await asyncio.gather(*(subscriber.connect() for subscriber in subscribers))
+    except (OSError, ConnectionError, asyncio.IncompleteReadError) as e:
+        for subscriber in subscribers:
+            subscriber.close()
+        raise SystemExit(f"❌ Could not subscribe to {args.base_url}/socket.io/: {e}")
+    listeners = [asyncio.create_task(subscriber.listen()) for subscriber in subscribers]
+    await asyncio.sleep(SUBSCRIBE_SETTLE_S if subscribers else 0)
+
+    connections = asyncio.Queue()
+    for _ in range(args.concurrency):
+        connections.put_nowait(HttpConnection(host, port))
+
+    if args.arrivals == 'recorded':
+        schedule = recorded_schedule(events, args.speedup, args.duration, rng)
+        if args.limit:
+            schedule = schedule[:args.limit]
+        span = schedule[-1][0] if schedule else 0
+        plans = [(f"recorded x{args.speedup:g}", len(schedule) / span if span else 0, schedule)]
+    else:
+        rates = [float(r) for r in args.ramp.split(',')] if args.ramp else [args.rate]
+        plans = []
+        for rate in rates:
+            schedule = poisson_schedule(events, rate * args.speedup, args.duration, rng)
+            if args.limit:
+                schedule = schedule[:args.limit]
+            plans.append((f"poisson {rate * args.speedup:g}/s", rate * args.speedup, schedule))
+
+    print(f"🚀 Replaying {sum(len(s) for _, _, s in plans)} reviews in {len(plans)} stage(s), "
+          f"{args.subscribers} user and {args.admins} admin subscribers, concurrency {args.concurrency}")
+    rows = []
+    for label, rate, schedule in plans:
+        stage = Stage(label, rate)
+        await replay.run_stage(stage, schedule, connections)
+        rows.append(replay.stage_report(stage))
+        print_stage(rows[-1])
+
+    for listener in listeners:
+        listener.cancel()
+    for subscriber in subscribers:
+        subscriber.close()
+    while not connections.empty():
+        connections.get_nowait().close()
+    return rows
+
+
+def print_stage(row):
+    insert = row['insert']
+    print(f"\n📊 {row['stage']}: {row['created']}/{row['writes']} created, "
+          f"{row['achieved_rps']}/s of {row['offered_rps']}/s offered, {row['error_rate'] * 100:.1f}% errors")
+    print(f"   insert   p50 {insert['p50_ms'] or 0:.1f}  p90 {insert['p90_ms'] or 0:.1f}  "
+          f"p99 {insert['p99_ms'] or 0:.1f}  max {insert['max_ms'] or 0:.1f} ms")
+    for role, fanout in row['fanout'].items():
+        print(f"   fan-out {role:<6} p50 {fanout['p50_ms']:.1f}  p90 {fanout['p90_ms']:.1f}  p99 {fanout['p99_ms']:.1f}  "
+              f"max {fanout['max_ms']:.1f} ms, {fanout['delivery_ratio'] * 100:.1f}% of "
+              f"{row['created'] * fanout['subscribers']} deliveries")
+    if row['error_rate']:
+        print(f"   statuses: {insert['statuses']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay generated reviews as timed writes and measure broadcast fan-out')
+    parser.add_argument('--base-url', default='http://localhost:2000')
+    parser.add_argument('--arrivals', choices=['poisson', 'recorded'], default='poisson')
+    parser.add_argument('--rate', type=float, default=20, help='Poisson writes per second')
+    parser.add_argument('--ramp', help='comma-separated Poisson rates, one stage each, to find the throughput ceiling')
+    parser.add_argument('--speedup', type=float, default=1.0,
+                        help='time compression: multiplies Poisson rates, divides recorded gaps')
+    parser.add_argument('--duration', type=float, default=30, help='seconds per stage')
+    parser.add_argument('--limit', type=int, help='at most this many writes per stage')
+    parser.add_argument('--subscribers', type=int, default=50, help='websocket clients in the all-users room')
+    parser.add_argument('--admins', type=int, default=2, help='websocket clients in the admin-panel room')
+    parser.add_argument('--concurrency', type=int, default=32, help='max in-flight writes')
+    parser.add_argument('--timeout', type=float, default=10, help='per-request timeout in seconds')
+    parser.add_argument('--drain', type=float, default=2.0, help='seconds to wait for late broadcasts after a stage')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH)
+    parser.add_argument('--json-out', help='also write the report as JSON')
+    args = parser.parse_args()
+
+    rows = asyncio.run(run(args))
+    if len(rows) > 1:
+        best = ceiling(rows)
+        if best:
+            print(f"\n🏁 Sustained up to {best['achieved_rps']} writes/s ({best['stage']})")
+        else:
+            print("\n🏁 No stage kept up with its offered rate")
+    if args.json_out:
+        with open(args.json_out, 'w', encoding='utf-8') as f:
+            json.dump({"stages": rows, "ceiling": ceiling(rows)}, f, indent=2)
+        print(f"\n💾 Report saved to {args.json_out}")
+
+
+if __name__ == '__main__':
+    main()
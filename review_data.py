@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+
+# Shared loaders for the catalog and the generated review corpus.
+# Paths are relative to the repo root, like the generator scripts.
+PRODUCTS_PATH = 'products_extracted.json'
+REVIEWS_TS_PATH = 'user-panel/src/utils/product_reviews.ts'
+
+TS_EXPORT_PREFIX = 'export const productReviews = '
+
+# Review stats snapshot served to the storefront in one request.
+# Bump STATS_SCHEMA_VERSION whenever the per-slug shape changes.
+STATS_SNAPSHOT_PATH = 'user-panel/public/data/review-stats.json'
+STATS_SCHEMA_VERSION = 1
+
+DATE_RE = re.compile(r'(\d+) (day|week|month|year)s? ago')
+DATE_UNITS = {'day': 1, 'week': 7, 'month': 30, 'year': 365}
+
+
+def clean_name(name):
+    """Collapse the stray whitespace the CSV leaves in product names"""
+    return ' '.join((name or '').split())
+
+
+def load_products(path=PRODUCTS_PATH):
+    """Load the catalog written by extract_products_from_csv.py"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_reviews(path=REVIEWS_TS_PATH):
+    """Load {slug: [review, ...]} from a generated .json file or the .ts module"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    if not path.endswith('.ts') and not path.endswith('.js'):
+        return json.loads(text)
+
+    # The TS module is `export const productReviews = <json.dumps output>;`
+    # followed by helper functions, so the JSON object ends at the first
+    # closing brace in column 0.
+    start = text.index(TS_EXPORT_PREFIX) + len(TS_EXPORT_PREFIX)
+    end = text.index('\n}', start) + 2
+    return json.loads(text[start:end])
+
+
+def phrase_days(date):
+    """Approximate days ago for the relative date phrases the generators write"""
+    match = DATE_RE.match(date)
+    if not match:
+        return 0
+    return int(match.group(1)) * DATE_UNITS[match.group(2)]
+
+
+def review_stats(reviews):
+    """Aggregate a slug's reviews the same way /api/product-reviews/stats does"""
+    histogram = {str(r): 0 for r in range(5, 0, -1)}
+    total = 0
+    verified = 0
+    for review in reviews:
+        rating = int(review['rating'])
+        histogram[str(rating)] += 1
+        total += rating
+        if review.get('isVerified') or review.get('is_verified'):
+            verified += 1
+
+    count = len(reviews)
+    return {
+        "average_rating": round(total / count, 2) if count else 0,
+        "review_count": count,
+        "verified_count": verified,
+        "histogram": histogram
+    }
+
+
+def build_stats_snapshot(stats_by_slug, source):
+    """Wrap per-slug stats in the versioned snapshot envelope.
+
+    `version` is a hash of the stats themselves, so it only changes when the
+    numbers change and can be used directly as a cache key.
+    """
+    stats = {slug: stats_by_slug[slug] for slug in sorted(stats_by_slug)}
+    digest = hashlib.sha256(json.dumps(stats, sort_keys=True).encode('utf-8')).hexdigest()
+    return {
+        "schema_version": STATS_SCHEMA_VERSION,
+        "version": digest[:16],
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "source": source,
+        "stats": stats
+    }
+
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """Write JSON via a temp file + rename so readers never see a partial file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+    os.replace(tmp_path, path)
@@ -0,0 +1,308 @@
+import argparse
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime
+from multiprocessing import Pool
+
+from db_utils import connect
+from generate_all_40_product_reviews import PRODUCTS_PATH, load_products
+from review_data import REVIEWS_TS_PATH, load_reviews, write_json_atomic
+from review_text_analytics import STOPWORDS, ingredient_vocabulary, review_body
+
+# "Customers mention" phrases per product for the product page chips, e.g.
+# "hair fall kam", "non-greasy", "Blue Tea glow". Review texts are tokenized
+# in batches across a process pool; each batch returns per-slug Counters of the
+# 1-3 word phrases every review mentions, and the batches are merged with
+# Counter.update. Catalog ingredients are matched first and kept whole, in
+# their catalog spelling, so a phrase never cuts "Yellow Dragon Fruit" in half.
+#
+#   python review_highlights.py                    # from the generated corpus
+#   python review_highlights.py --db               # approved reviews, only new ones since the last run
+#   python review_highlights.py --db --full        # recount everything (picks up edits and deletions)
+#
+# With --db the per-slug counts are kept in SQLite with a watermark: every
+# review at or below it was already decided (approved and counted, or not
+# approved) when it was set. POST /api/product-reviews inserts reviews already
+# approved; only rows inserted with the schema's default status or set by
+# admin moderation are 'pending' and may be approved later, so the watermark
+# stops just below the oldest review still pending; approved reviews above it
+# are remembered by id so they aren't counted twice. A run therefore only
+# tokenizes reviews that arrived or got approved since the previous one.
+# Edits, deletions and reviews approved after a rejection need --full.
+# A phrase scores by how many of the product's reviews mention it, weighted
+# towards phrases that few other products' reviews use.
+
+HIGHLIGHTS_PATH = 'user-panel/public/data/review-highlights.json'
+STATE_PATH = 'review_highlights_state.sqlite'
+CHUNK_SIZE = 2000
+MAX_N = 3
+TOP_PHRASES = 6
+# A phrase has to come up in this many of a product's reviews to be shown
+MIN_REVIEWS = 3
+# A shorter phrase is dropped when a longer one containing it covers this share of its mentions
+SUBSUME_SHARE = 0.8
+
+TOKEN_RE = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+# Words describing the product are what the chips are about; everything else
+# in the analytics stopword list may not start or end a phrase
+EDGE_STOPWORDS = STOPWORDS - {'skin', 'hair', 'face'} | {'hoon', 'karti', 'karungi', 'definitely', 'highly', 'will'}
+
+NEW_REVIEWS_QUERY = """
+    SELECT pr.id, p.slug, pr.review_text, pr.comment
+    FROM product_reviews pr
+    JOIN products p ON p.id = pr.product_id
+    WHERE pr.is_approved = true AND (pr.status = 'approved' OR pr.status IS NULL) AND pr.id > %s
+    ORDER BY pr.id
+"""
+
+# Where the next run can start: reviews above the oldest pending one may
+# still be approved later
+WATERMARK_QUERY = """
+    SELECT MIN(id) FILTER (WHERE status = 'pending'), MAX(id)
+    FROM product_reviews
+    WHERE id > %s
+"""
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS phrase_counts (
+  slug TEXT NOT NULL,
+  phrase TEXT NOT NULL,
+  reviews INTEGER NOT NULL,
+  PRIMARY KEY (slug, phrase)
+);
+CREATE TABLE IF NOT EXISTS review_counts (
+  slug TEXT PRIMARY KEY,
+  reviews INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counted_reviews (
+  id INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS meta (
+  key TEXT PRIMARY KEY,
+  value INTEGER NOT NULL
+);
+"""
+
+
+def units(text, vocabulary, longest):
+    """Review tokens with each catalog ingredient merged into one unit in its catalog spelling"""
+    tokens = TOKEN_RE.findall(text.lower())
+    merged = []
+    i = 0
+    while i < len(tokens):
+        for size in range(min(longest, len(tokens) - i), 0, -1):
+            ingredient = vocabulary.get(tuple(tokens[i:i + size]))
+            if ingredient:
+                merged.append(ingredient)
+                i += size
+                break
+        else:
+            merged.append(tokens[i])
+            i += 1
+    return merged
+
+
+def is_edge(unit):
+    """Whether a phrase may start or end on this unit; ingredients always may"""
+    return unit not in EDGE_STOPWORDS and len(unit) >= 3
+
+
+def review_phrases(text, vocabulary, longest):
+    """Distinct 1..MAX_N unit phrases in a review that don't start or end on a stopword"""
+    tokens = units(text, vocabulary, longest)
+    phrases = set()
+    for i, first in enumerate(tokens):
+        if not is_edge(first):
+            continue
+        for n in range(1, min(MAX_N, len(tokens) - i) + 1):
+            if is_edge(tokens[i + n - 1]):
+                phrases.add(' '.join(tokens[i:i + n]))
+    return phrases
+
+
+# Worker state, set once per process by the pool initializer
+_vocabulary = None
+_longest = 0
+
+
+def init_worker(vocabulary):
+    global _vocabulary, _longest
+    _vocabulary = vocabulary
+    _longest = max((len(k) for k in vocabulary), default=0)
+
+
+def count_batch(batch):
+    """({slug: Counter(phrase -> reviews mentioning it)}, Counter(slug -> reviews)) for one batch"""
+    phrases = {}
+    reviews = Counter()
+    for slug, text in batch:
+        phrases.setdefault(slug, Counter()).update(review_phrases(text, _vocabulary, _longest))
+        reviews[slug] += 1
+    return phrases, reviews
+
+
+def batches(rows, size=CHUNK_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def count_all(rows, vocabulary, workers):
+    """Merged phrase and review counts for an iterable of (slug, text)"""
+    phrases = {}
+    reviews = Counter()
+    with Pool(workers, initializer=init_worker, initargs=(vocabulary,)) as pool:
+        for batch_phrases, batch_reviews in pool.imap_unordered(count_batch, batches(rows)):
+            for slug, counts in batch_phrases.items():
+                phrases.setdefault(slug, Counter()).update(counts)
+            reviews.update(batch_reviews)
+    return phrases, reviews
+
+
+def top_phrases(phrases, top=TOP_PHRASES):
+    """{slug: [[phrase, reviews mentioning it], ...]} best first; slugs with nothing to show are left out"""
+    # Document frequency across products: phrases every product's reviews use
+    # ("works well", "value for money") carry no information about this one
+    products_using = Counter()
+    for counts in phrases.values():
+        products_using.update(phrase for phrase, n in counts.items() if n >= MIN_REVIEWS)
+    products = max(len(phrases), 1)
+
+    highlights = {}
+    for slug, counts in sorted(phrases.items()):
+        scored = sorted(
+            ((n * math.log(1 + products / products_using[phrase]), phrase, n)
+             for phrase, n in counts.items() if n >= MIN_REVIEWS),
+            reverse=True
+        )
+        picked = []
+        for _, phrase, n in scored:
+            # Skip what a picked phrase already says, and parts of a longer phrase that covers them.
+            # Overlapping phrases with the same count are slices of one sentence every such review shares.
+            words = set(phrase.split())
+            if any(f" {phrase} " in f" {other} " or f" {other} " in f" {phrase} "
+                   or (m == n and words & set(other.split())) for other, m in picked):
+                continue
+            longer = [m for other, m in counts.items()
+                      if len(other) > len(phrase) and f" {phrase} " in f" {other} "]
+            if longer and max(longer) >= SUBSUME_SHARE * n:
+                continue
+            picked.append((phrase, n))
+            if len(picked) == top:
+                break
+        if picked:
+            highlights[slug] = [[phrase, n] for phrase, n in picked]
+    return highlights
+
+
+def corpus_rows(path):
+    for slug, slug_reviews in load_reviews(path).items():
+        for review in slug_reviews:
+            yield slug, review['comment']
+
+
+def db_rows(conn, after_id, counted, seen):
+    """(slug, text) for approved reviews with id > after_id that aren't counted yet; their ids go into seen"""
+    with conn.cursor(name='review_highlights') as cur:
+        cur.itersize = CHUNK_SIZE
+        cur.execute(NEW_REVIEWS_QUERY, (after_id,))
+        for review_id, slug, review_text, comment in cur:
+            if review_id in counted:
+                continue
+            seen.append(review_id)
+            yield slug, review_body(review_text, comment)
+
+
+def next_watermark(conn, after_id):
+    """Highest id below which no review can still turn approved, read before counting"""
+    with conn.cursor() as cur:
+        cur.execute(WATERMARK_QUERY, (after_id,))
+        oldest_pending, newest = cur.fetchone()
+    if oldest_pending is not None:
+        return oldest_pending - 1
+    return newest if newest is not None else after_id
+
+
+def load_state(state):
+    phrases = {}
+    for slug, phrase, n in state.execute("SELECT slug, phrase, reviews FROM phrase_counts"):
+        phrases.setdefault(slug, Counter())[phrase] = n
+    reviews = Counter(dict(state.execute("SELECT slug, reviews FROM review_counts")))
+    row = state.execute("SELECT value FROM meta WHERE key = 'watermark'").fetchone()
+    return phrases, reviews, row[0] if row else 0
+
+
+def save_increment(state, phrases, reviews, review_ids, watermark):
+    with state:
+        state.executemany(
+            "INSERT INTO phrase_counts VALUES (?, ?, ?) "
+            "ON CONFLICT (slug, phrase) DO UPDATE SET reviews = reviews + excluded.reviews",
+            ((slug, phrase, n) for slug, counts in phrases.items() for phrase, n in counts.items()))
+        state.executemany(
+            "INSERT INTO review_counts VALUES (?, ?) "
+            "ON CONFLICT (slug) DO UPDATE SET reviews = reviews + excluded.reviews", reviews.items())
+        state.executemany("INSERT INTO counted_reviews VALUES (?)", ((review_id,) for review_id in review_ids))
+        # Below the watermark the ids aren't needed to tell counted reviews apart any more
+        state.execute("DELETE FROM counted_reviews WHERE id <= ?", (watermark,))
+        state.execute("INSERT OR REPLACE INTO meta VALUES ('watermark', ?)", (watermark,))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute "customers mention" phrases per product')
+    parser.add_argument('--products', default=PRODUCTS_PATH, help='catalog for ingredient spelling')
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH, help='generated corpus (ignored with --db)')
+    parser.add_argument('--db', action='store_true', help='read approved reviews from product_reviews instead')
+    parser.add_argument('--full', action='store_true', help='with --db: drop the saved counts and recount')
+    parser.add_argument('--state', default=STATE_PATH)
+    parser.add_argument('--out', default=HIGHLIGHTS_PATH)
+    parser.add_argument('--top', type=int, default=TOP_PHRASES)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    vocabulary = ingredient_vocabulary(load_products(args.products))
+    if args.db:
+        if args.full and os.path.exists(args.state):
+            os.remove(args.state)
+        state = sqlite3.connect(args.state)
+        state.executescript(STATE_SCHEMA)
+        _, _, after_id = load_state(state)
+        counted = {review_id for review_id, in state.execute(
+            "SELECT id FROM counted_reviews WHERE id > ?", (after_id,))}
+
+        conn = connect()
+        seen = []
+        try:
+            watermark = next_watermark(conn, after_id)
+            new_phrases, new_reviews = count_all(db_rows(conn, after_id, counted, seen), vocabulary, args.workers)
+        finally:
+            conn.close()
+        save_increment(state, new_phrases, new_reviews, seen, watermark)
+        phrases, reviews, _ = load_state(state)
+        state.close()
+        source = f"{len(seen)} new reviews after id {after_id} (next run starts after {watermark})"
+    else:
+        phrases, reviews = count_all(corpus_rows(args.reviews), vocabulary, args.workers)
+        source = f"{sum(reviews.values())} reviews from {args.reviews}"
+
+    highlights = top_phrases(phrases, args.top)
+    write_json_atomic(args.out, {
+        "generated_at": datetime.now().astimezone().isoformat(timespec='seconds'),
+        "highlights": highlights
+    }, separators=(',', ':'))
+    print(f"✅ Counted {source} in {time.perf_counter() - started:.2f}s")
+    print(f"💾 Highlights for {len(highlights)} products saved to {args.out} "
+          f"({os.path.getsize(args.out)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
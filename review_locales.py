@@ -0,0 +1,124 @@
+import json
+import os
+import re
+from functools import lru_cache
+
+# Language tagging and per-locale sharding of review corpora, so the storefront
+# can load only the active locale's reviews instead of every script at once.
+#
+# Locale codes: en (English), hi-Latn (Hinglish), hi (Hindi), mr (Marathi),
+# gu (Gujarati), bn (Bengali).
+LOCALES = ['en', 'hi-Latn', 'hi', 'mr', 'gu', 'bn']
+DEFAULT_LOCALE = 'en'
+
+# Shards to load, in order, until a product has enough reviews to show.
+# Every chain reaches English, which itself falls back to Hinglish, the other
+# Latin-script shard, so a product never renders with no reviews.
+FALLBACK_CHAINS = {
+    'en': ['en', 'hi-Latn'],
+    'hi-Latn': ['hi-Latn', 'en'],
+    'hi': ['hi', 'hi-Latn', 'en'],
+    'mr': ['mr', 'hi', 'hi-Latn', 'en'],
+    'gu': ['gu', 'hi-Latn', 'en'],
+    'bn': ['bn', 'en'],
+}
+
+# One directory per corpus: each write replaces every shard and the index in
+# its directory, so the multilingual corpus (generate_product_reviews.py) and
+# the catalog corpus (generate_all_40_product_reviews.py) must not share one.
+# user-panel/src/utils/reviewLocales.ts loads either from its base URL.
+LOCALE_SHARDS_DIR = 'user-panel/public/data/reviews'
+CATALOG_LOCALE_SHARDS_DIR = 'user-panel/public/data/catalog-reviews'
+
+LATIN = re.compile(r'[A-Za-z]')
+DEVANAGARI = re.compile(r'[ऀ-ॿ]')
+BENGALI = re.compile(r'[ঀ-৿]')
+GUJARATI = re.compile(r'[઀-૿]')
+
+# Words that only show up in Marathi among the Devanagari corpora
+MARATHI_MARKERS = {'नक्की', 'आहे', 'आहेत', 'जाईल', 'घेतले', 'खूप', 'झाली', 'झाले', 'छान', 'परत'}
+
+# Common Hindi words written in Latin script
+HINGLISH_MARKERS = {
+    'hai', 'hain', 'ho', 'hoti', 'hota', 'hua', 'hui', 'se', 'ke', 'ki', 'ka', 'ko', 'aur', 'mein',
+    'bahut', 'accha', 'achha', 'acha', 'kaafi', 'kam', 'nahi', 'gaye', 'gayi', 'gaya', 'rahe',
+    'raha', 'rahi', 'rehti', 'karne', 'karungi', 'karti', 'hoon', 'lagti', 'lagta', 'sab', 'kuch',
+    'saath', 'zaroor', 'phir', 'badh', 'dikh', 'wala', 'milti', 'mili', 'liye', 'jaati', 'yeh'
+}
+WORD = re.compile(r"[a-z]+")
+
+
+@lru_cache(maxsize=None)
+def detect_language(text):
+    """Tag a review comment with one of LOCALES.
+
+    The script most of the comment's letters are written in decides: a
+    Devanagari review naming "Blue Tea" stays Hindi, and a Hinglish review
+    with a short Bengali sign-off stays in the Latin shards.
+    """
+    scripts = {
+        'latin': len(LATIN.findall(text)),
+        'gu': len(GUJARATI.findall(text)),
+        'bn': len(BENGALI.findall(text)),
+        'devanagari': len(DEVANAGARI.findall(text)),
+    }
+    script = max(scripts, key=scripts.get)
+    if scripts[script] and script != 'latin':
+        if script == 'devanagari':
+            words = set(re.findall(r'[ऀ-ॿ]+', text))
+            return 'mr' if words & MARATHI_MARKERS else 'hi'
+        return script
+    if set(WORD.findall(text.lower())) & HINGLISH_MARKERS:
+        return 'hi-Latn'
+    return 'en'
+
+
+def split_by_locale(all_product_reviews):
+    """Group {slug: [review]} into {locale: {slug: [review dict]}}.
+
+    Reviews may be dicts or review_records.Review objects; a `lang` tag set by
+    the generator is used when present, otherwise the comment is detected.
+    """
+    shards = {locale: {} for locale in LOCALES}
+    for slug, reviews in all_product_reviews.items():
+        for review in reviews:
+            if isinstance(review, dict):
+                data = {k: v for k, v in review.items() if k != 'lang'}
+                lang = review.get('lang')
+            else:
+                data = review.to_dict()
+                lang = getattr(review, 'lang', None)
+            lang = lang or detect_language(data['comment'])
+            shards[lang].setdefault(slug, []).append(data)
+    return shards
+
+
+def write_locale_shards(all_product_reviews, out_dir=LOCALE_SHARDS_DIR):
+    """Write one {slug: [review]} file per locale with reviews plus an index with the fallback chains
+
+    Locales without reviews get no file and no index entry (a stale shard from
+    an earlier run is removed), so the client skips them in a fallback chain.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    shards = split_by_locale(all_product_reviews)
+
+    index = {"default": DEFAULT_LOCALE, "fallback": FALLBACK_CHAINS, "locales": {}}
+    for locale in LOCALES:
+        file_name = f"{locale}.json"
+        path = os.path.join(out_dir, file_name)
+        if not shards[locale]:
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+        payload = json.dumps(shards[locale], ensure_ascii=False, separators=(',', ':'))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        index["locales"][locale] = {
+            "file": file_name,
+            "reviews": sum(len(v) for v in shards[locale].values()),
+            "bytes": len(payload.encode('utf-8'))
+        }
+
+    with open(os.path.join(out_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    return index
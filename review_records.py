@@ -0,0 +1,61 @@
+import sys
+
+# Compact record types for the generators. At millions of reviews a 4-key dict
+# per review dominates memory; slotted objects with interned strings cost a
+# fraction of that. Convert with to_dict() only when serializing.
+
+
+class Product:
+    __slots__ = ('name', 'slug', 'category', 'type', 'ingredients')
+
+    def __init__(self, name, slug, category, type, ingredients):
+        self.name = name
+        self.slug = slug
+        self.category = sys.intern(category)
+        self.type = sys.intern(type)
+        self.ingredients = tuple(sys.intern(ing) for ing in ingredients)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'], data['slug'], data['category'], data['type'], data.get('ingredients', ()))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "slug": self.slug,
+            "category": self.category,
+            "type": self.type,
+            "ingredients": list(self.ingredients)
+        }
+
+    def __repr__(self):
+        return f"Product({self.slug!r}, {self.category}/{self.type})"
+
+
+class Review:
+    __slots__ = ('name', 'rating', 'date', 'comment', 'lang')
+
+    def __init__(self, name, rating, date, comment, lang=None):
+        # Names, dates and comments repeat constantly across a corpus, so
+        # interning makes every duplicate share a single string object.
+        self.name = sys.intern(name)
+        self.rating = rating
+        self.date = sys.intern(date)
+        self.comment = sys.intern(comment)
+        # Locale tag from review_locales.detect_language, used for sharding
+        self.lang = lang
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'], data['rating'], data['date'], data['comment'], data.get('lang'))
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "rating": self.rating,
+            "date": self.date,
+            "comment": self.comment
+        }
+
+    def __repr__(self):
+        return f"Review({self.name!r}, {self.rating})"
@@ -0,0 +1,266 @@
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime, time as day_start, timedelta, timezone
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from review_data import PRODUCTS_PATH, REVIEWS_TS_PATH, clean_name, load_products, load_reviews, phrase_days, review_stats
+
+# Local stand-in for the backend's review endpoints, serving the generated
+# corpus instead of Postgres. Same routes and JSON shapes as backend/src/index.ts:
+#
+#   GET /api/product-reviews/product/:productId   (+ optional ?page=&limit=)
+#   GET /api/product-reviews/stats/slug/:slug
+#   GET /api/products                              (id/slug listing, for load_test_reviews.py)
+#
+#   python review_server.py --port 2000
+#
+# Every body is serialized and gzipped once and served with a strong ETag, so
+# a repeat request costs a dict lookup and a revalidation costs a 304.
+# Product ids follow the order of products_extracted.json, starting at 1.
+
+DEFAULT_PORT = 2000
+# Sent as the Server header so load_test_reviews.py can tell the stand-in apart
+SERVER_NAME = 'review_server.py'
+MAX_LIMIT = 100
+# Paged responses are built on first use and kept in an LRU of this size
+PAGE_CACHE_SIZE = 4096
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_BYTES = 256
+
+
+class Response:
+    """A serialized JSON body with its gzip variant and strong ETag"""
+
+    __slots__ = ('status', 'body', 'gzipped', 'etag', 'headers')
+
+    def __init__(self, data, status=200, headers=None):
+        self.status = status
+        self.body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.gzipped = gzip.compress(self.body, compresslevel=9, mtime=0) if len(self.body) >= GZIP_MIN_BYTES else None
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=12).hexdigest()}"'
+        self.headers = headers or {}
+
+
+class ReviewStore:
+    """Backend-shaped review rows and stats for the generated corpus"""
+
+    def __init__(self, products, all_product_reviews, reference):
+        self.products = []
+        self.slug_ids = {}
+        self.reviews_by_id = {}
+        self.full = {}
+        self.stats = {}
+        self.pages = OrderedDict()
+
+        review_id = 0
+        for product_id, product in enumerate(products, 1):
+            slug = product['slug']
+            self.slug_ids[slug] = product_id
+            self.products.append({"id": product_id, "slug": slug, "title": clean_name(product['name']),
+                                  "category": product['category']})
+            reviews = all_product_reviews.get(slug, [])
+
+            rows = []
+            for review in reviews:
+                review_id += 1
+                created_at = (reference - timedelta(days=phrase_days(review['date']))).isoformat()
+                rows.append({
+                    "id": review_id,
+                    "product_id": product_id,
+                    "customer_name": review['name'],
+                    "customer_email": None,
+                    "rating": int(review['rating']),
+                    "title": None,
+                    "review_text": review['comment'],
+                    "comment": review['comment'],
+                    "images": [],
+                    "is_verified": False,
+                    "is_featured": False,
+                    "created_at": created_at,
+                    "updated_at": created_at
+                })
+            # ORDER BY is_featured DESC, created_at DESC; ISO timestamps sort as text
+            rows.sort(key=lambda row: row['created_at'], reverse=True)
+            self.reviews_by_id[product_id] = rows
+            self.full[product_id] = Response(rows)
+
+            stats = review_stats(reviews)
+            self.stats[slug] = Response({
+                "product_id": product_id,
+                "slug": slug,
+                "average_rating": stats['average_rating'],
+                "review_count": stats['review_count'],
+                "verified_count": stats['verified_count']
+            })
+        self.product_list = Response(self.products)
+
+    def reviews_page(self, product_id, page, limit):
+        key = (product_id, page, limit)
+        response = self.pages.get(key)
+        if response is None:
+            rows = self.reviews_by_id[product_id]
+            start = (page - 1) * limit
+            response = Response(rows[start:start + limit], headers={"X-Total-Count": str(len(rows))})
+            self.pages[key] = response
+            if len(self.pages) > PAGE_CACHE_SIZE:
+                self.pages.popitem(last=False)
+        else:
+            self.pages.move_to_end(key)
+        return response
+
+    def missing_stats(self, slug):
+        return Response({"product_id": None, "slug": slug, "average_rating": 0, "review_count": 0, "verified_count": 0})
+
+
+def error(status, message):
+    return Response({"error": message}, status)
+
+
+def positive_int(values, default):
+    if not values:
+        return default
+    value = int(values[0])
+    if value <= 0:
+        raise ValueError(value)
+    return value
+
+
+def route(store, method, target):
+    if method != 'GET':
+        return error(404, 'Not found')
+    url = urlsplit(target)
+    parts = [unquote(p) for p in url.path.strip('/').split('/')]
+
+    if parts == ['api', 'products']:
+        return store.product_list
+
+    if parts[:3] == ['api', 'product-reviews', 'product'] and len(parts) == 4:
+        try:
+            product_id = int(parts[3])
+        except ValueError:
+            return error(400, 'Invalid product ID')
+        if product_id <= 0:
+            return error(400, 'Invalid product ID')
+        if product_id not in store.full:
+            return Response([])
+
+        query = parse_qs(url.query)
+        if 'page' not in query and 'limit' not in query:
+            return store.full[product_id]
+        try:
+            page = positive_int(query.get('page'), 1)
+            limit = min(positive_int(query.get('limit'), 20), MAX_LIMIT)
+        except ValueError:
+            return error(400, 'page and limit must be positive integers')
+        return store.reviews_page(product_id, page, limit)
+
+    if parts[:4] == ['api', 'product-reviews', 'stats', 'slug'] and len(parts) == 5:
+        return store.stats.get(parts[4]) or store.missing_stats(parts[4])
+
+    return error(404, 'Not found')
+
+
+REASONS = {200: 'OK', 204: 'No Content', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found'}
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, If-None-Match",
+    "Access-Control-Expose-Headers": "ETag, X-Total-Count",
+}
+
+
+def render(response, request_headers):
+    """Status line + headers + body for a Response, honouring If-None-Match and Accept-Encoding"""
+    headers = dict(CORS_HEADERS)
+    headers["Server"] = SERVER_NAME
+    headers.update(response.headers)
+    headers["Content-Type"] = "application/json; charset=utf-8"
+    headers["ETag"] = response.etag
+    headers["Cache-Control"] = "no-cache"
+    headers["Vary"] = "Accept-Encoding"
+
+    status = response.status
+    body = response.body
+    if_none_match = request_headers.get('if-none-match', '')
+    if status == 200 and (if_none_match == '*' or response.etag in (t.strip() for t in if_none_match.split(','))):
+        status = 304
+        body = b''
+    elif response.gzipped is not None and 'gzip' in request_headers.get('accept-encoding', ''):
+        headers["Content-Encoding"] = "gzip"
+        body = response.gzipped
+
+    headers["Content-Length"] = str(len(body))
+    head = [f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}"] + [f"{k}: {v}" for k, v in headers.items()]
+    return ("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + body
+
+
+async def handle_connection(store, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            method, target, version = request_line.decode('latin-1').split()
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                key, _, value = line.decode('latin-1').partition(':')
+                headers[key.strip().lower()] = value.strip()
+            if int(headers.get('content-length', 0)):
+                await reader.readexactly(int(headers['content-length']))
+
+            if method == 'OPTIONS':
+                head = [f"HTTP/1.1 204 No Content"] + [f"{k}: {v}" for k, v in CORS_HEADERS.items()] + ["Content-Length: 0"]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1'))
+            else:
+                writer.write(render(route(store, method, target), headers))
+            await writer.drain()
+
+            if headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0':
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+def corpus_reference(path):
+    """Midnight UTC of the corpus file's mtime; relative dates are resolved against it
+    so bodies (and ETags) stay the same across restarts"""
+    modified = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+    return datetime.combine(modified.date(), day_start(), timezone.utc)
+
+
+async def serve(store, host, port):
+    server = await asyncio.start_server(lambda r, w: handle_connection(store, r, w), host, port)
+    print(f"🚀 Serving {sum(len(r) for r in store.reviews_by_id.values())} reviews for "
+          f"{len(store.products)} products on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the generated reviews with the backend review API shapes')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--reviews', default=REVIEWS_TS_PATH)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    store = ReviewStore(load_products(args.products), load_reviews(args.reviews), corpus_reference(args.reviews))
+    try:
+        asyncio.run(serve(store, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+
+
+if __name__ == '__main__':
+    main()
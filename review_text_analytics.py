@@ -0,0 +1,253 @@
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from datetime import datetime
+from multiprocessing import Pool
+
+from db_utils import connect
+from generate_all_40_product_reviews import PRODUCTS_PATH, load_products
+from review_data import write_json_atomic
+
+# Offline text analytics over the real customer reviews in product_reviews.
+# Approved reviews are streamed through a server-side cursor in chunks and
+# analysed across a process pool: keywords, mentioned ingredients (from the
+# catalog's ingredient vocabulary) and a lexicon-based polarity score in
+# [-1, 1] that understands the Hinglish the reviews are written in.
+#
+#   python review_text_analytics.py              # only new or edited reviews
+#   python review_text_analytics.py --full       # re-analyse everything
+#
+# Per-review results are cached in SQLite keyed by review id + updated_at, so
+# reruns skip unchanged reviews; per-product insights are written for the
+# admin dashboards.
+
+CACHE_PATH = 'review_text_cache.sqlite'
+INSIGHTS_PATH = 'admin-panel/public/data/review-insights.json'
+CHUNK_SIZE = 2000
+TOP_KEYWORDS = 5
+TOP_PRODUCT_TERMS = 15
+
+REVIEWS_QUERY = """
+    SELECT pr.id, p.slug, pr.rating, pr.review_text, pr.comment, pr.updated_at
+    FROM product_reviews pr
+    JOIN products p ON p.id = pr.product_id
+    WHERE pr.is_approved = true AND (pr.status = 'approved' OR pr.status IS NULL)
+    ORDER BY pr.id
+"""
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_text (
+  id INTEGER PRIMARY KEY,
+  slug TEXT NOT NULL,
+  rating INTEGER,
+  updated_at TEXT NOT NULL,
+  polarity REAL NOT NULL,
+  keywords TEXT NOT NULL,
+  ingredients TEXT NOT NULL
+);
+"""
+
+TOKEN_RE = re.compile(r"[a-z][a-z']+")
+
+STOPWORDS = frozenset("""
+a an the and or but if so of to in on at for with from by as is are was were be been being it its this that
+these those i me my we our you your he she they them their am do does did have has had not no very really just
+also too more most much than then there here about after before into over out up down can could would should
+will shall may might one all any some such only own same again once product products use using used skin hair
+face nefol ml gm hai hain ka ki ke ko se aur bhi ho hua hui mein me mera meri mere yeh ye woh wo kar karke
+karti karta karne raha rahi rahe tha thi the ek liye lagti lagta lag gaya gayi kuch sab bahut bohot ab toh to
+""".split())
+
+POSITIVE = frozenset("""
+amazing awesome best better beautiful brilliant clear clean effective excellent fantastic fresh gentle glow
+glowing good great happy healthy helpful improved impressive love loved lovely nice perfect pleasant recommend
+recommended refreshing results satisfied smooth soft superb visible wonderful worth accha achha acha badhiya
+badiya mast zabardast shandar pasand
+""".split())
+
+NEGATIVE = frozenset("""
+allergic allergy bad breakout breakouts burning burn disappointed disappointing dry dull expensive greasy harsh
+irritation itchy itching poor problem rash sticky terrible useless waste worse worst bura bekar kharab ganda
+""".split())
+
+# English negations flip the next few words ("not good"); Hinglish negations
+# and "reduced"-style words flip the words just before them ("accha nahi",
+# "breakouts kam ho gaye")
+NEGATIONS = frozenset("not no never dont don't didnt didn't isnt isn't doesnt doesn't".split())
+NEGATION_WINDOW = 3
+AFTER_NEGATIONS = frozenset("nahi nahin na mat kam less reduced fewer gone".split())
+AFTER_WINDOW = 2
+
+
+def ingredient_vocabulary(products):
+    """{token tuple: ingredient} for every catalog ingredient, longest phrases matched first"""
+    vocabulary = {}
+    for product in products:
+        for ingredient in product.ingredients:
+            tokens = tuple(TOKEN_RE.findall(ingredient.lower()))
+            if tokens:
+                vocabulary.setdefault(tokens, ingredient)
+    return vocabulary
+
+
+def polarity(tokens):
+    signs = []
+    negate_until = -1
+    for i, token in enumerate(tokens):
+        if token in NEGATIONS:
+            negate_until = i + NEGATION_WINDOW
+        elif token in AFTER_NEGATIONS:
+            for j in range(max(0, len(signs) - AFTER_WINDOW), len(signs)):
+                signs[j] = -signs[j]
+        elif token in POSITIVE or token in NEGATIVE:
+            sign = 1 if token in POSITIVE else -1
+            signs.append(-sign if i <= negate_until else sign)
+    if not signs:
+        return 0.0
+    return sum(signs) / len(signs)
+
+
+def review_body(review_text, comment):
+    """The text of a review as the backend resolves it
+
+    POST /api/product-reviews stores the same text in both columns (comment
+    falls back to review_text), so joining them would count every review twice.
+    """
+    return review_text or comment or ''
+
+
+def analyse(text, vocabulary, longest):
+    tokens = TOKEN_RE.findall(text.lower())
+
+    ingredients = []
+    i = 0
+    while i < len(tokens):
+        for size in range(min(longest, len(tokens) - i), 0, -1):
+            ingredient = vocabulary.get(tuple(tokens[i:i + size]))
+            if ingredient:
+                if ingredient not in ingredients:
+                    ingredients.append(ingredient)
+                i += size
+                break
+        else:
+            i += 1
+
+    content = [t for t in tokens if t not in STOPWORDS and len(t) > 2]
+    terms = Counter(content)
+    terms.update(f"{a} {b}" for a, b in zip(content, content[1:]))
+    keywords = [term for term, _ in terms.most_common(TOP_KEYWORDS)]
+    return round(polarity(tokens), 3), keywords, ingredients
+
+
+# Worker state, set once per process by the pool initializer
+_vocabulary = None
+_longest = 0
+
+
+def init_worker(vocabulary):
+    global _vocabulary, _longest
+    _vocabulary = vocabulary
+    _longest = max((len(k) for k in vocabulary), default=0)
+
+
+def analyse_chunk(rows):
+    results = []
+    for review_id, slug, rating, updated_at, text in rows:
+        score, keywords, ingredients = analyse(text, _vocabulary, _longest)
+        results.append((review_id, slug, rating, updated_at, score, json.dumps(keywords), json.dumps(ingredients)))
+    return results
+
+
+def changed_chunks(conn, cached, full, seen):
+    """Chunks of (id, slug, rating, updated_at, text) for reviews not in the cache at this updated_at"""
+    # A named cursor is a server-side cursor: rows arrive CHUNK_SIZE at a time
+    with conn.cursor(name='review_text_analytics') as cur:
+        cur.itersize = CHUNK_SIZE
+        cur.execute(REVIEWS_QUERY)
+        chunk = []
+        for review_id, slug, rating, review_text, comment, updated_at in cur:
+            seen.add(review_id)
+            stamp = updated_at.isoformat() if updated_at else ''
+            if not full and cached.get(review_id) == stamp:
+                continue
+            chunk.append((review_id, slug, rating, stamp, review_body(review_text, comment)))
+            if len(chunk) >= CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def build_insights(cache):
+    products = {}
+    for slug, rating, score, keywords, ingredients in cache.execute(
+            "SELECT slug, rating, polarity, keywords, ingredients FROM review_text"):
+        entry = products.setdefault(slug, {"reviews": 0, "polarity_sum": 0.0, "rating_sum": 0,
+                                           "keywords": Counter(), "ingredients": Counter()})
+        entry["reviews"] += 1
+        entry["polarity_sum"] += score
+        entry["rating_sum"] += rating or 0
+        entry["keywords"].update(json.loads(keywords))
+        entry["ingredients"].update(json.loads(ingredients))
+
+    return {
+        "generated_at": datetime.now().astimezone().isoformat(timespec='seconds'),
+        "products": {
+            slug: {
+                "reviews": e["reviews"],
+                "average_rating": round(e["rating_sum"] / e["reviews"], 2),
+                "average_polarity": round(e["polarity_sum"] / e["reviews"], 3),
+                "keywords": e["keywords"].most_common(TOP_PRODUCT_TERMS),
+                "ingredients": e["ingredients"].most_common(TOP_PRODUCT_TERMS)
+            }
+            for slug, e in sorted(products.items())
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mine keywords, ingredients and polarity from approved reviews')
+    parser.add_argument('--products', default=PRODUCTS_PATH, help='catalog for the ingredient vocabulary')
+    parser.add_argument('--cache', default=CACHE_PATH)
+    parser.add_argument('--out', default=INSIGHTS_PATH)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--full', action='store_true', help='ignore the cache and re-analyse every review')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    vocabulary = ingredient_vocabulary(load_products(args.products))
+    cache = sqlite3.connect(args.cache)
+    cache.executescript(CACHE_SCHEMA)
+    cached = dict(cache.execute("SELECT id, updated_at FROM review_text"))
+
+    conn = connect()
+    seen = set()
+    analysed = 0
+    try:
+        with Pool(args.workers, initializer=init_worker, initargs=(vocabulary,)) as pool:
+            for results in pool.imap(analyse_chunk, changed_chunks(conn, cached, args.full, seen)):
+                with cache:
+                    cache.executemany("INSERT OR REPLACE INTO review_text VALUES (?, ?, ?, ?, ?, ?, ?)", results)
+                analysed += len(results)
+    finally:
+        conn.close()
+
+    # Reviews deleted or unapproved since the last run drop out of the insights
+    gone = [(review_id,) for review_id in cached if review_id not in seen]
+    with cache:
+        cache.executemany("DELETE FROM review_text WHERE id = ?", gone)
+
+    insights = build_insights(cache)
+    cache.close()
+    write_json_atomic(args.out, insights, indent=2)
+    print(f"✅ Analysed {analysed} new/edited reviews, reused {len(seen) - analysed}, dropped {len(gone)} "
+          f"in {time.perf_counter() - started:.2f}s")
+    print(f"💾 Insights for {len(insights['products'])} products saved to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import hashlib
+import json
+import struct
+import time
+from bisect import bisect_right
+from itertools import accumulate
+
+from generate_all_40_product_reviews import (
+    PRODUCTS_PATH, RATINGS, RATING_WEIGHTS, SEED,
+    date_phrase, female_names, get_comments_for_product, load_products, male_names, suffixes
+)
+from review_records import Review
+
+# Random-access review generator: review k of a product is a pure function of
+# (seed, slug, k), so any slice can be produced directly, in any order or in
+# parallel, without replaying the reviews before it or storing anything.
+#
+#   python review_unrank.py --slug nefol-face-serum --k 5000000
+#   python review_unrank.py --slug nefol-face-serum --page 250000 --limit 20
+#
+# Each review draws its choices from a counter-based RNG: blake2b keyed by
+# (seed, slug) over the counter k, split into independent 32-bit uniforms.
+# Uses the same name, rating, date, template and suffix spaces and odds as
+# generate_all_40_product_reviews.py, but not its sequential random.Random
+# stream, so the two produce different (equally distributed) reviews.
+
+DRAWS = 8
+DRAW_FORMAT = f"<{DRAWS}I"
+DRAW_SCALE = 1 / 2 ** 32
+RATING_CUMULATIVE = list(accumulate(RATING_WEIGHTS))
+
+
+class ReviewUnranker:
+    """Deterministic mapping from review index k to a review for one product"""
+
+    def __init__(self, product, seed=SEED, make_review=Review):
+        self.product = product
+        self.make_review = make_review
+        self.comments_short, self.comments_long = get_comments_for_product(product)
+        # blake2b keys are capped at 64 bytes, so long slugs are hashed into one
+        key = hashlib.blake2b(f"{seed}\0{product.slug}".encode('utf-8')).digest()
+        self.hasher = hashlib.blake2b(key=key, digest_size=4 * DRAWS)
+
+    def draws(self, k):
+        h = self.hasher.copy()
+        h.update(k.to_bytes(8, 'little'))
+        return [d * DRAW_SCALE for d in struct.unpack(DRAW_FORMAT, h.digest())]
+
+    def review(self, k):
+        u_gender, u_name, u_rating, u_days, u_length, u_comment, u_suffix, u_which = self.draws(k)
+
+        names = female_names if u_gender < 0.7 else male_names
+        name = names[int(u_name * len(names))]
+        rating = RATINGS[bisect_right(RATING_CUMULATIVE, u_rating * RATING_CUMULATIVE[-1])]
+        date = date_phrase(2 + int(u_days * 364))
+
+        comments = self.comments_long if u_length > 0.4 else self.comments_short
+        comment = comments[int(u_comment * len(comments))]
+        if u_suffix < 0.3:
+            comment += " " + suffixes[int(u_which * len(suffixes))]
+
+        return self.make_review(name, rating, date, comment)
+
+    def slice(self, start, stop):
+        return [self.review(k) for k in range(start, stop)]
+
+    def page(self, page, limit):
+        """1-based page of `limit` reviews, like the backend's ?page=&limit="""
+        start = (page - 1) * limit
+        return self.slice(start, start + limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Produce review k (or a page) of a product without generating the rest')
+    parser.add_argument('--products', default=PRODUCTS_PATH)
+    parser.add_argument('--slug', required=True)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--k', type=int, help='0-based review index')
+    parser.add_argument('--page', type=int, default=1)
+    parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    product = next((p for p in load_products(args.products) if p.slug == args.slug), None)
+    if product is None:
+        parser.error(f"unknown slug: {args.slug}")
+
+    unranker = ReviewUnranker(product, args.seed)
+    started = time.perf_counter()
+    if args.k is not None:
+        reviews = [unranker.review(args.k)]
+    else:
+        reviews = unranker.page(args.page, args.limit)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    print(json.dumps([review.to_dict() for review in reviews], indent=2, ensure_ascii=False))
+    print(f"⏱️  {len(reviews)} reviews in {elapsed:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
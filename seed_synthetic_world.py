@@ -0,0 +1,334 @@
+import argparse
+import bisect
+import itertools
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from catalog_cache import cached_products
+from db_utils import connect
+from generate_all_40_product_reviews import (
+    PRODUCTS_PATH, female_names, generate_review, get_comments_for_product, load_products, male_names, to_products
+)
+from sync_products_to_db import COPY_CHUNK_SIZE, CopyStream
+
+# Referentially consistent synthetic data for load tests: users, their orders
+# (line items in orders.items, as the backend stores them) and product reviews,
+# where verified reviews point at a delivered order that contains the product.
+# Names come from the review generator's pools and review text from its
+# per-product templates; products are the ones already in the products table.
+#
+#   python seed_synthetic_world.py --users 20000 --orders 100000
+#   python seed_synthetic_world.py --product-skew 1.2 --hot-products 5 --hot-share 0.4
+#   python seed_synthetic_world.py --dry-run            # load, report, roll back
+#   python seed_synthetic_world.py --purge              # remove everything seeded here
+#
+# Tables are COPY-loaded in dependency order (users -> orders -> product_reviews)
+# in one transaction with explicit ids, then the id sequences are moved past
+# them. Every seeded user has an @LOADTEST_DOMAIN address, which is how --purge
+# finds the rows again.
+
+LOADTEST_DOMAIN = 'loadtest.example.com'
+# Accounts can't be logged into: this is not a valid bcrypt hash
+UNUSABLE_PASSWORD = '!synthetic'
+
+CITIES = [('Mumbai', 'Maharashtra', '400001'), ('Delhi', 'Delhi', '110001'), ('Bengaluru', 'Karnataka', '560001'),
+          ('Hyderabad', 'Telangana', '500001'), ('Chennai', 'Tamil Nadu', '600001'), ('Kolkata', 'West Bengal', '700001'),
+          ('Pune', 'Maharashtra', '411001'), ('Jaipur', 'Rajasthan', '302001'), ('Lucknow', 'Uttar Pradesh', '226001'),
+          ('Ahmedabad', 'Gujarat', '380001')]
+ORDER_STATUSES = ['delivered', 'shipped', 'confirmed', 'cancelled']
+ORDER_STATUS_WEIGHTS = [80, 8, 6, 6]
+LINES_PER_ORDER = [1, 2, 3]
+LINES_PER_ORDER_WEIGHTS = [60, 30, 10]
+PAYMENT_METHODS = [('razorpay', 'prepaid'), ('cod', 'cod')]
+PAYMENT_WEIGHTS = [70, 30]
+FREE_SHIPPING_FROM = 499
+SHIPPING_FEE = 49
+GST_RATE = 0.18
+DEFAULT_PRICE = 499.0
+
+USER_COLUMNS = ['id', 'name', 'email', 'password', 'phone', 'address', 'profile_photo', 'total_orders',
+                'member_since', 'is_verified', 'created_at', 'updated_at']
+ORDER_COLUMNS = ['id', 'order_number', 'customer_name', 'customer_email', 'shipping_address', 'items', 'subtotal',
+                 'shipping', 'tax', 'total', 'status', 'payment_method', 'payment_type', 'created_at', 'updated_at']
+REVIEW_COLUMNS = ['id', 'order_id', 'product_id', 'customer_email', 'customer_name', 'rating', 'title',
+                  'review_text', 'comment', 'images', 'is_approved', 'is_verified', 'is_featured', 'points_awarded',
+                  'status', 'created_at', 'updated_at']
+TABLES = [('users', USER_COLUMNS), ('orders', ORDER_COLUMNS), ('product_reviews', REVIEW_COLUMNS)]
+
+PURGE_SQL = [
+    # Without it every deleted order costs a scan of product_reviews for the
+    # ON DELETE SET NULL of order_id; schema.ts creates it on newer databases
+    "CREATE INDEX IF NOT EXISTS idx_product_reviews_order ON product_reviews(order_id)",
+    "DELETE FROM product_reviews WHERE customer_email LIKE %(pattern)s",
+    "DELETE FROM orders WHERE customer_email LIKE %(pattern)s",
+    "DELETE FROM users WHERE email LIKE %(pattern)s",
+]
+
+TOTAL_ORDERS_SQL = """
+    UPDATE users u SET total_orders = o.orders
+    FROM (SELECT customer_email, COUNT(*) AS orders FROM orders
+          WHERE customer_email LIKE %(pattern)s GROUP BY customer_email) o
+    WHERE u.email = o.customer_email
+"""
+
+
+def popularity(count, skew, hot=0, hot_share=0.0):
+    """Cumulative Zipf(skew) weights over `count` ranks; optionally the top `hot`
+    ranks are rescaled to take `hot_share` of all draws"""
+    weights = [1 / (rank ** skew) for rank in range(1, count + 1)]
+    hot = min(hot, count)
+    if hot and hot < count and hot_share:
+        hot_total, cold_total = sum(weights[:hot]), sum(weights[hot:])
+        weights = ([w * hot_share / hot_total for w in weights[:hot]] +
+                   [w * (1 - hot_share) / cold_total for w in weights[hot:]])
+    return list(itertools.accumulate(weights))
+
+
+def draw(items, cum_weights):
+    return items[bisect.bisect(cum_weights, random.random() * cum_weights[-1])]
+
+
+def iso(moment):
+    return moment.isoformat()
+
+
+class World:
+    """Generates rows for the three tables; ids continue after `start_ids`"""
+
+    def __init__(self, args, products, templates, start_ids, now, order_user_id=False):
+        self.args = args
+        self.now = now
+        self.order_user_id = order_user_id
+        self.templates = templates
+        self.comments = {}
+        self.next_order_id = start_ids['orders'] + 1
+        self.next_review_id = start_ids['product_reviews'] + 1
+
+        # Popularity ranks are assigned at random, so which products are hot
+        # depends on the seed rather than on table order
+        self.products = random.sample(products, len(products))
+        self.product_weights = popularity(len(self.products), args.product_skew, args.hot_products, args.hot_share)
+        self.users = [self.make_user(start_ids['users'] + n) for n in range(1, args.users + 1)]
+        self.user_weights = popularity(len(self.users), args.user_skew)
+        self.review_rows = []
+
+    def make_user(self, user_id):
+        name = random.choice(female_names if random.random() < 0.7 else male_names)
+        city, state, pincode = random.choice(CITIES)
+        member_since = self.now - timedelta(seconds=random.randrange(self.args.days * 86400))
+        handle = name.lower().replace('.', '').replace(' ', '.')
+        return {
+            'id': user_id,
+            'name': name,
+            'email': f"{handle}.{user_id}@{LOADTEST_DOMAIN}",
+            'phone': f"9{random.randrange(10 ** 9):09d}",
+            'address': {"street": f"{random.randint(1, 400)}, Sector {random.randint(1, 60)}",
+                        "city": city, "state": state, "zip": pincode, "country": "India"},
+            'profile_photo': f"/uploads/profile/loadtest-{user_id}.jpg" if random.random() < self.args.photo_rate else None,
+            'member_since': member_since,
+        }
+
+    def user_rows(self):
+        for user in self.users:
+            joined = iso(user['member_since'])
+            yield [user['id'], user['name'], user['email'], UNUSABLE_PASSWORD, user['phone'],
+                   json.dumps(user['address']), user['profile_photo'], 0, joined, True, joined, joined]
+
+    def review_text(self, slug):
+        """(rating, comment) drawn from the product's review templates"""
+        if slug not in self.comments:
+            self.comments[slug] = get_comments_for_product(self.templates[slug])
+        comments_short, comments_long = self.comments[slug]
+        return generate_review(comments_short, comments_long, lambda name, rating, date, comment: (rating, comment))
+
+    def add_review(self, user, product, order_id, reviewed_at):
+        product_id, slug, _, _ = product
+        rating, comment = self.review_text(slug)
+        featured = rating == 5 and random.random() < 0.02
+        status = 'approved' if random.random() >= self.args.pending_rate else 'pending'
+        self.review_rows.append([
+            self.next_review_id, order_id, product_id, user['email'], user['name'], rating, None, comment, comment,
+            '[]', True, order_id is not None, featured, 0, status, iso(reviewed_at), iso(reviewed_at)
+        ])
+        self.next_review_id += 1
+
+    def order_rows(self):
+        """Order rows, collecting the verified reviews of each delivered order on the way"""
+        for _ in range(self.args.orders):
+            order_id = self.next_order_id
+            self.next_order_id += 1
+            user = draw(self.users, self.user_weights)
+            since = max(0, int((self.now - user['member_since']).total_seconds()))
+            placed = self.now - timedelta(seconds=random.randrange(since + 1))
+            status = random.choices(ORDER_STATUSES, weights=ORDER_STATUS_WEIGHTS)[0]
+            method, payment_type = random.choices(PAYMENT_METHODS, weights=PAYMENT_WEIGHTS)[0]
+
+            lines = {}
+            for _ in range(random.choices(LINES_PER_ORDER, weights=LINES_PER_ORDER_WEIGHTS)[0]):
+                product = draw(self.products, self.product_weights)
+                lines.setdefault(product, 0)
+                lines[product] += random.choice((1, 1, 1, 2))
+            items = [{"product_id": product_id, "slug": slug, "title": title, "price": price, "quantity": quantity}
+                     for (product_id, slug, title, price), quantity in lines.items()]
+            subtotal = round(sum(item['price'] * item['quantity'] for item in items), 2)
+            shipping = 0 if subtotal >= FREE_SHIPPING_FROM else SHIPPING_FEE
+            # Catalog prices include GST
+            tax = round(subtotal - subtotal / (1 + GST_RATE), 2)
+
+            if status == 'delivered':
+                for product in lines:
+                    if random.random() < self.args.review_rate:
+                        reviewed = min(self.now, placed + timedelta(days=random.uniform(4, 30)))
+                        self.add_review(user, product, order_id, reviewed)
+
+            row = [order_id, f"LT-{placed:%d%m%y}{order_id:08d}", user['name'], user['email'],
+                   json.dumps(dict(user['address'], name=user['name'], phone=user['phone'])), json.dumps(items),
+                   subtotal, shipping, tax, round(subtotal + shipping, 2), status, method, payment_type,
+                   iso(placed), iso(placed)]
+            if self.order_user_id:
+                row.append(user['id'])
+            yield row
+
+    def unverified_reviews(self):
+        """Reviews not backed by an order, in proportion to the verified ones"""
+        verified = len(self.review_rows)
+        share = self.args.unverified_share
+        for _ in range(round(verified * share / (1 - share)) if share < 1 else 0):
+            user = draw(self.users, self.user_weights)
+            since = max(0, int((self.now - user['member_since']).total_seconds()))
+            reviewed = self.now - timedelta(seconds=random.randrange(since + 1))
+            self.add_review(user, draw(self.products, self.product_weights), None, reviewed)
+
+
+def load_templates(args):
+    products = to_products(cached_products(args.csv)) if args.csv else load_products(args.products)
+    return {product.slug: product for product in products}
+
+
+def has_column(cur, table, column):
+    cur.execute("SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = %s",
+                (table, column))
+    return cur.fetchone() is not None
+
+
+def copy_rows(cur, table, columns, rows):
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", CopyStream(rows), size=COPY_CHUNK_SIZE)
+
+
+def seed(conn, args, templates):
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    pattern = f"%@{LOADTEST_DOMAIN}"
+    with conn.cursor() as cur:
+        # Nothing else may take ids while they are assigned client-side
+        cur.execute("LOCK TABLE users, orders, product_reviews IN SHARE ROW EXCLUSIVE MODE")
+        start_ids = {}
+        for table, _ in TABLES:
+            cur.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            start_ids[table] = cur.fetchone()[0]
+
+        cur.execute("SELECT id, slug, title, price FROM products WHERE slug = ANY(%s) ORDER BY id", (list(templates),))
+        products = []
+        for product_id, slug, title, price in cur.fetchall():
+            try:
+                price = float(price)
+            except (TypeError, ValueError):
+                price = DEFAULT_PRICE
+            products.append((product_id, slug, title, price))
+        if not products:
+            raise SystemExit("❌ None of the catalog products are in the products table; run sync_products_to_db.py first")
+
+        order_user_id = has_column(cur, 'orders', 'user_id')
+        world = World(args, products, templates, start_ids, now, order_user_id)
+
+        timings = {}
+        started = time.perf_counter()
+        copy_rows(cur, 'users', USER_COLUMNS, world.user_rows())
+        timings['users'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        copy_rows(cur, 'orders', ORDER_COLUMNS + (['user_id'] if order_user_id else []), world.order_rows())
+        timings['orders'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        verified = len(world.review_rows)
+        world.unverified_reviews()
+        copy_rows(cur, 'product_reviews', REVIEW_COLUMNS, world.review_rows)
+        cur.execute(TOTAL_ORDERS_SQL, {"pattern": pattern})
+        timings['product_reviews'] = time.perf_counter() - started
+
+        for table, _ in TABLES:
+            cur.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))")
+
+    return {
+        "products": len(products),
+        "users": args.users,
+        "orders": args.orders,
+        "verified_reviews": verified,
+        "unverified_reviews": len(world.review_rows) - verified,
+        "timings": timings
+    }
+
+
+def purge(conn):
+    """Deleted (reviews, orders, users) counts"""
+    counts = []
+    with conn.cursor() as cur:
+        for sql in PURGE_SQL:
+            cur.execute(sql, {"pattern": f"%@{LOADTEST_DOMAIN}"})
+            counts.append(cur.rowcount)
+    return counts[1:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk-load consistent synthetic users, orders and reviews')
+    parser.add_argument('--products', default=PRODUCTS_PATH, help='catalog for the review templates')
+    parser.add_argument('--csv', help='take review templates from this catalog CSV (via the catalog cache) instead')
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--orders', type=int, default=20000)
+    parser.add_argument('--days', type=int, default=365, help='history length')
+    parser.add_argument('--user-skew', type=float, default=1.0, help='Zipf exponent of orders per user (0 = uniform)')
+    parser.add_argument('--product-skew', type=float, default=1.1, help='Zipf exponent of product popularity')
+    parser.add_argument('--hot-products', type=int, default=0, help='number of hot products')
+    parser.add_argument('--hot-share', type=float, default=0.0, help='share of order lines that go to hot products')
+    parser.add_argument('--review-rate', type=float, default=0.3, help='chance a delivered order line is reviewed')
+    parser.add_argument('--unverified-share', type=float, default=0.1, help='share of reviews without an order')
+    parser.add_argument('--pending-rate', type=float, default=0.05, help='share of reviews awaiting moderation')
+    parser.add_argument('--photo-rate', type=float, default=0.3, help='share of users with a profile photo')
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--dry-run', action='store_true', help='load, report, then roll back')
+    parser.add_argument('--purge', action='store_true', help=f'delete every row seeded for @{LOADTEST_DOMAIN} and exit')
+    args = parser.parse_args()
+
+    conn = connect()
+    try:
+        if args.purge:
+            reviews, orders, users = purge(conn)
+            conn.commit()
+            print(f"🧹 Removed {reviews} reviews, {orders} orders and {users} users for @{LOADTEST_DOMAIN}")
+            return
+
+        random.seed(args.seed)
+        started = time.perf_counter()
+        result = seed(conn, args, load_templates(args))
+        if args.dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print(f"\n📊 Synthetic world{' (dry run, rolled back)' if args.dry_run else ''} over {result['products']} products:")
+    print(f"   👤 Users: {result['users']} ({result['timings']['users']:.2f}s)")
+    print(f"   📦 Orders: {result['orders']} ({result['timings']['orders']:.2f}s)")
+    print(f"   ⭐ Reviews: {result['verified_reviews']} verified, {result['unverified_reviews']} unverified "
+          f"({result['timings']['product_reviews']:.2f}s)")
+    print(f"   ⏱️  {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+import argparse
+import json
+import time
+
+from catalog_cache import cached_rows
+from catalog_delta import row_key
+from db_utils import connect
+from extract_products_from_csv import CSV_PATH
+
+# Bulk upsert of the catalog CSV into the backend `products` table.
+# The whole catalog is streamed into a temp table with COPY and merged with a
+# single INSERT ... ON CONFLICT (slug) DO UPDATE in one transaction, instead of
+# a SELECT + INSERT/UPDATE round trip per product.
+#
+#   python sync_products_to_db.py
+#   python sync_products_to_db.py --delta catalog_delta.json   # only added/changed SKUs
+#   python sync_products_to_db.py --dry-run                    # report, then roll back
+#
+# Column mapping matches backend/import-csv-products.js.
+
+COLUMNS = ['slug', 'title', 'category', 'price', 'list_image', 'description', 'details',
+           'brand', 'key_ingredients', 'skin_type']
+
+# CSV column -> key inside products.details
+DETAIL_KEYS = {
+    'Product Name': 'productName', 'Brand Name': 'brand', 'SKU': 'sku', 'HSN Code': 'hsn',
+    'Product Title': 'productTitle', 'Subtitle / Tagline': 'subtitle', 'Product Category': 'category',
+    'Product Sub-Category': 'subCategory', 'Product Type': 'productType', 'Skin/Hair Type': 'skinHairType',
+    'Net Quantity (Content)': 'netQuantity', 'Unit Count (Pack of)': 'unitCount',
+    'Package Content Details': 'packageContent', 'Inner Packaging Type': 'innerPackaging',
+    'Outer Packaging Type': 'outerPackaging', 'Net Weight (Product Only)': 'netWeight',
+    'Dead Weight (Packaging Only)': 'deadWeight', 'discount': 'discount', 'MRP': 'mrp',
+    'WEBSITE price': 'websitePrice', 'GST %': 'gst', 'Country of Origin': 'countryOfOrigin',
+    'Manufacturer / Packer / Importer': 'manufacturer', 'Key Ingredients': 'keyIngredients',
+    'Ingredient Benefits': 'ingredientBenefits', 'How to Use (Steps)': 'howToUse',
+    'Product Description (Long)': 'longDescription', 'Bullet Highlights (Short Desc.)': 'bulletHighlights',
+    'Image Links': 'imageLinks', 'Video Links': 'videoLinks',
+    'Platform Category Mapping': 'platformCategoryMapping', 'Hazardous / Fragile (Y/N)': 'hazardous',
+    'Special Attributes (Badges)': 'badges'
+}
+
+COPY_CHUNK_SIZE = 1 << 20
+
+STAGING_DDL = """
+    CREATE TEMP TABLE products_sync (
+      ord integer,
+      slug text, title text, category text, price text, list_image text, description text,
+      details jsonb, brand text, key_ingredients text, skin_type text
+    ) ON COMMIT DROP
+"""
+
+# Images uploaded through the admin panel are kept when the CSV has none, and
+# details are merged so keys added outside the CSV survive. Rows whose merged
+# values are identical are left alone and counted as unchanged.
+MERGE_SQL = """
+    WITH staged AS (
+      SELECT DISTINCT ON (slug) slug, title, category, price, list_image, description, details,
+             brand, key_ingredients, skin_type
+      FROM products_sync
+      ORDER BY slug, ord DESC
+    ), upserted AS (
+      INSERT INTO products AS p (slug, title, category, price, list_image, description, details,
+                                 brand, key_ingredients, skin_type)
+      SELECT * FROM staged
+      ON CONFLICT (slug) DO UPDATE SET
+        title = EXCLUDED.title,
+        category = EXCLUDED.category,
+        price = EXCLUDED.price,
+        list_image = COALESCE(NULLIF(EXCLUDED.list_image, ''), p.list_image),
+        description = EXCLUDED.description,
+        details = COALESCE(p.details, '{}'::jsonb) || EXCLUDED.details,
+        brand = EXCLUDED.brand,
+        key_ingredients = EXCLUDED.key_ingredients,
+        skin_type = EXCLUDED.skin_type,
+        updated_at = now()
+      WHERE (p.title, p.category, p.price, p.list_image, p.description, p.details,
+             p.brand, p.key_ingredients, p.skin_type)
+        IS DISTINCT FROM
+            (EXCLUDED.title, EXCLUDED.category, EXCLUDED.price,
+             COALESCE(NULLIF(EXCLUDED.list_image, ''), p.list_image), EXCLUDED.description,
+             COALESCE(p.details, '{}'::jsonb) || EXCLUDED.details,
+             EXCLUDED.brand, EXCLUDED.key_ingredients, EXCLUDED.skin_type)
+      RETURNING (xmax = 0) AS inserted
+    )
+    SELECT (SELECT COUNT(*) FROM staged),
+           COUNT(*) FILTER (WHERE inserted),
+           COUNT(*) FILTER (WHERE NOT inserted)
+    FROM upserted
+"""
+
+
+def product_row(row):
+    """Map a catalog row to products table values, or None when it can't be keyed"""
+    name = row.get('Product Name', '')
+    slug = row.get('Slug', '')
+    if not name or not slug:
+        return None
+
+    details = {key: row.get(column, '') for column, key in DETAIL_KEYS.items()}
+    details['slug'] = slug
+    image_links = row.get('Image Links', '')
+    return [
+        slug,
+        name,
+        row.get('Product Category', ''),
+        row.get('WEBSITE price', '') or '0',
+        image_links.split(',')[0].strip() if image_links else '',
+        details['longDescription'],
+        json.dumps(details, ensure_ascii=False),
+        row.get('Brand Name', '') or 'NEFOL',
+        details['keyIngredients'],
+        details['skinHairType']
+    ]
+
+
+def copy_value(value):
+    # COPY text format: backslash escapes instead of CSV quoting, which is
+    # several times cheaper to produce for the long description fields
+    if value is None:
+        return '\\N'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+class CopyStream:
+    """File-like object that renders rows as COPY text lazily, so COPY runs in constant memory"""
+
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.pending = ''
+
+    def read(self, size=-1):
+        parts = [self.pending]
+        length = len(self.pending)
+        while size < 0 or length < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            line = '\t'.join(map(copy_value, row)) + '\n'
+            parts.append(line)
+            length += len(line)
+        data = ''.join(parts)
+        if size < 0:
+            size = len(data)
+        self.pending = data[size:]
+        return data[:size]
+
+
+def delta_keys(path):
+    """SKU/slug keys that were added or changed according to catalog_delta.py"""
+    with open(path, 'r', encoding='utf-8') as f:
+        delta = json.load(f)
+    return {entry['key'] for entry in delta['added']} | {entry['key'] for entry in delta['changed']}
+
+
+def sync(conn, rows, dry_run=False):
+    staged = (
+        [ord_] + values
+        for ord_, values in enumerate(filter(None, (product_row(row) for row in rows)))
+    )
+    with conn.cursor() as cur:
+        cur.execute(STAGING_DDL)
+        cur.copy_expert(
+            f"COPY products_sync (ord, {', '.join(COLUMNS)}) FROM STDIN",
+            CopyStream(staged),
+            size=COPY_CHUNK_SIZE
+        )
+        cur.execute(MERGE_SQL)
+        total, inserted, updated = cur.fetchone()
+
+    if dry_run:
+        conn.rollback()
+    else:
+        conn.commit()
+    return {"staged": total, "inserted": inserted, "updated": updated, "unchanged": total - inserted - updated}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Upsert the catalog CSV into the products table')
+    parser.add_argument('--csv', default=CSV_PATH)
+    parser.add_argument('--delta', help='only sync rows added/changed in this catalog_delta.py output')
+    parser.add_argument('--dry-run', action='store_true', help='run the merge, report, then roll back')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    rows = cached_rows(args.csv)
+    if args.delta:
+        keys = delta_keys(args.delta)
+        rows = [row for row in rows if row_key(row) in keys]
+    print(f"📦 {len(rows)} catalog rows to sync from {args.csv}")
+
+    conn = connect()
+    try:
+        result = sync(conn, rows, args.dry_run)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"\n📊 Sync Summary{' (dry run, rolled back)' if args.dry_run else ''}:")
+    print(f"   ✅ Inserted: {result['inserted']}")
+    print(f"   🔄 Updated: {result['updated']}")
+    print(f"   ⏭️  Unchanged: {result['unchanged']}")
+    print(f"   ⏱️  {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
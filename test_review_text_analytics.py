@@ -0,0 +1,24 @@
+from review_text_analytics import analyse, review_body
+
+VOCABULARY = {('blue', 'tea'): 'Blue Tea'}
+TEXT = "Blue Tea serum is really good, breakouts kam ho gaye aur glow bhi aaya"
+
+
+def test_identical_columns_are_analysed_once():
+    # The backend writes the same text to review_text and comment
+    body = review_body(TEXT, TEXT)
+    assert body == TEXT
+    assert analyse(body, VOCABULARY, 2) == analyse(TEXT, VOCABULARY, 2)
+
+
+def test_comment_is_the_fallback():
+    assert review_body(None, TEXT) == TEXT
+    assert review_body('', TEXT) == TEXT
+    assert review_body(None, None) == ''
+
+
+def test_duplicated_text_would_skew_polarity():
+    # "kam" at the start of a second copy flips the end of the first one
+    text = "kam irritation, skin feels soft and smooth"
+    assert analyse(review_body(text, text), VOCABULARY, 2)[0] == 0.333
+    assert analyse(f"{text} {text}", VOCABULARY, 2)[0] != 0.333
@@ -0,0 +1,127 @@
+// Multi-facet filtering over the static bitset index written by
+// extract_products_from_csv.py (see facet_index.py for the format and the
+// reference queries). Each facet value is a bitset over product ordinals:
+// values within a facet are ORed, facets are ANDed, and counts are popcounts,
+// so every filter change is a handful of word-wise operations.
+
+export interface FacetValue {
+  value: string
+  label: string
+  count: number
+  bits: string
+}
+
+export interface Facet {
+  label: string
+  values: FacetValue[]
+}
+
+export interface FacetIndex {
+  schema_version: number
+  size: number
+  slugs: string[]
+  facets: Record<string, Facet>
+}
+
+// facet -> selected values
+export type FacetSelections = Record<string, string[]>
+
+export interface DecodedFacets {
+  index: FacetIndex
+  words: number
+  bitsets: Record<string, Record<string, Uint32Array>>
+}
+
+const FACET_INDEX_URL = '/data/facet-index.json'
+
+let facetsPromise: Promise<DecodedFacets> | null = null
+
+export function loadFacetIndex(): Promise<DecodedFacets> {
+  if (!facetsPromise) {
+    facetsPromise = fetch(FACET_INDEX_URL)
+      .then(res => {
+        if (!res.ok) throw new Error(`Failed to load facet index: ${res.status}`)
+        return res.json()
+      })
+      .then(decodeFacetIndex)
+      .catch(err => {
+        facetsPromise = null
+        throw err
+      })
+  }
+  return facetsPromise
+}
+
+function decodeBits(encoded: string, words: number): Uint32Array {
+  const bytes = atob(encoded)
+  const bits = new Uint32Array(words)
+  for (let i = 0; i < bytes.length; i++) {
+    bits[i >> 2] |= bytes.charCodeAt(i) << ((i & 3) * 8)
+  }
+  return bits
+}
+
+export function decodeFacetIndex(index: FacetIndex): DecodedFacets {
+  const words = Math.ceil(index.size / 32)
+  const bitsets: DecodedFacets['bitsets'] = {}
+  for (const [facet, data] of Object.entries(index.facets)) {
+    bitsets[facet] = {}
+    for (const value of data.values) bitsets[facet][value.value] = decodeBits(value.bits, words)
+  }
+  return { index, words, bitsets }
+}
+
+function popcount(word: number): number {
+  word -= (word >>> 1) & 0x55555555
+  word = (word & 0x33333333) + ((word >>> 2) & 0x33333333)
+  return (((word + (word >>> 4)) & 0x0f0f0f0f) * 0x01010101) >>> 24
+}
+
+// Products matching every selected facet except `skip`
+function selectionBits(decoded: DecodedFacets, selections: FacetSelections, skip?: string): Uint32Array {
+  const { index, words, bitsets } = decoded
+  const matched = new Uint32Array(words).fill(0xffffffff)
+  if (index.size % 32) matched[words - 1] = (1 << (index.size % 32)) - 1
+
+  for (const [facet, values] of Object.entries(selections)) {
+    if (facet === skip || !values.length) continue
+    const union = new Uint32Array(words)
+    for (const value of values) {
+      const bits = bitsets[facet]?.[value]
+      if (!bits) continue
+      for (let w = 0; w < words; w++) union[w] |= bits[w]
+    }
+    for (let w = 0; w < words; w++) matched[w] &= union[w]
+  }
+  return matched
+}
+
+export function filterProducts(decoded: DecodedFacets, selections: FacetSelections): string[] {
+  const matched = selectionBits(decoded, selections)
+  const slugs: string[] = []
+  for (let w = 0; w < decoded.words; w++) {
+    let word = matched[w]
+    while (word) {
+      const low = word & -word
+      slugs.push(decoded.index.slugs[w * 32 + 31 - Math.clz32(low)])
+      word ^= low
+    }
+  }
+  return slugs
+}
+
+// Counts under the current selections; each facet ignores its own selection
+// so the other values of a facet stay selectable
+export function facetCounts(decoded: DecodedFacets, selections: FacetSelections): Record<string, Record<string, number>> {
+  const counts: Record<string, Record<string, number>> = {}
+  for (const [facet, values] of Object.entries(decoded.bitsets)) {
+    const others = selectionBits(decoded, selections, facet)
+    counts[facet] = {}
+    for (const [value, bits] of Object.entries(values)) {
+      let count = 0
+      for (let w = 0; w < decoded.words; w++) count += popcount(bits[w] & others[w])
+      counts[facet][value] = count
+    }
+  }
+  return counts
+}
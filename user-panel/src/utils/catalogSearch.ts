@@ -0,0 +1,120 @@
+// Client-side catalog search over the static index written by
+// extract_products_from_csv.py (see catalog_search.py for the reference scorer).
+// The index is fetched once; every keystroke is then scored locally.
+
+export interface SearchDoc {
+  slug: string
+  name: string
+}
+
+export interface SearchResult extends SearchDoc {
+  score: number
+}
+
+interface TrieNode {
+  [edge: string]: TrieNode | number[]
+}
+
+export interface CatalogSearchIndex {
+  schema_version: number
+  min_similarity: number
+  prefix_bonus: number
+  max_weight: number
+  docs: SearchDoc[]
+  grams: Record<string, [number, number][]>
+  trie: TrieNode
+}
+
+const SEARCH_INDEX_URL = '/data/search-index.json'
+// Trie key holding the products of the word that ends at a node
+const TERM_END = ''
+
+let indexPromise: Promise<CatalogSearchIndex> | null = null
+
+export function loadSearchIndex(): Promise<CatalogSearchIndex> {
+  if (!indexPromise) {
+    indexPromise = fetch(SEARCH_INDEX_URL)
+      .then(res => {
+        if (!res.ok) throw new Error(`Failed to load search index: ${res.status}`)
+        return res.json()
+      })
+      .catch(err => {
+        indexPromise = null
+        throw err
+      })
+  }
+  return indexPromise
+}
+
+export function normalize(text: string): string {
+  return (text || '')
+    .normalize('NFKD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .toLowerCase()
+    .replace(/[^a-z0-9]+/g, ' ')
+    .trim()
+}
+
+function trigrams(text: string): Set<string> {
+  const grams = new Set<string>()
+  for (const word of text.split(' ')) {
+    if (!word) continue
+    const padded = ` ${word} `
+    for (let i = 0; i < padded.length - 2; i++) grams.add(padded.slice(i, i + 3))
+  }
+  return grams
+}
+
+function prefixDocs(trie: TrieNode, prefix: string): Set<number> {
+  let node: TrieNode = trie
+  while (prefix) {
+    const edge = Object.keys(node).find(e => e !== TERM_END && (e.startsWith(prefix) || prefix.startsWith(e)))
+    if (edge === undefined) return new Set()
+    node = node[edge] as TrieNode
+    prefix = prefix.startsWith(edge) ? prefix.slice(edge.length) : ''
+  }
+  const found = new Set<number>()
+  const stack: TrieNode[] = [node]
+  while (stack.length) {
+    const current = stack.pop() as TrieNode
+    for (const [edge, child] of Object.entries(current)) {
+      if (edge === TERM_END) (child as number[]).forEach(id => found.add(id))
+      else stack.push(child as TrieNode)
+    }
+  }
+  return found
+}
+
+export function searchCatalog(index: CatalogSearchIndex, query: string, limit = 10): SearchResult[] {
+  const text = normalize(query)
+  const grams = trigrams(text)
+  if (grams.size === 0) return []
+
+  const raw = new Map<number, number>()
+  grams.forEach(gram => {
+    for (const [docId, weight] of index.grams[gram] || []) {
+      raw.set(docId, (raw.get(docId) || 0) + weight / index.max_weight)
+    }
+  })
+
+  const scores = new Map<number, number>()
+  raw.forEach((score, docId) => {
+    const similarity = score / grams.size
+    if (similarity >= index.min_similarity) scores.set(docId, similarity)
+  })
+
+  // The last word is usually still being typed; complete it from the trie
+  const words = text.split(' ')
+  prefixDocs(index.trie, words[words.length - 1]).forEach(docId => {
+    scores.set(docId, (scores.get(docId) || 0) + index.prefix_bonus)
+  })
+
+  return Array.from(scores.entries())
+    .sort((a, b) =>
+      b[1] - a[1] ||
+      index.docs[a[0]].name.length - index.docs[b[0]].name.length ||
+      a[0] - b[0]
+    )
+    .slice(0, limit)
+    .map(([docId, score]) => ({ ...index.docs[docId], score: Math.round(score * 1000) / 1000 }))
+}
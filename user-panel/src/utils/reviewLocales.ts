@@ -0,0 +1,75 @@
+// Per-locale static reviews written by review_locales.write_locale_shards():
+// an index.json with the fallback chains plus one {slug: [review]} shard per
+// locale that has reviews. Only the shards on the active locale's chain are
+// fetched, and each at most once, instead of every script's text at once.
+
+export interface LocaleReview {
+  name: string
+  rating: number
+  date: string
+  comment: string
+}
+
+export type LocaleShard = Record<string, LocaleReview[]>
+
+export interface LocaleIndex {
+  default: string
+  fallback: Record<string, string[]>
+  locales: Record<string, { file: string; reviews: number; bytes: number }>
+}
+
+// One directory per corpus, see review_locales.py
+export const REVIEW_SHARDS_URL = '/data/reviews'
+export const CATALOG_REVIEW_SHARDS_URL = '/data/catalog-reviews'
+
+const indexPromises = new Map<string, Promise<LocaleIndex>>()
+const shardPromises = new Map<string, Promise<LocaleShard>>()
+
+function fetchJson<T>(cache: Map<string, Promise<T>>, url: string, what: string): Promise<T> {
+  let promise = cache.get(url)
+  if (!promise) {
+    promise = fetch(url)
+      .then(res => {
+        if (!res.ok) throw new Error(`Failed to load ${what}: ${res.status}`)
+        return res.json()
+      })
+      .catch(err => {
+        cache.delete(url)
+        throw err
+      })
+    cache.set(url, promise)
+  }
+  return promise
+}
+
+export function loadLocaleIndex(baseUrl: string = REVIEW_SHARDS_URL): Promise<LocaleIndex> {
+  return fetchJson(indexPromises, `${baseUrl}/index.json`, 'review locale index')
+}
+
+export function loadLocaleShard(locale: string, baseUrl: string = REVIEW_SHARDS_URL): Promise<LocaleShard> {
+  return loadLocaleIndex(baseUrl).then(index => {
+    const entry = index.locales[locale]
+    if (!entry) return {}
+    return fetchJson(shardPromises, `${baseUrl}/${entry.file}`, `${locale} reviews`)
+  })
+}
+
+// Reviews for `slug`, walking the locale's fallback chain until `minReviews`
+// are collected; locales the corpus has no shard for are skipped
+export async function getLocaleReviews(
+  slug: string,
+  locale: string,
+  minReviews = 1,
+  baseUrl: string = REVIEW_SHARDS_URL
+): Promise<LocaleReview[]> {
+  const index = await loadLocaleIndex(baseUrl)
+  const chain = index.fallback[locale] || index.fallback[index.default] || [index.default]
+  const reviews: LocaleReview[] = []
+  for (const shardLocale of chain) {
+    if (reviews.length >= minReviews) break
+    if (!index.locales[shardLocale]) continue
+    const shard = await loadLocaleShard(shardLocale, baseUrl)
+    reviews.push(...(shard[slug] || []))
+  }
+  return reviews
+}